@@ -100,7 +100,7 @@ async def demo_idle_cognition():
     all_activities = []
     
     for cycle in range(5):
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         all_activities.extend(activities)
         
         if activities:
@@ -148,7 +148,7 @@ async def demo_100_cycles_no_input():
         inputs = queue.get_pending_inputs()
         
         # Generate idle activities
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         total_percepts += len(activities)
         
         # Add to workspace
@@ -183,21 +183,21 @@ async def demo_mixed_input():
     print("\n   Cycles 1-5: No input (idle cognition)")
     for i in range(5):
         inputs = queue.get_pending_inputs()
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         print(f"      Cycle {i+1}: {len(inputs)} inputs, {len(activities)} idle activities")
     
     # Cycle 6: Add input
     print("\n   Cycle 6: Human input arrives")
     await queue.add_input("Hello Sanctuary!", source="human")
     inputs = queue.get_pending_inputs()
-    activities = await idle.generate_idle_activity(workspace)
+    activities = idle.generate_idle_activity(workspace)
     print(f"      Cycle 6: {len(inputs)} inputs, {len(activities)} idle activities")
     
     # Cycle 7-10: No input again
     print("\n   Cycles 7-10: No input (idle cognition resumes)")
     for i in range(4):
         inputs = queue.get_pending_inputs()
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         print(f"      Cycle {i+7}: {len(inputs)} inputs, {len(activities)} idle activities")
     
     print("\n✅ System handled mixed input patterns seamlessly")
@@ -220,7 +220,7 @@ async def demo_input_as_percepts():
     await queue.add_input("User message", source="human", modality="text")
     
     # Generate idle activity
-    activities = await idle.generate_idle_activity(workspace)
+    activities = idle.generate_idle_activity(workspace)
     
     # Both become percepts in workspace
     inputs = queue.get_pending_inputs()
@@ -36,7 +36,9 @@ async def demo():
         }
     })
     
-    # Verify LanguageOutputGenerator is initialized
+    # Verify LanguageOutputGenerator is initialized; identity files are
+    # otherwise read lazily on the first generation
+    await core.language_output._ensure_identity_loaded()
     logger.info(f"   ✓ LanguageOutputGenerator initialized")
     logger.info(f"   ✓ Charter loaded: {len(core.language_output.charter_text)} chars")
     logger.info(f"   ✓ Protocols loaded: {len(core.language_output.protocols_text)} chars")
@@ -5,19 +5,37 @@ Pure Global Workspace Theory (GWT) implementation with LLMs at periphery only.
 No specialist routing or classification.
 """
 
-from .client import SanctuaryAPI, Sanctuary
-from .cognitive_core import (
-    CognitiveCore,
-    ConversationManager,
-    ConversationTurn,
-)
+import importlib
 
 __version__ = "0.1.0"
 
-__all__ = [
+__all__ = (
     "SanctuaryAPI",
     "Sanctuary",
     "CognitiveCore",
     "ConversationManager",
     "ConversationTurn",
-]
\ No newline at end of file
+)
+
+# Resolved lazily (PEP 562) so importing a single submodule does not load the
+# whole client and cognitive core.
+_NAME_TO_MODULE = {
+    "SanctuaryAPI": ".client",
+    "Sanctuary": ".client",
+    "CognitiveCore": ".cognitive_core",
+    "ConversationManager": ".cognitive_core",
+    "ConversationTurn": ".cognitive_core",
+}
+
+
+def __getattr__(name: str):
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -21,6 +21,15 @@ import signal
 import sys
 import traceback
 from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
 
 # ---------------------------------------------------------------------------
 # Import resolution — development fallback when not pip-installed.
@@ -36,6 +45,10 @@ logger = logging.getLogger(__name__)
 # Maximum seconds to wait for a graceful shutdown before force-quitting.
 SHUTDOWN_TIMEOUT = 30.0
 
+# Semantic response cache defaults (only used with --semantic-cache)
+SEMANTIC_CACHE_SIZE = 128
+SEMANTIC_CACHE_THRESHOLD = 0.85
+
 
 # ---------------------------------------------------------------------------
 # Argument parsing
@@ -88,6 +101,15 @@ Interactive commands (inside the REPL):
         "--shutdown-timeout", type=float, default=SHUTDOWN_TIMEOUT,
         help=f"Max seconds to wait for graceful shutdown (default: {SHUTDOWN_TIMEOUT})",
     )
+    parser.add_argument(
+        "--semantic-cache", action="store_true",
+        help="Reuse the previous reply for near-duplicate messages instead of "
+             "running a new cognitive turn (off by default)",
+    )
+    parser.add_argument(
+        "--semantic-cache-threshold", type=float, default=SEMANTIC_CACHE_THRESHOLD,
+        help=f"Cosine similarity needed for a cache hit (default: {SEMANTIC_CACHE_THRESHOLD})",
+    )
     return parser.parse_args(argv)
 
 
@@ -130,6 +152,35 @@ def _format_error(exc: Exception, verbose: bool = False) -> str:
 # REPL command handlers (extracted for testability)
 # ---------------------------------------------------------------------------
 
+async def _handle_help(sanctuary: SanctuaryAPI) -> None:
+    """Print in-REPL help."""
+    print("\n📖 Available Commands:")
+    print("   quit, exit          - Exit the CLI")
+    print("   help, ?             - Show this help message")
+    print("   reset               - Clear conversation history")
+    print("   history             - Show recent conversation")
+    print("   metrics             - Show system metrics")
+    print("   health              - Show subsystem health report")
+    print("   save [label]        - Save current state (optional label)")
+    print("   checkpoints         - List all available checkpoints")
+    print("   load <id>           - Load a specific checkpoint by ID")
+    print("   restore latest      - Restore from most recent checkpoint")
+    print("\n🧹 Memory Management:")
+    print("   memory stats        - Show memory health statistics")
+    print("   memory gc           - Manually trigger garbage collection")
+    print("   memory gc --threshold <value>  - Run GC with custom threshold")
+    print("   memory gc --dry-run - Preview what would be removed")
+    print("   memory autogc on    - Enable automatic GC")
+    print("   memory autogc off   - Disable automatic GC")
+    print("\n   Any other text will be sent to Sanctuary for conversation.\n")
+
+
+async def _handle_reset(sanctuary: SanctuaryAPI) -> None:
+    """Clear conversation history."""
+    sanctuary.reset_conversation()
+    print("🔄 Conversation reset.\n")
+
+
 async def _handle_health(sanctuary: SanctuaryAPI) -> None:
     """Print subsystem health report."""
     report = sanctuary.core.get_health_report()
@@ -152,19 +203,22 @@ async def _handle_metrics(sanctuary: SanctuaryAPI) -> None:
     metrics = sanctuary.get_metrics()
     conv = metrics.get("conversation", {})
     cog = metrics.get("cognitive_core", {})
-    print("\n📊 Conversation Metrics:")
-    print(f"   Total turns: {conv.get('total_turns', 0)}")
-    print(f"   Average response time: {conv.get('avg_response_time', 0):.2f}s")
-    print(f"   Timeouts: {conv.get('timeouts', 0)}")
-    print(f"   Errors: {conv.get('errors', 0)}")
-    print(f"   Topics tracked: {conv.get('topics_tracked', 0)}")
-    print(f"   History size: {conv.get('history_size', 0)}")
-    print(f"\n🧠 Cognitive Core Metrics:")
-    print(f"   Total cycles: {cog.get('total_cycles', 0)}")
-    print(f"   Average cycle time: {cog.get('avg_cycle_time_ms', 0):.2f}ms")
-    print(f"   Workspace size: {cog.get('workspace_size', 0)}")
-    print(f"   Current goals: {cog.get('current_goals', 0)}")
-    print()
+    # Build the report up front so it is written with a single print call
+    print("\n".join([
+        "\n📊 Conversation Metrics:",
+        f"   Total turns: {conv.get('total_turns', 0)}",
+        f"   Average response time: {conv.get('avg_response_time', 0):.2f}s",
+        f"   Timeouts: {conv.get('timeouts', 0)}",
+        f"   Errors: {conv.get('errors', 0)}",
+        f"   Topics tracked: {conv.get('topics_tracked', 0)}",
+        f"   History size: {conv.get('history_size', 0)}",
+        "\n🧠 Cognitive Core Metrics:",
+        f"   Total cycles: {cog.get('total_cycles', 0)}",
+        f"   Average cycle time: {cog.get('avg_cycle_time_ms', 0):.2f}ms",
+        f"   Workspace size: {cog.get('workspace_size', 0)}",
+        f"   Current goals: {cog.get('current_goals', 0)}",
+        "",
+    ]))
 
 
 async def _handle_history(sanctuary: SanctuaryAPI) -> None:
@@ -173,19 +227,20 @@ async def _handle_history(sanctuary: SanctuaryAPI) -> None:
     if not history:
         print("No conversation history yet.\n")
         return
-    print("\n📜 Recent conversation:")
+    lines = ["\n📜 Recent conversation:"]
     for i, turn in enumerate(history, 1):
-        print(f"\n{i}. You: {turn.user_input}")
-        print(f"   Sanctuary: {turn.system_response}")
-        print(f"   (Response time: {turn.response_time:.2f}s)")
-    print()
+        lines.append(f"\n{i}. You: {turn.user_input}")
+        lines.append(f"   Sanctuary: {turn.system_response}")
+        lines.append(f"   (Response time: {turn.response_time:.2f}s)")
+    lines.append("")
+    print("\n".join(lines))
 
 
 async def _handle_save(sanctuary: SanctuaryAPI, user_input: str) -> None:
     """Save checkpoint with optional label."""
     parts = user_input.split(maxsplit=1)
     label = parts[1] if len(parts) > 1 else None
-    path = sanctuary.core.save_state(label)
+    path = await sanctuary.core.save_state_async(label)
     if path:
         print(f"💾 State saved: {path.name}\n")
     else:
@@ -207,13 +262,25 @@ async def _handle_checkpoints(sanctuary: SanctuaryAPI) -> None:
         auto = " [auto]" if cp.metadata.get("auto_save") else ""
         shutdown = " [shutdown]" if cp.metadata.get("shutdown") else ""
         size_kb = cp.size_bytes / 1024
-        print(f"\n{i}. {cp.timestamp.strftime('%Y-%m-%d %H:%M:%S')}{auto}{shutdown}")
+        print(f"\n{i}. {cp.timestamp_str}{auto}{shutdown}")
         print(f"   ID: {cp.checkpoint_id[:16]}...")
         print(f"   Label: {label}")
         print(f"   Size: {size_kb:.1f} KB")
     print()
 
 
+async def _restart_with_checkpoint(sanctuary: SanctuaryAPI, checkpoint_path: Path) -> bool:
+    """Stop Sanctuary and restore a checkpoint; the caller restarts it.
+
+    Reading and deserializing the checkpoint runs in a worker thread so the
+    event loop stays responsive while a large state file is loaded.
+    """
+    print("⚠️  Loading checkpoint requires restarting Sanctuary...")
+    print("💾 Stopping Sanctuary...")
+    await sanctuary.stop()
+    return await asyncio.to_thread(sanctuary.core.restore_state, checkpoint_path)
+
+
 async def _handle_load(sanctuary: SanctuaryAPI, user_input: str) -> None:
     """Load a checkpoint by ID prefix."""
     if not sanctuary.core.checkpoint_manager:
@@ -224,8 +291,7 @@ async def _handle_load(sanctuary: SanctuaryAPI, user_input: str) -> None:
         print("❌ Usage: load <checkpoint_id>\n")
         return
     checkpoint_id = parts[1]
-    checkpoints = sanctuary.core.checkpoint_manager.list_checkpoints()
-    matching = [cp for cp in checkpoints if cp.checkpoint_id.startswith(checkpoint_id)]
+    matching = sanctuary.core.checkpoint_manager.find_checkpoints_by_prefix(checkpoint_id)
     if not matching:
         print(f"❌ Checkpoint not found: {checkpoint_id}\n")
         return
@@ -233,12 +299,9 @@ async def _handle_load(sanctuary: SanctuaryAPI, user_input: str) -> None:
         print(f"❌ Ambiguous checkpoint ID (matches {len(matching)} checkpoints)\n")
         return
     checkpoint = matching[0]
-    print("⚠️  Loading checkpoint requires restarting Sanctuary...")
-    print("💾 Stopping Sanctuary...")
-    await sanctuary.stop()
-    success = sanctuary.core.restore_state(checkpoint.path)
+    success = await _restart_with_checkpoint(sanctuary, checkpoint.path)
     if success:
-        print(f"✅ State restored from {checkpoint.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"✅ State restored from {checkpoint.timestamp_str}")
     else:
         print("❌ Failed to restore state")
     print("🧠 Restarting Sanctuary...")
@@ -255,10 +318,7 @@ async def _handle_restore_latest(sanctuary: SanctuaryAPI) -> None:
     if not latest:
         print("❌ No checkpoints found\n")
         return
-    print("⚠️  Loading checkpoint requires restarting Sanctuary...")
-    print("💾 Stopping Sanctuary...")
-    await sanctuary.stop()
-    success = sanctuary.core.restore_state(latest)
+    success = await _restart_with_checkpoint(sanctuary, latest)
     if success:
         print("✅ State restored from latest checkpoint")
     else:
@@ -341,6 +401,115 @@ async def _handle_memory(sanctuary: SanctuaryAPI, user_input: str) -> None:
         print(f"❌ Unknown memory command: {command}\n")
 
 
+# REPL commands that end the session
+_QUIT_COMMANDS = frozenset({"quit", "exit"})
+
+# Exact-match REPL commands: handler(sanctuary)
+_COMMANDS = {
+    "help": _handle_help,
+    "?": _handle_help,
+    "reset": _handle_reset,
+    "history": _handle_history,
+    "metrics": _handle_metrics,
+    "health": _handle_health,
+    "checkpoints": _handle_checkpoints,
+    "restore latest": _handle_restore_latest,
+}
+
+# Prefix REPL commands, tried in order: handler(sanctuary, user_input)
+_PREFIX_COMMANDS = (
+    ("save", _handle_save),
+    ("load", _handle_load),
+    ("memory", _handle_memory),
+)
+
+
+# ---------------------------------------------------------------------------
+# Semantic response cache
+# ---------------------------------------------------------------------------
+
+class _SemanticCache:
+    """Small in-memory cache of recent turns keyed by message embedding.
+
+    A message whose embedding has cosine similarity >= ``threshold`` with a
+    cached message reuses that turn instead of running a new cognitive turn.
+    Entries are evicted oldest-first once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[str], Sequence[float]],
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_SIZE,
+    ):
+        self.encode = encode
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embeddings: List[np.ndarray] = []
+        self._turns: List[object] = []
+        self._matrix: Optional[np.ndarray] = None  # Stacked embeddings, built lazily
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(self.encode(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, text: str) -> tuple:
+        """Return ``(cached_turn_or_None, embedding)`` for ``text``."""
+        embedding = self._embed(text)
+        if not self._turns:
+            return None, embedding
+        if self._matrix is None:
+            self._matrix = np.stack(self._embeddings)
+        similarities = self._matrix @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self._turns[best], embedding
+        return None, embedding
+
+    def add(self, embedding: np.ndarray, turn: object) -> None:
+        if len(self._turns) >= self.max_entries:
+            self._embeddings.pop(0)
+            self._turns.pop(0)
+        self._embeddings.append(embedding)
+        self._turns.append(turn)
+        self._matrix = None
+
+    def clear(self) -> None:
+        self._embeddings.clear()
+        self._turns.clear()
+        self._matrix = None
+
+
+# Commands after which cached replies no longer reflect Sanctuary's state
+_CACHE_INVALIDATING_COMMANDS = ("reset", "restore latest", "load")
+
+
+def _format_turn(turn, cached: bool = False) -> str:
+    """Render a conversation turn for the REPL.
+
+    A reply served from the semantic cache is labelled as such; the cached
+    turn's emotional state and response time belong to the earlier message,
+    so they are not shown again.
+    """
+    if cached:
+        return (
+            f"\nSanctuary [cached]: {turn.system_response}\n"
+            "(Reused reply to a similar earlier message)\n\n"
+        )
+    emotion = turn.emotional_state
+    if emotion:
+        valence = emotion.get("valence", 0.0)
+        arousal = emotion.get("arousal", 0.0)
+        emotion_label = f"[{valence:.1f}V {arousal:.1f}A]"
+    else:
+        emotion_label = ""
+    return (
+        f"\nSanctuary {emotion_label}: {turn.system_response}\n"
+        f"(Response time: {turn.response_time:.2f}s)\n\n"
+    )
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -394,8 +563,11 @@ async def main(argv=None):
     exit_code = 0
 
     try:
+        # Build the API (heavy imports, model loads) in a worker thread so the
+        # loop keeps servicing signals while the banner is shown.
+        init_task = asyncio.create_task(asyncio.to_thread(SanctuaryAPI, config))
         print("🧠 Initializing Sanctuary...")
-        sanctuary = SanctuaryAPI(config)
+        sanctuary = await init_task
         await sanctuary.start()
 
         if args.restore_latest:
@@ -405,6 +577,13 @@ async def main(argv=None):
                     sanctuary.core.restore_state(latest)
                     print("✅ Restored from latest checkpoint.")
 
+        semantic_cache = None
+        if args.semantic_cache:
+            semantic_cache = _SemanticCache(
+                sanctuary.core.perception.encode_text,
+                threshold=args.semantic_cache_threshold,
+            )
+
         print("✅ Sanctuary is online. Type 'help' for commands or 'quit' to exit.\n")
 
         # ------- REPL -------
@@ -422,79 +601,43 @@ async def main(argv=None):
             lower = user_input.lower()
 
             # ---- exit ----
-            if lower in ("quit", "exit"):
+            if lower in _QUIT_COMMANDS:
                 break
 
-            # ---- help ----
-            if lower in ("help", "?"):
-                print("\n📖 Available Commands:")
-                print("   quit, exit          - Exit the CLI")
-                print("   help, ?             - Show this help message")
-                print("   reset               - Clear conversation history")
-                print("   history             - Show recent conversation")
-                print("   metrics             - Show system metrics")
-                print("   health              - Show subsystem health report")
-                print("   save [label]        - Save current state (optional label)")
-                print("   checkpoints         - List all available checkpoints")
-                print("   load <id>           - Load a specific checkpoint by ID")
-                print("   restore latest      - Restore from most recent checkpoint")
-                print("\n🧹 Memory Management:")
-                print("   memory stats        - Show memory health statistics")
-                print("   memory gc           - Manually trigger garbage collection")
-                print("   memory gc --threshold <value>  - Run GC with custom threshold")
-                print("   memory gc --dry-run - Preview what would be removed")
-                print("   memory autogc on    - Enable automatic GC")
-                print("   memory autogc off   - Disable automatic GC")
-                print("\n   Any other text will be sent to Sanctuary for conversation.\n")
+            # ---- commands ----
+            if semantic_cache is not None and lower.startswith(_CACHE_INVALIDATING_COMMANDS):
+                semantic_cache.clear()
+            handler = _COMMANDS.get(lower)
+            if handler is not None:
+                await handler(sanctuary)
                 continue
-
-            # ---- simple commands ----
-            if lower == "reset":
-                sanctuary.reset_conversation()
-                print("🔄 Conversation reset.\n")
-                continue
-            if lower == "history":
-                await _handle_history(sanctuary)
-                continue
-            if lower == "metrics":
-                await _handle_metrics(sanctuary)
-                continue
-            if lower == "health":
-                await _handle_health(sanctuary)
-                continue
-
-            # ---- checkpoint commands ----
-            if lower.startswith("save"):
-                await _handle_save(sanctuary, user_input)
-                continue
-            if lower == "checkpoints":
-                await _handle_checkpoints(sanctuary)
-                continue
-            if lower.startswith("load"):
-                await _handle_load(sanctuary, user_input)
-                continue
-            if lower == "restore latest":
-                await _handle_restore_latest(sanctuary)
-                continue
-
-            # ---- memory commands ----
-            if lower.startswith("memory"):
-                await _handle_memory(sanctuary, user_input)
+            prefix_handler = next(
+                (h for prefix, h in _PREFIX_COMMANDS if lower.startswith(prefix)), None
+            )
+            if prefix_handler is not None:
+                await prefix_handler(sanctuary, user_input)
                 continue
 
             # ---- chat ----
             try:
                 print("💭 Thinking...")
-                turn = await sanctuary.chat(user_input)
-                emotion = turn.emotional_state
-                if emotion:
-                    valence = emotion.get("valence", 0.0)
-                    arousal = emotion.get("arousal", 0.0)
-                    emotion_label = f"[{valence:.1f}V {arousal:.1f}A]"
-                else:
-                    emotion_label = ""
-                print(f"\nSanctuary {emotion_label}: {turn.system_response}")
-                print(f"(Response time: {turn.response_time:.2f}s)\n")
+                turn = embedding = None
+                if semantic_cache is not None:
+                    try:
+                        # Embedding the message is a model forward pass; run
+                        # it in a worker thread so the cognitive loop keeps going
+                        turn, embedding = await asyncio.to_thread(
+                            semantic_cache.lookup, user_input
+                        )
+                    except Exception as cache_err:
+                        logger.warning(f"Semantic cache disabled: {cache_err}")
+                        semantic_cache = None
+                cached = turn is not None
+                if not cached:
+                    turn = await sanctuary.chat(user_input)
+                    if embedding is not None:
+                        semantic_cache.add(embedding, turn)
+                print(_format_turn(turn, cached), end="")
             except Exception as chat_err:
                 print(f"\n❌ {_format_error(chat_err, args.verbose)}\n")
 
@@ -520,9 +663,16 @@ async def main(argv=None):
     return exit_code
 
 
+def run(coro):
+    """Run *coro* to completion, on a uvloop event loop when uvloop is installed."""
+    loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
 if __name__ == "__main__":
     try:
-        code = asyncio.run(main())
+        code = run(main())
         sys.exit(code)
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
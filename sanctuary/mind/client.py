@@ -22,13 +22,17 @@ Usage (Sync):
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Optional, Tuple
 
 from .cognitive_core import CognitiveCore
 from .cognitive_core.conversation import ConversationManager, ConversationTurn
 
 logger = logging.getLogger(__name__)
 
+# How long a get_metrics() result may be reused before it is rebuilt
+METRICS_CACHE_TTL = 1.0
+
 
 class SanctuaryAPI:
     """
@@ -70,6 +74,9 @@ class SanctuaryAPI:
         
         self._running = False
         
+        # (monotonic time built, metrics) from the last get_metrics() call
+        self._metrics_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
         logger.info("✅ SanctuaryAPI initialized")
     
     async def start(self) -> None:
@@ -117,7 +124,9 @@ class SanctuaryAPI:
         if not self._running:
             raise RuntimeError("SanctuaryAPI not started. Call start() first.")
         
-        return await self.conversation.process_turn(message)
+        turn = await self.conversation.process_turn(message)
+        self._metrics_cache = None
+        return turn
     
     def get_conversation_history(self, n: int = 10) -> List[ConversationTurn]:
         """
@@ -135,18 +144,27 @@ class SanctuaryAPI:
         """
         Get conversation and cognitive metrics.
         
+        Results are reused for up to METRICS_CACHE_TTL seconds (and until the
+        next chat turn or reset), so repeated calls do not re-aggregate.
+        
         Returns:
             Dict containing metrics from both conversation manager and
             cognitive core, including response times, turn counts, and
             system performance statistics.
         """
+        now = time.monotonic()
+        if self._metrics_cache is not None and now - self._metrics_cache[0] < METRICS_CACHE_TTL:
+            return self._metrics_cache[1]
+        
         conversation_metrics = self.conversation.get_metrics()
         cognitive_metrics = self.core.get_metrics()
         
-        return {
+        metrics = {
             "conversation": conversation_metrics,
             "cognitive_core": cognitive_metrics
         }
+        self._metrics_cache = (now, metrics)
+        return metrics
     
     def reset_conversation(self) -> None:
         """
@@ -156,6 +174,7 @@ class SanctuaryAPI:
         the cognitive core's memory or learning.
         """
         self.conversation.reset_conversation()
+        self._metrics_cache = None
 
 
 class Sanctuary:
@@ -12,103 +12,151 @@ cognitive substrate.
 
 from __future__ import annotations
 
-from .core import CognitiveCore  # Now imported from core/ module
-from .workspace import (
-    GlobalWorkspace,
-    Goal,
-    GoalType,
-    Percept,
-    Memory,
-    WorkspaceSnapshot,
-    WorkspaceContent,
-)
-from .attention import AttentionController
-from .perception import PerceptionSubsystem
-from .action import ActionSubsystem, Action, ActionType
-from .affect import AffectSubsystem
-from .meta_cognition import SelfMonitor, IntrospectiveJournal
-from .incremental_journal import IncrementalJournalWriter
-from .memory_integration import MemoryIntegration
-from .language_input import LanguageInputParser, IntentType, Intent, ParseResult
-from .language_output import LanguageOutputGenerator
-from .llm_client import LLMClient, GemmaClient, LlamaClient, MockLLMClient, LLMError
-from .checkpoint import CheckpointManager, CheckpointInfo
-from .memory_gc import MemoryGarbageCollector, CollectionStats, MemoryHealthReport
-from .structured_formats import (
-    LLMInputParseRequest,
-    LLMInputParseResponse,
-    OutputGenerationRequest,
-    OutputGenerationResponse,
-    ConversationContext,
-    EmotionalState,
-    WorkspaceStateSnapshot
-)
-from .fallback_handlers import (
-    FallbackInputParser,
-    FallbackOutputGenerator,
-    CircuitBreaker,
-    CircuitState
-)
-from .conversation import ConversationManager, ConversationTurn
-from .autonomous_initiation import AutonomousInitiationController
-from .temporal_awareness import TemporalAwareness
-from .temporal import (
-    TemporalGrounding,
-    TemporalContext,
-    Session,
-    SessionManager,
-    TimePassageEffects,
-    TemporalExpectations,
-    TemporalExpectation,
-    RelativeTime
-)
-from .autonomous_memory_review import AutonomousMemoryReview
-from .existential_reflection import ExistentialReflection
-from .interaction_patterns import InteractionPatternAnalysis
-from .continuous_consciousness import ContinuousConsciousnessController
-from .introspective_loop import IntrospectiveLoop, ActiveReflection, ReflectionTrigger
-from .input_queue import InputQueue, InputEvent, InputSource
-from .idle_cognition import IdleCognition
-from .consciousness_tests import (
-    ConsciousnessTest,
-    TestResult,
-    MirrorTest,
-    UnexpectedSituationTest,
-    SpontaneousReflectionTest,
-    CounterfactualReasoningTest,
-    MetaCognitiveAccuracyTest,
-    ConsciousnessTestFramework,
-    ConsciousnessReportGenerator
-)
-from .communication import (
-    CommunicationDriveSystem,
-    CommunicationUrge,
-    DriveType
-)
-# IWMT components
-from .world_model import (
-    WorldModel,
-    Prediction,
-    PredictionError,
-    SelfModel,
-    EnvironmentModel,
-    EntityModel,
-    Relationship
-)
-from .active_inference import (
-    FreeEnergyMinimizer,
-    ActiveInferenceActionSelector,
-    ActionEvaluation
-)
-from .precision_weighting import PrecisionWeighting
-from .metta import (
-    AtomspaceBridge,
-    COMMUNICATION_DECISION_RULES,
-    PREDICTION_RULES
-)
-from .iwmt_core import IWMTCore
+import importlib
 
-__all__ = [
+# Public names are resolved lazily (PEP 562) so that importing the package,
+# or a single submodule, does not pull in every subsystem and its heavy
+# dependencies. Maps submodule -> names it exports.
+_LAZY_IMPORTS = {
+    ".core": ("CognitiveCore",),
+    ".workspace": (
+        "GlobalWorkspace",
+        "Goal",
+        "GoalType",
+        "Percept",
+        "Memory",
+        "WorkspaceSnapshot",
+        "WorkspaceContent",
+    ),
+    ".attention": ("AttentionController",),
+    ".perception": ("PerceptionSubsystem",),
+    ".action": (
+        "ActionSubsystem",
+        "Action",
+        "ActionType",
+    ),
+    ".affect": ("AffectSubsystem",),
+    ".meta_cognition": (
+        "SelfMonitor",
+        "IntrospectiveJournal",
+    ),
+    ".incremental_journal": ("IncrementalJournalWriter",),
+    ".memory_integration": ("MemoryIntegration",),
+    ".language_input": (
+        "LanguageInputParser",
+        "IntentType",
+        "Intent",
+        "ParseResult",
+    ),
+    ".language_output": ("LanguageOutputGenerator",),
+    ".llm_client": (
+        "LLMClient",
+        "GemmaClient",
+        "LlamaClient",
+        "MockLLMClient",
+        "LLMError",
+    ),
+    ".checkpoint": (
+        "CheckpointManager",
+        "CheckpointInfo",
+    ),
+    ".memory_gc": (
+        "MemoryGarbageCollector",
+        "CollectionStats",
+        "MemoryHealthReport",
+    ),
+    ".structured_formats": (
+        "LLMInputParseRequest",
+        "LLMInputParseResponse",
+        "OutputGenerationRequest",
+        "OutputGenerationResponse",
+        "ConversationContext",
+        "EmotionalState",
+        "WorkspaceStateSnapshot",
+    ),
+    ".fallback_handlers": (
+        "FallbackInputParser",
+        "FallbackOutputGenerator",
+        "CircuitBreaker",
+        "CircuitState",
+    ),
+    ".conversation": (
+        "ConversationManager",
+        "ConversationTurn",
+    ),
+    ".autonomous_initiation": ("AutonomousInitiationController",),
+    ".temporal_awareness": ("TemporalAwareness",),
+    ".temporal": (
+        "TemporalGrounding",
+        "TemporalContext",
+        "Session",
+        "SessionManager",
+        "TimePassageEffects",
+        "TemporalExpectations",
+        "TemporalExpectation",
+        "RelativeTime",
+    ),
+    ".autonomous_memory_review": ("AutonomousMemoryReview",),
+    ".existential_reflection": ("ExistentialReflection",),
+    ".interaction_patterns": ("InteractionPatternAnalysis",),
+    ".continuous_consciousness": ("ContinuousConsciousnessController",),
+    ".introspective_loop": (
+        "IntrospectiveLoop",
+        "ActiveReflection",
+        "ReflectionTrigger",
+    ),
+    ".input_queue": (
+        "InputQueue",
+        "InputEvent",
+        "InputSource",
+    ),
+    ".idle_cognition": ("IdleCognition",),
+    ".consciousness_tests": (
+        "ConsciousnessTest",
+        "TestResult",
+        "MirrorTest",
+        "UnexpectedSituationTest",
+        "SpontaneousReflectionTest",
+        "CounterfactualReasoningTest",
+        "MetaCognitiveAccuracyTest",
+        "ConsciousnessTestFramework",
+        "ConsciousnessReportGenerator",
+    ),
+    ".communication": (
+        "CommunicationDriveSystem",
+        "CommunicationUrge",
+        "DriveType",
+    ),
+    # IWMT components
+    ".world_model": (
+        "WorldModel",
+        "Prediction",
+        "PredictionError",
+        "SelfModel",
+        "EnvironmentModel",
+        "EntityModel",
+        "Relationship",
+    ),
+    ".active_inference": (
+        "FreeEnergyMinimizer",
+        "ActiveInferenceActionSelector",
+        "ActionEvaluation",
+    ),
+    ".precision_weighting": ("PrecisionWeighting",),
+    ".metta": (
+        "AtomspaceBridge",
+        "COMMUNICATION_DECISION_RULES",
+        "PREDICTION_RULES",
+    ),
+    ".iwmt_core": ("IWMTCore",),
+}
+
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+
+__all__ = (
     "CognitiveCore",
     "GlobalWorkspace",
     "Goal",
@@ -204,4 +252,17 @@ __all__ = [
     "COMMUNICATION_DECISION_RULES",
     "PREDICTION_RULES",
     "IWMTCore",
-]
+)
+
+
+def __getattr__(name: str):
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -70,6 +70,7 @@ class StubMetaCognition:
     def observe(self, snapshot): return []
     def auto_validate_predictions(self, snapshot): return []
     def update_self_model(self, snapshot, actual_outcome): pass
+    def update_self_model_batch(self, snapshot, outcomes): pass
     def predict_behavior(self, snapshot): return None
     def record_prediction(self, **kw): return None
     def validate_prediction(self, prediction_id, actual_state=None): return None
@@ -78,6 +79,7 @@ class StubMetaCognition:
 
 class StubIntrospectiveJournal:
     def record_observation(self, obs): pass
+    def record_observations(self, observations): pass
     def get_recent(self, n=5): return []
 
 class StubBottleneckDetector:
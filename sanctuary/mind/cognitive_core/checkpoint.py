@@ -21,22 +21,27 @@ The CheckpointManager integrates with CognitiveCore to provide:
 Usage:
     >>> manager = CheckpointManager()
     >>> checkpoint_path = manager.save_checkpoint(workspace, metadata={"label": "Before experiment"})
+    >>> checkpoint_path = await manager.save_checkpoint_async(workspace)  # Disk I/O in a thread
     >>> restored_workspace = manager.load_checkpoint(checkpoint_path)
     >>> checkpoints = manager.list_checkpoints()
 """
 
 from __future__ import annotations
 
+import bisect
 import gzip
 import hashlib
 import json
 import logging
 import asyncio
+import threading
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
+from functools import cached_property
 
 from .workspace import GlobalWorkspace
 
@@ -47,6 +52,7 @@ logger = logging.getLogger(__name__)
 DEFAULT_CHECKPOINT_DIR = Path("data/checkpoints")
 DEFAULT_MAX_CHECKPOINTS = 20
 CHECKPOINT_VERSION = "1.0"
+WRITE_CHUNK_BYTES = 1024 * 1024  # Granularity of paced checkpoint writes
 
 
 @dataclass
@@ -60,6 +66,11 @@ class CheckpointInfo:
     compressed: bool
     metadata: Dict[str, Any]
     checksum: str
+    
+    @cached_property
+    def timestamp_str(self) -> str:
+        """Display form of the timestamp, formatted once per checkpoint."""
+        return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
 
 class CheckpointManager:
@@ -83,6 +94,7 @@ class CheckpointManager:
         checkpoint_dir: Directory where checkpoints are stored
         max_checkpoints: Maximum number of checkpoints to keep (rotation)
         compression: Whether to use gzip compression
+        max_write_mb_per_sec: Optional cap on checkpoint write rate (None = unpaced)
         auto_save_task: Task handle for auto-save loop (if enabled)
     """
     
@@ -91,6 +103,7 @@ class CheckpointManager:
         checkpoint_dir: Optional[Path] = None,
         max_checkpoints: int = DEFAULT_MAX_CHECKPOINTS,
         compression: bool = True,
+        max_write_mb_per_sec: Optional[float] = None,
     ) -> None:
         """
         Initialize the CheckpointManager.
@@ -99,13 +112,27 @@ class CheckpointManager:
             checkpoint_dir: Directory for storing checkpoints (default: data/checkpoints/)
             max_checkpoints: Maximum checkpoints to keep before rotation (default: 20)
             compression: Whether to use gzip compression (default: True)
+            max_write_mb_per_sec: Pace checkpoint writes to at most this many MiB
+                of (uncompressed) data per second, so a large save does not
+                saturate the disk during conversation (default: None, unpaced)
         """
         self.checkpoint_dir = checkpoint_dir or DEFAULT_CHECKPOINT_DIR
         self.max_checkpoints = max_checkpoints
         self.compression = compression
+        self.max_write_mb_per_sec = max_write_mb_per_sec
         self.auto_save_task: Optional[asyncio.Task] = None
         self._auto_save_running = False
         
+        # Parsed checkpoint info keyed by path, valid while (mtime_ns, size) match
+        self._info_cache: Dict[Path, Tuple[int, int, CheckpointInfo]] = {}
+        # Sorted checkpoint IDs for prefix lookup; rebuilt when the listing changes
+        self._id_index: Optional[Tuple[List[str], Dict[str, CheckpointInfo]]] = None
+        # Serializes disk writes/rotation, which may run in worker threads
+        self._io_lock = threading.RLock()
+        # Guards _info_cache/_id_index only; never held across disk I/O, so
+        # listing from the event loop does not wait for a write in progress
+        self._cache_lock = threading.Lock()
+        
         # Ensure checkpoint directory exists
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         
@@ -143,70 +170,146 @@ class CheckpointManager:
             ... )
         """
         try:
-            # Generate checkpoint ID and timestamp
-            checkpoint_id = str(uuid.uuid4())
-            timestamp = datetime.now()
-            
-            # Serialize workspace state
-            workspace_state = workspace.to_dict()
-            
-            # Build checkpoint structure
-            checkpoint = {
-                "version": CHECKPOINT_VERSION,
-                "timestamp": timestamp.isoformat(),
-                "checkpoint_id": checkpoint_id,
-                "workspace_state": workspace_state,
-                "metadata": metadata or {},
-            }
-            
-            # Generate checkpoint filename
-            timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
-            filename = f"checkpoint_{timestamp_str}_{checkpoint_id[:8]}.json"
-            if self.compression:
-                filename += ".gz"
-            
-            checkpoint_path = self.checkpoint_dir / filename
+            checkpoint_path, checkpoint = self._snapshot_checkpoint(workspace, metadata)
+            self._write_checkpoint(checkpoint_path, checkpoint)
+            return checkpoint_path
             
-            # Serialize to JSON
-            json_data = json.dumps(checkpoint, indent=2, default=self._json_encoder)
-            json_bytes = json_data.encode('utf-8')
+        except Exception as e:
+            logger.error(f"Failed to save checkpoint: {e}", exc_info=True)
+            raise
+    
+    async def save_checkpoint_async(
+        self,
+        workspace: GlobalWorkspace,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """
+        Save workspace state without blocking the event loop on disk I/O.
+        
+        The workspace snapshot is taken on the calling (event loop) thread so
+        it is consistent with the cognitive loop; JSON encoding, compression,
+        the atomic write and rotation then run in a worker thread.
+        
+        Args:
+            workspace: GlobalWorkspace instance to save
+            metadata: Optional metadata dict (user label, session info, etc.)
             
-            # Calculate checksum
-            checksum = hashlib.sha256(json_bytes).hexdigest()
+        Returns:
+            Path to the saved checkpoint file
             
-            # Add checksum to metadata (in-memory only, not in file)
-            checkpoint["metadata"]["_checksum"] = checksum
+        Raises:
+            IOError: If checkpoint cannot be written
+            ValueError: If workspace serialization fails
+        """
+        try:
+            checkpoint_path, checkpoint = self._snapshot_checkpoint(workspace, metadata)
+            await asyncio.to_thread(self._write_checkpoint, checkpoint_path, checkpoint)
+            return checkpoint_path
             
-            # Atomic write: write to temp file, then rename
-            temp_path = checkpoint_path.with_suffix('.tmp')
+        except Exception as e:
+            logger.error(f"Failed to save checkpoint: {e}", exc_info=True)
+            raise
+    
+    def _snapshot_checkpoint(
+        self,
+        workspace: GlobalWorkspace,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Path, Dict[str, Any]]:
+        """
+        Build the checkpoint document from the current workspace state.
+        
+        The document shares no mutable state with the workspace, so it can be
+        encoded on another thread while the cognitive loop keeps running.
+        
+        Returns:
+            Tuple of (destination path, checkpoint document)
+        """
+        # Generate checkpoint ID and timestamp
+        checkpoint_id = str(uuid.uuid4())
+        timestamp = datetime.now()
+        
+        # Serialize workspace state; emotional_state is the live dict, so copy it
+        workspace_state = workspace.to_dict()
+        workspace_state["emotional_state"] = dict(workspace_state["emotional_state"])
+        
+        # Build checkpoint structure
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "timestamp": timestamp.isoformat(),
+            "checkpoint_id": checkpoint_id,
+            "workspace_state": workspace_state,
+            "metadata": dict(metadata or {}),
+        }
+        
+        # Generate checkpoint filename
+        timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
+        filename = f"checkpoint_{timestamp_str}_{checkpoint_id[:8]}.json"
+        if self.compression:
+            filename += ".gz"
+        
+        return self.checkpoint_dir / filename, checkpoint
+    
+    def _write_checkpoint(self, checkpoint_path: Path, checkpoint: Dict[str, Any]) -> None:
+        """
+        Encode a checkpoint document, write it atomically and enforce rotation.
+        
+        Safe to call from a worker thread. Encoding and the (possibly paced)
+        temp-file write happen outside _io_lock; the lock is held only for
+        the rename and rotation.
+        
+        Args:
+            checkpoint_path: Destination checkpoint path
+            checkpoint: Checkpoint document from _snapshot_checkpoint()
+        """
+        # Serialize to JSON
+        json_data = json.dumps(checkpoint, indent=2, default=self._json_encoder)
+        json_bytes = json_data.encode('utf-8')
+        
+        # Atomic write: write to temp file (unique per checkpoint), then rename
+        temp_path = checkpoint_path.with_suffix('.tmp')
+        
+        try:
+            if self.compression:
+                with gzip.open(temp_path, 'wb') as f:
+                    self._write_paced(f, json_bytes)
+            else:
+                with open(temp_path, 'wb') as f:
+                    self._write_paced(f, json_bytes)
             
-            try:
-                if self.compression:
-                    with gzip.open(temp_path, 'wb') as f:
-                        f.write(json_bytes)
-                else:
-                    with open(temp_path, 'wb') as f:
-                        f.write(json_bytes)
-                
+            with self._io_lock:
                 # Atomic rename
                 temp_path.rename(checkpoint_path)
                 
-            finally:
-                # Clean up temp file if it still exists
-                if temp_path.exists():
-                    temp_path.unlink()
-            
-            # Enforce checkpoint rotation
-            self._rotate_checkpoints()
-            
-            size_kb = checkpoint_path.stat().st_size / 1024
-            logger.info(f"💾 Checkpoint saved: {checkpoint_path.name} ({size_kb:.1f} KB)")
-            
-            return checkpoint_path
+                # Enforce checkpoint rotation
+                self._rotate_checkpoints()
             
-        except Exception as e:
-            logger.error(f"Failed to save checkpoint: {e}", exc_info=True)
-            raise
+        finally:
+            # Clean up temp file if it still exists
+            if temp_path.exists():
+                temp_path.unlink()
+        
+        size_kb = checkpoint_path.stat().st_size / 1024
+        logger.info(f"💾 Checkpoint saved: {checkpoint_path.name} ({size_kb:.1f} KB)")
+    
+    def _write_paced(self, f: Any, data: bytes) -> None:
+        """
+        Write data in WRITE_CHUNK_BYTES chunks, sleeping between chunks to
+        honour max_write_mb_per_sec. Writes in one call when unpaced.
+        
+        Args:
+            f: Open binary file object
+            data: Bytes to write
+        """
+        if not self.max_write_mb_per_sec or len(data) <= WRITE_CHUNK_BYTES:
+            f.write(data)
+            return
+        
+        chunk_delay = WRITE_CHUNK_BYTES / (self.max_write_mb_per_sec * 1024 * 1024)
+        view = memoryview(data)
+        for offset in range(0, len(data), WRITE_CHUNK_BYTES):
+            if offset:
+                time.sleep(chunk_delay)
+            f.write(view[offset:offset + WRITE_CHUNK_BYTES])
     
     def load_checkpoint(self, checkpoint_path: Path) -> GlobalWorkspace:
         """
@@ -283,6 +386,9 @@ class CheckpointManager:
         
         Scans the checkpoint directory and returns information about
         all available checkpoints, sorted by timestamp (newest first).
+        Files whose mtime and size are unchanged since the last scan are
+        served from an in-memory cache instead of being decompressed,
+        hashed, and parsed again.
         
         Returns:
             List of CheckpointInfo objects with checkpoint details
@@ -293,10 +399,25 @@ class CheckpointManager:
             >>> for cp in checkpoints:
             ...     print(f"{cp.timestamp}: {cp.metadata.get('user_label', 'N/A')}")
         """
+        with self._cache_lock:
+            cache = dict(self._info_cache)
+        
         checkpoints = []
+        updates: Dict[Path, Tuple[int, int, CheckpointInfo]] = {}
+        seen_paths = set()
         
         for path in self.checkpoint_dir.glob("checkpoint_*.json*"):
+            # Skip temp files of writes still in progress
+            if path.suffix == '.tmp':
+                continue
+            seen_paths.add(path)
             try:
+                stat = path.stat()
+                cached = cache.get(path)
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    checkpoints.append(cached[2])
+                    continue
+                
                 # Read checkpoint metadata (without loading full workspace)
                 if path.suffix == '.gz':
                     with gzip.open(path, 'rb') as f:
@@ -316,22 +437,64 @@ class CheckpointManager:
                     timestamp=datetime.fromisoformat(checkpoint["timestamp"]),
                     version=checkpoint["version"],
                     path=path,
-                    size_bytes=path.stat().st_size,
+                    size_bytes=stat.st_size,
                     compressed=path.suffix == '.gz',
                     metadata=checkpoint.get("metadata", {}),
                     checksum=checksum[:16],  # First 16 chars for display
                 )
                 
+                updates[path] = (stat.st_mtime_ns, stat.st_size, info)
                 checkpoints.append(info)
                 
             except Exception as e:
                 logger.warning(f"Failed to read checkpoint {path.name}: {e}")
         
+        # Publish new entries and forget checkpoints that were deleted or
+        # rotated away, in one short critical section
+        stale_paths = cache.keys() - seen_paths
+        if updates or stale_paths:
+            with self._cache_lock:
+                self._info_cache.update(updates)
+                for stale_path in stale_paths:
+                    self._info_cache.pop(stale_path, None)
+                self._id_index = None
+        
         # Sort by timestamp (newest first)
         checkpoints.sort(key=lambda x: x.timestamp, reverse=True)
         
         return checkpoints
     
+    def find_checkpoints_by_prefix(self, prefix: str) -> List[CheckpointInfo]:
+        """
+        Find checkpoints whose ID starts with the given prefix.
+        
+        Uses a sorted ID index and binary search, so lookups stay
+        logarithmic in the number of checkpoints. The index is rebuilt only
+        when the checkpoint listing changes.
+        
+        Args:
+            prefix: Leading characters of a checkpoint ID
+            
+        Returns:
+            Matching CheckpointInfo objects (empty if none match)
+            
+        Example:
+            >>> manager = CheckpointManager()
+            >>> matches = manager.find_checkpoints_by_prefix("3f2a")
+        """
+        checkpoints = self.list_checkpoints()
+        with self._cache_lock:
+            if self._id_index is None:
+                by_id = {cp.checkpoint_id: cp for cp in checkpoints}
+                self._id_index = (sorted(by_id), by_id)
+            ids_sorted, by_id = self._id_index
+        matches = []
+        for checkpoint_id in ids_sorted[bisect.bisect_left(ids_sorted, prefix):]:
+            if not checkpoint_id.startswith(prefix):
+                break
+            matches.append(by_id[checkpoint_id])
+        return matches
+    
     def delete_checkpoint(self, checkpoint_id: str) -> bool:
         """
         Remove a specific checkpoint.
@@ -395,7 +558,7 @@ class CheckpointManager:
                     break
                 
                 try:
-                    self.save_checkpoint(
+                    await self.save_checkpoint_async(
                         workspace,
                         metadata={
                             "auto_save": True,
@@ -8,61 +8,27 @@ This module provides the systems for autonomous communication decisions:
 - Deferred Queue: Queue communications for better timing
 """
 
-from .drive import (
-    CommunicationDriveSystem,
-    CommunicationUrge,
-    DriveType
-)
-
-from .inhibition import (
-    CommunicationInhibitionSystem,
-    InhibitionFactor,
-    InhibitionType
-)
-
-from .deferred import (
-    DeferredQueue,
-    DeferredCommunication,
-    DeferralReason
-)
+import importlib
 
-from .decision import (
-    CommunicationDecisionLoop,
-    CommunicationDecision,
-    DecisionResult
-)
+# Submodule -> exported names; resolved on first access by __getattr__ below
+_LAZY_IMPORTS = {
+    '.drive': ('CommunicationDriveSystem', 'CommunicationUrge', 'DriveType'),
+    '.inhibition': ('CommunicationInhibitionSystem', 'InhibitionFactor', 'InhibitionType'),
+    '.deferred': ('DeferredQueue', 'DeferredCommunication', 'DeferralReason'),
+    '.decision': ('CommunicationDecisionLoop', 'CommunicationDecision', 'DecisionResult'),
+    '.silence': ('SilenceTracker', 'SilenceAction', 'SilenceType'),
+    '.rhythm': ('ConversationalRhythmModel', 'ConversationPhase', 'ConversationTurn'),
+    '.proactive': ('ProactiveInitiationSystem', 'OutreachOpportunity', 'OutreachTrigger'),
+    '.interruption': ('InterruptionSystem', 'InterruptionRequest', 'InterruptionReason'),
+    '.reflection': ('CommunicationReflectionSystem', 'CommunicationReflection', 'ReflectionVerdict'),
+}
 
-from .silence import (
-    SilenceTracker,
-    SilenceAction,
-    SilenceType
-)
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
 
-from .rhythm import (
-    ConversationalRhythmModel,
-    ConversationPhase,
-    ConversationTurn
-)
-
-from .proactive import (
-    ProactiveInitiationSystem,
-    OutreachOpportunity,
-    OutreachTrigger
-)
 
-from .interruption import (
-    InterruptionSystem,
-    InterruptionRequest,
-    InterruptionReason
-)
-
-from .reflection import (
-    CommunicationReflectionSystem,
-    CommunicationReflection,
-    ReflectionVerdict
-)
-
-__all__ = [
+__all__ = (
     'CommunicationDriveSystem',
     'CommunicationUrge',
     'DriveType',
@@ -89,5 +55,18 @@ __all__ = [
     'InterruptionReason',
     'CommunicationReflectionSystem',
     'CommunicationReflection',
-    'ReflectionVerdict'
-]
+    'ReflectionVerdict',
+)
+
+
+def __getattr__(name: str):
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
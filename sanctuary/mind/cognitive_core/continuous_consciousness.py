@@ -152,7 +152,7 @@ class ContinuousConsciousnessController:
         
         # NEW: Generate idle cognition activities (Task #1)
         try:
-            idle_percepts = await self.idle_cognition.generate_idle_activity(
+            idle_percepts = self.idle_cognition.generate_idle_activity(
                 self.core.workspace
             )
             for percept in idle_percepts:
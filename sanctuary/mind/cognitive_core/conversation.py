@@ -19,7 +19,7 @@ import logging
 import asyncio
 from typing import Dict, List, Any, Optional, Deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from collections import deque
 
 from .core import CognitiveCore
@@ -29,6 +29,8 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_RESPONSE_TIMEOUT_ERROR = "I apologize, I'm having trouble formulating a response right now."
 DEFAULT_ERROR_MESSAGE = "I encountered an error processing that. Could you rephrase?"
+DEFAULT_HISTORY_SUMMARY_KEEP_RECENT = 10
+MAX_SUMMARY_TOPICS = 10
 DEFAULT_STOPWORDS = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "is", "it", "that", "this", "with"}
 
 
@@ -87,6 +89,10 @@ class ConversationManager:
                 - response_timeout: Max seconds to wait for response (default: 10.0)
                 - max_cycles_per_turn: Max cognitive cycles per turn (default: 20)
                 - max_history_size: Max turns to keep in history (default: 100)
+                - history_summary_age_hours: Turns older than this are rolled
+                  into a single summary turn (default: None, disabled)
+                - history_summary_keep_recent: Newest turns always kept
+                  verbatim, whatever their age (default: 10)
         """
         self.core = cognitive_core
         self.config = config or {}
@@ -100,6 +106,13 @@ class ConversationManager:
         # Configuration
         self.response_timeout = self.config.get("response_timeout", 10.0)
         self.max_cycles_per_turn = self.config.get("max_cycles_per_turn", 20)
+        summary_age = self.config.get("history_summary_age_hours")
+        self.history_summary_age: Optional[timedelta] = (
+            timedelta(hours=summary_age) if summary_age is not None else None
+        )
+        self.history_summary_keep_recent = self.config.get(
+            "history_summary_keep_recent", DEFAULT_HISTORY_SUMMARY_KEEP_RECENT
+        )
         
         # Metrics
         self.metrics = {
@@ -176,8 +189,12 @@ class ConversationManager:
             # Update state
             self._update_dialogue_state(user_input, response)
             
-            # Add to history
+            # Add to history, compacting turns that have aged out
             self.conversation_history.append(turn)
+            if self.history_summary_age is not None:
+                self._summarize_older_than(
+                    self.history_summary_age, self.history_summary_keep_recent
+                )
             
             # Update metrics
             self._update_metrics(turn)
@@ -287,6 +304,69 @@ class ConversationManager:
             (current_avg * (n - 1) + turn.response_time) / n
         )
     
+    def _summarize_older_than(self, max_age: timedelta, keep_recent: int) -> None:
+        """
+        Roll turns older than max_age into a single summary turn.
+        
+        The summary keeps the topics discussed and the number of turns it
+        replaces, so old context stays visible without holding every turn
+        verbatim. An existing summary at the head of the history is merged
+        into the new one. The newest keep_recent turns are never summarized,
+        so the exchange before an idle gap stays available as context.
+        
+        Args:
+            max_age: Turns with a timestamp older than now - max_age are summarized
+            keep_recent: Number of newest turns always kept verbatim
+        """
+        cutoff = datetime.now() - max_age
+        history = self.conversation_history
+        limit = len(history) - keep_recent
+        
+        stale = 0
+        for turn in history:
+            if stale >= limit or turn.timestamp >= cutoff:
+                break
+            stale += 1
+        
+        # Nothing to do unless at least one verbatim turn has aged out
+        if stale == 0 or (stale == 1 and history[0].metadata.get("summary")):
+            return
+        
+        old_turns = [history.popleft() for _ in range(stale)]
+        
+        turns_summarized = 0
+        topics: List[str] = []
+        for turn in old_turns:
+            if turn.metadata.get("summary"):
+                turns_summarized += turn.metadata.get("turns_summarized", 0)
+                candidates = turn.metadata.get("topics", [])
+            else:
+                turns_summarized += 1
+                candidates = self._extract_topics(turn.user_input)
+            for topic in candidates:
+                if topic not in topics:
+                    topics.append(topic)
+        topics = topics[-MAX_SUMMARY_TOPICS:]
+        
+        summary = ConversationTurn(
+            user_input=f"[{turns_summarized} earlier turns]",
+            system_response=(
+                f"Earlier discussion covered: {', '.join(topics)}" if topics
+                else "Earlier discussion (no distinct topics)"
+            ),
+            timestamp=old_turns[0].timestamp,
+            response_time=0.0,
+            emotional_state={},
+            metadata={
+                "summary": True,
+                "turns_summarized": turns_summarized,
+                "topics": topics,
+            }
+        )
+        history.appendleft(summary)
+        
+        logger.debug(f"📝 Summarized {stale} aged turns into history summary")
+    
     def get_conversation_history(self, n: int = 10) -> List[ConversationTurn]:
         """
         Get recent conversation turns.
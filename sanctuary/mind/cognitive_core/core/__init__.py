@@ -41,6 +41,8 @@ DEFAULT_CONFIG = {
     "attention_budget": 100,
     "max_queue_size": 100,
     "log_interval_cycles": 100,
+    # Seconds to reuse a "no trigger" autonomous-initiation result (0 = off)
+    "autonomous_check_ttl": 0.0,
     "timing": {
         "warn_threshold_ms": 100,
         "critical_threshold_ms": 200,
@@ -54,6 +56,7 @@ DEFAULT_CONFIG = {
         "max_checkpoints": 20,
         "compression": True,
         "checkpoint_on_shutdown": True,
+        "max_write_mb_per_sec": None,
     }
 }
 
@@ -114,7 +117,8 @@ class CognitiveCore:
         # Initialize cycle executor with supervisor
         self.cycle_executor = CycleExecutor(
             self.subsystems, self.state, self.action_executor,
-            self.timing, self.supervisor
+            self.timing, self.supervisor,
+            autonomous_check_ttl=self.config.get("autonomous_check_ttl", 0.0),
         )
         
         # Register subsystem reinitializers for automatic recovery
@@ -192,6 +196,10 @@ class CognitiveCore:
         """Save current workspace state to checkpoint."""
         return self.lifecycle.save_state(label)
 
+    async def save_state_async(self, label: Optional[str] = None) -> Optional[Path]:
+        """Save current workspace state, writing to disk in a worker thread."""
+        return await self.lifecycle.save_state_async(label)
+
     def restore_state(self, checkpoint_path: Path) -> bool:
         """Restore workspace from checkpoint."""
         return self.lifecycle.restore_state(checkpoint_path)
@@ -10,7 +10,7 @@ import logging
 from typing import TYPE_CHECKING, Optional, Dict, Any
 from datetime import datetime
 
-from ..workspace import Percept
+from ..workspace import Percept, WorkspaceSnapshot
 from ..action import ActionType
 
 if TYPE_CHECKING:
@@ -19,6 +19,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Log formats for the per-action messages; arguments are only interpolated
+# when the record is actually emitted
+_SPEAK_LOG = "🗣️ Sanctuary: %.100s..."
+_SPEAK_AUTONOMOUS_LOG = "🗣️💭 Sanctuary (autonomous): %.100s..."
+_TOOL_OK_LOG = "✅ Tool '%s' executed: success (%.1fms)"
+_TOOL_FAILED_LOG = "❌ Tool '%s' failed: %s (%.1fms)"
+_REFLECTION_LOG = "🪞 Reflection: %s (score=%.2f) — %s"
+
 
 class ActionExecutor:
     """
@@ -41,49 +49,65 @@ class ActionExecutor:
         """
         self.subsystems = subsystems
         self.state = state
+
+        # ActionType -> handler(action, snapshot); unknown types are ignored
+        self._action_handlers = {
+            ActionType.SPEAK: self.execute_speak,
+            ActionType.SPEAK_AUTONOMOUS: self.execute_speak_autonomous,
+            ActionType.TOOL_CALL: self._execute_tool_call,
+            ActionType.COMMIT_MEMORY: self._log_action,
+            ActionType.RETRIEVE_MEMORY: self._log_action,
+            ActionType.INTROSPECT: self._log_action,
+            ActionType.UPDATE_GOAL: self._log_action,
+            ActionType.WAIT: self._log_action,
+        }
     
     def _has_temporal_grounding(self) -> bool:
         """Check if temporal grounding subsystem is available."""
         return hasattr(self.subsystems, 'temporal_grounding') and self.subsystems.temporal_grounding is not None
     
-    async def execute(self, action) -> None:
+    async def execute(self, action, snapshot: Optional[WorkspaceSnapshot] = None) -> None:
         """
         Execute a single action.
         
         Args:
             action: Action to execute
+            snapshot: Workspace snapshot already taken this cycle, if any
         """
+        handler = self._action_handlers.get(action.type)
+        if handler is None:
+            return
         try:
-            if action.type == ActionType.SPEAK:
-                await self.execute_speak(action)
-            elif action.type == ActionType.SPEAK_AUTONOMOUS:
-                await self.execute_speak_autonomous(action)
-            elif action.type == ActionType.COMMIT_MEMORY:
-                logger.debug(f"Action COMMIT_MEMORY: {action.reason}")
-            elif action.type == ActionType.RETRIEVE_MEMORY:
-                query = action.parameters.get("query", "")
-                logger.debug(f"Action RETRIEVE_MEMORY: query='{query}'")
-            elif action.type == ActionType.INTROSPECT:
-                logger.debug(f"Action INTROSPECT: {action.reason}")
-            elif action.type == ActionType.UPDATE_GOAL:
-                logger.debug(f"Action UPDATE_GOAL: {action.reason}")
-            elif action.type == ActionType.WAIT:
-                logger.debug("Action WAIT: maintaining current state")
-            elif action.type == ActionType.TOOL_CALL:
-                result = await self.subsystems.action.execute_action(action)
-                logger.debug(f"Action TOOL_CALL: result={result}")
+            await handler(action, snapshot)
         except Exception as e:
             logger.error(f"Error executing action {action.type}: {e}", exc_info=True)
+
+    async def _log_action(self, action, snapshot: Optional[WorkspaceSnapshot] = None) -> None:
+        """Trace action types that need no work beyond a debug log line."""
+        if action.type is ActionType.RETRIEVE_MEMORY:
+            query = action.parameters.get("query", "")
+            logger.debug("Action RETRIEVE_MEMORY: query='%s'", query)
+        elif action.type is ActionType.WAIT:
+            logger.debug("Action WAIT: maintaining current state")
+        else:
+            logger.debug("Action %s: %s", action.type.name, action.reason)
+
+    async def _execute_tool_call(self, action, snapshot: Optional[WorkspaceSnapshot] = None) -> None:
+        """Run a TOOL_CALL action through the action subsystem."""
+        result = await self.subsystems.action.execute_action(action)
+        logger.debug("Action TOOL_CALL: result=%s", result)
     
-    async def execute_speak(self, action) -> None:
+    async def execute_speak(self, action, snapshot: Optional[WorkspaceSnapshot] = None) -> None:
         """
         Execute SPEAK action with validation.
         
         Args:
             action: Action with metadata containing response context
+            snapshot: Workspace snapshot to respond from (broadcast if omitted)
         """
         try:
-            snapshot = self.state.workspace.broadcast()
+            if snapshot is None:
+                snapshot = self.state.workspace.broadcast()
             context = {
                 "user_input": action.metadata.get("responding_to", "") if hasattr(action, 'metadata') else ""
             }
@@ -103,7 +127,7 @@ class ActionExecutor:
                 "emotion": snapshot.emotions,
                 "timestamp": datetime.now()
             })
-            logger.info(f"🗣️ Sanctuary: {response[:100]}...")
+            logger.info(_SPEAK_LOG, response)
             
             # Record output time if temporal grounding available
             if self._has_temporal_grounding():
@@ -118,15 +142,17 @@ class ActionExecutor:
         except Exception as e:
             logger.error(f"Failed to execute SPEAK action: {e}", exc_info=True)
 
-    async def execute_speak_autonomous(self, action) -> None:
+    async def execute_speak_autonomous(self, action, snapshot: Optional[WorkspaceSnapshot] = None) -> None:
         """
         Execute SPEAK_AUTONOMOUS action with validation.
         
         Args:
             action: Action with metadata containing trigger and content
+            snapshot: Workspace snapshot to speak from (broadcast if omitted)
         """
         try:
-            snapshot = self.state.workspace.broadcast()
+            if snapshot is None:
+                snapshot = self.state.workspace.broadcast()
             context = {
                 "autonomous": True,
                 "trigger": action.metadata.get("trigger") if hasattr(action, 'metadata') else None,
@@ -149,7 +175,7 @@ class ActionExecutor:
                 "emotion": snapshot.emotions,
                 "timestamp": datetime.now()
             })
-            logger.info(f"🗣️💭 Sanctuary (autonomous): {response[:100]}...")
+            logger.info(_SPEAK_AUTONOMOUS_LOG, response)
             
             # Record output time if temporal grounding available
             if self._has_temporal_grounding():
@@ -174,23 +200,26 @@ class ActionExecutor:
         Returns:
             Percept from tool execution, or None on error
         """
-        if action.type != ActionType.TOOL_CALL:
+        if action.type is not ActionType.TOOL_CALL:
             logger.error(f"execute_tool called with non-TOOL_CALL action: {action.type}")
             return None
         
         try:
             # Extract tool information from action
-            tool_name = action.parameters.get("tool_name")
-            tool_params = action.parameters.get("parameters", {})
+            params = action.parameters
+            tool_name = params.get("tool_name")
+            tool_params = params.get("parameters") or {}
             
             if not tool_name:
                 logger.error("TOOL_CALL action missing tool_name parameter")
                 return None
             
-            # Check if action subsystem has the new tool registry with percept generation
-            if hasattr(self.subsystems.action, 'tool_reg'):
+            # Check if action subsystem has the new tool registry with percept generation.
+            # Looked up per call: the boot coordinator can swap subsystems at runtime.
+            tool_reg = getattr(self.subsystems.action, 'tool_reg', None)
+            if tool_reg is not None:
                 # Use new tool registry with percept generation
-                result = await self.subsystems.action.tool_reg.execute_tool_with_percept(
+                result = await tool_reg.execute_tool_with_percept(
                     tool_name,
                     parameters=tool_params,
                     create_percept=True
@@ -198,14 +227,11 @@ class ActionExecutor:
                 
                 # Log execution result
                 if result.success:
-                    logger.info(
-                        f"✅ Tool '{tool_name}' executed: success "
-                        f"({result.execution_time_ms:.1f}ms)"
-                    )
+                    logger.info(_TOOL_OK_LOG, tool_name, result.execution_time_ms)
                 else:
                     logger.warning(
-                        f"❌ Tool '{tool_name}' failed: {result.error} "
-                        f"({result.execution_time_ms:.1f}ms)"
+                        _TOOL_FAILED_LOG,
+                        tool_name, result.error, result.execution_time_ms
                     )
                 
                 # Return the generated percept
@@ -214,7 +240,7 @@ class ActionExecutor:
                 # Fallback to legacy tool execution (no percept generation)
                 logger.warning("Action subsystem missing tool_reg, using legacy execution")
                 result = await self.subsystems.action.execute_action(action)
-                logger.debug(f"Action TOOL_CALL (legacy): result={result}")
+                logger.debug("Action TOOL_CALL (legacy): result=%s", result)
                 return None
                 
         except Exception as e:
@@ -257,40 +283,39 @@ class ActionExecutor:
 
             if reflection.overall_score < 0.4:
                 logger.info(
-                    f"🪞 Reflection: {reflection.verdict.value} "
-                    f"(score={reflection.overall_score:.2f}) — "
-                    f"{'; '.join(reflection.lessons)}"
+                    _REFLECTION_LOG,
+                    reflection.verdict.value, reflection.overall_score,
+                    "; ".join(reflection.lessons)
                 )
         except Exception as e:
-            logger.debug(f"Communication reflection failed (non-critical): {e}")
+            logger.debug("Communication reflection failed (non-critical): %s", e)
 
     @staticmethod
-    def extract_outcome(action) -> Dict[str, Any]:
+    def extract_outcome(action, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract outcome information from an executed action.
         
         Args:
             action: The action that was executed
+            timestamp: ISO timestamp to record; defaults to now. Callers
+                extracting several outcomes at once pass one shared value.
             
         Returns:
             Dictionary containing outcome details for self-model update
         """
+        action_type = getattr(action, 'type', None)
+        # Check for failure indicators
+        status = getattr(action, 'status', None)
         outcome = {
-            "action_type": str(action.type) if hasattr(action, 'type') else "unknown",
-            "timestamp": datetime.now().isoformat(),
-            "success": True,
-            "reason": ""
+            "action_type": str(action_type) if action_type is not None else "unknown",
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "success": status == "success" if status is not None else True,
+            "reason": getattr(action, 'reason', "")
         }
         
         # Add action-specific details
-        if hasattr(action, 'metadata'):
-            outcome["metadata"] = action.metadata
-        
-        if hasattr(action, 'reason'):
-            outcome["reason"] = action.reason
-        
-        # Check for failure indicators
-        if hasattr(action, 'status'):
-            outcome["success"] = action.status == "success"
+        metadata = getattr(action, 'metadata', None)
+        if metadata is not None:
+            outcome["metadata"] = metadata
         
         return outcome
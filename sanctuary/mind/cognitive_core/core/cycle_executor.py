@@ -8,10 +8,13 @@ memory, affect, action, meta-cognition, and workspace updates.
 from __future__ import annotations
 
 import time
+import asyncio
 import logging
+from datetime import datetime
+from itertools import chain
 from typing import TYPE_CHECKING, Dict, Optional, Any
 
-from ..workspace import GoalType
+from ..workspace import GoalType, WorkspaceSnapshot
 from ..action import ActionType
 
 if TYPE_CHECKING:
@@ -23,6 +26,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Step timings are taken with the monotonic perf_counter_ns clock and
+# reported in milliseconds
+_NS_PER_MS = 1_000_000
+
+# Log formats for messages emitted from the per-cycle steps
+_AUTONOMOUS_GOAL_LOG = "🗣️ Autonomous speech goal added: %s"
+_SPEAK_DECISION_LOG = "💬 Communication decision SPEAK → goal added: %.60s"
+_BOTTLENECK_LOG = "🧠 Bottleneck introspection: %.100s..."
+
+# Meta-percept types worth recording in the introspective journal
+_JOURNAL_PERCEPT_TYPES = frozenset({
+    "self_model_update",
+    "behavioral_inconsistency",
+    "existential_question",
+})
+
 
 class CycleExecutor:
     """
@@ -43,7 +62,7 @@ class CycleExecutor:
     subsystem and disables failing subsystems via circuit breaker pattern.
     """
 
-    def __init__(self, subsystems: 'SubsystemCoordinator', state: 'StateManager', action_executor: 'ActionExecutor', timing: 'TimingManager' = None, supervisor: 'SubsystemSupervisor' = None):
+    def __init__(self, subsystems: 'SubsystemCoordinator', state: 'StateManager', action_executor: 'ActionExecutor', timing: 'TimingManager' = None, supervisor: 'SubsystemSupervisor' = None, autonomous_check_ttl: float = 0.0):
         """
         Initialize cycle executor.
 
@@ -53,6 +72,9 @@ class CycleExecutor:
             action_executor: ActionExecutor instance for handling actions
             timing: Optional TimingManager instance for tracking cycle metrics
             supervisor: Optional SubsystemSupervisor for fault isolation
+            autonomous_check_ttl: Seconds to skip autonomous-trigger checks after
+                one found nothing, while the workspace fingerprint is unchanged
+                (0 disables)
         """
         self.subsystems = subsystems
         self.state = state
@@ -67,6 +89,15 @@ class CycleExecutor:
         # Emotion-triggered memory retrieval rate limiting
         self._cycles_since_emotion_retrieval = 0
         self._emotion_retrieval_cooldown = 15  # min cycles between emotion-triggered retrievals
+
+        # Workspace snapshot shared by the read-only steps of the current cycle;
+        # dropped whenever a step mutates the workspace
+        self._cycle_snapshot: Optional[WorkspaceSnapshot] = None
+
+        # Remembered "no trigger" result for autonomous initiation
+        self._autonomous_check_ttl = autonomous_check_ttl
+        self._autonomous_quiet_key: Optional[tuple] = None
+        self._autonomous_quiet_until = 0.0
     
     def _has_temporal_grounding(self) -> bool:
         """Check if temporal grounding subsystem is available."""
@@ -88,6 +119,28 @@ class CycleExecutor:
         if self.supervisor is not None:
             self.supervisor.record_failure(name, error)
 
+    def _snapshot(self) -> WorkspaceSnapshot:
+        """Return the current cycle's workspace snapshot, broadcasting only when stale."""
+        if self._cycle_snapshot is None:
+            self._cycle_snapshot = self.state.workspace.broadcast()
+        return self._cycle_snapshot
+
+    def _invalidate_snapshot(self) -> None:
+        """Drop the cached snapshot after a step has changed the workspace."""
+        self._cycle_snapshot = None
+
+    @staticmethod
+    async def _timed(awaitable) -> tuple:
+        """Await a step and return ``(result, elapsed_ms)``."""
+        step_start = time.perf_counter_ns()
+        result = await awaitable
+        return result, (time.perf_counter_ns() - step_start) / _NS_PER_MS
+
+    @staticmethod
+    async def _skipped() -> tuple:
+        """Placeholder result for a step the supervisor has disabled."""
+        return [], 0.0
+
     async def execute_cycle(self) -> Dict[str, float]:
         """
         Execute one complete cognitive cycle with error handling.
@@ -101,15 +154,16 @@ class CycleExecutor:
             Dict of subsystem timings in milliseconds
         """
         subsystem_timings = {}
+        self._invalidate_snapshot()
 
         # 0a. TEMPORAL CONTEXT: Fetch temporal awareness at cycle start
         if self._should_run('temporal_context'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 if self._has_temporal_grounding():
                     temporal_context = self.subsystems.temporal_grounding.get_temporal_context()
                     self.state.workspace.set_temporal_context(temporal_context)
-                subsystem_timings['temporal_context'] = (time.time() - step_start) * 1000
+                subsystem_timings['temporal_context'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('temporal_context')
             except Exception as e:
                 logger.error(f"Temporal context step failed: {e}", exc_info=True)
@@ -121,7 +175,7 @@ class CycleExecutor:
         # 0. IWMT PREDICTION: Generate predictions before perception
         if self._should_run('iwmt_predict'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 if hasattr(self.subsystems, 'iwmt_core') and self.subsystems.iwmt_core:
                     context = {
                         "goals": list(self.state.workspace.current_goals),
@@ -137,11 +191,11 @@ class CycleExecutor:
                     error_summary = self.subsystems.iwmt_core.world_model.get_prediction_error_summary()
                     avg_surprise = error_summary.get("average_surprise", 0.5)
                     self.state.workspace.metadata["iwmt_confidence"] = 1.0 - min(avg_surprise, 1.0)
-                    logger.debug(f"🔮 IWMT: Generated {len(self._current_predictions)} predictions")
+                    logger.debug("🔮 IWMT: Generated %d predictions", len(self._current_predictions))
                 else:
                     self._current_predictions = []
                     self._current_prediction_errors = []
-                subsystem_timings['iwmt_predict'] = (time.time() - step_start) * 1000
+                subsystem_timings['iwmt_predict'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('iwmt_predict')
             except Exception as e:
                 logger.error(f"IWMT prediction step failed: {e}", exc_info=True)
@@ -154,17 +208,29 @@ class CycleExecutor:
             self._current_prediction_errors = []
             subsystem_timings['iwmt_predict'] = 0.0
 
-        # 1. PERCEPTION: Process queued inputs
-        if self._should_run('perception'):
+        # 1. PERCEPTION + 2. MEMORY RETRIEVAL: Retrieval only reads goals and
+        # affect, which perception never touches, so both awaits run together.
+        # Memory percepts are still merged after dedup / IWMT update below.
+        run_perception = self._should_run('perception')
+        run_memory = self._should_run('memory_retrieval')
+        perception_result, memory_result = await asyncio.gather(
+            self._timed(self.state.gather_percepts(self.subsystems.perception))
+            if run_perception else self._skipped(),
+            self._timed(self._retrieve_memories()) if run_memory else self._skipped(),
+            return_exceptions=True,
+        )
+
+        if run_perception:
             try:
-                step_start = time.time()
-                new_percepts = await self.state.gather_percepts(self.subsystems.perception)
+                if isinstance(perception_result, BaseException):
+                    raise perception_result
+                new_percepts, perception_ms = perception_result
 
                 # Record input time if we got new percepts
                 if new_percepts and self._has_temporal_grounding():
                     self.subsystems.temporal_grounding.record_input()
 
-                subsystem_timings['perception'] = (time.time() - step_start) * 1000
+                subsystem_timings['perception'] = perception_ms
                 self._record_ok('perception')
             except Exception as e:
                 logger.error(f"Perception step failed: {e}", exc_info=True)
@@ -179,7 +245,7 @@ class CycleExecutor:
         if self._should_run('percept_dedup'):
             try:
                 if new_percepts and hasattr(self.subsystems, 'percept_similarity'):
-                    step_start = time.time()
+                    step_start = time.perf_counter_ns()
                     before_count = len(new_percepts)
                     new_percepts = self.subsystems.percept_similarity.filter_duplicates(
                         new_percepts,
@@ -187,8 +253,8 @@ class CycleExecutor:
                     )
                     filtered = before_count - len(new_percepts)
                     if filtered > 0:
-                        logger.debug(f"🔍 Percept dedup: filtered {filtered}/{before_count} duplicates")
-                    subsystem_timings['percept_dedup'] = (time.time() - step_start) * 1000
+                        logger.debug("🔍 Percept dedup: filtered %d/%d duplicates", filtered, before_count)
+                    subsystem_timings['percept_dedup'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                     self._record_ok('percept_dedup')
                 else:
                     subsystem_timings['percept_dedup'] = 0.0
@@ -203,14 +269,14 @@ class CycleExecutor:
         if self._should_run('iwmt_update'):
             try:
                 if hasattr(self.subsystems, 'iwmt_core') and self.subsystems.iwmt_core and new_percepts:
-                    step_start = time.time()
+                    step_start = time.perf_counter_ns()
                     for percept in new_percepts:
                         error = self.subsystems.iwmt_core.world_model.update_on_percept(percept)
                         if error:
                             self._current_prediction_errors.append(error)
-                    subsystem_timings['iwmt_update'] = (time.time() - step_start) * 1000
+                    subsystem_timings['iwmt_update'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                     if self._current_prediction_errors:
-                        logger.debug(f"🔮 IWMT: {len(self._current_prediction_errors)} prediction errors detected")
+                        logger.debug("🔮 IWMT: %d prediction errors detected", len(self._current_prediction_errors))
                 self._record_ok('iwmt_update')
             except Exception as e:
                 logger.error(f"IWMT update step failed: {e}", exc_info=True)
@@ -219,12 +285,13 @@ class CycleExecutor:
         else:
             subsystem_timings['iwmt_update'] = 0.0
 
-        # 2. MEMORY RETRIEVAL: Check for memory retrieval goals
-        if self._should_run('memory_retrieval'):
+        # 2. MEMORY RETRIEVAL: Merge memory percepts fetched alongside perception
+        if run_memory:
             try:
-                step_start = time.time()
-                new_percepts.extend(await self._retrieve_memories())
-                subsystem_timings['memory_retrieval'] = (time.time() - step_start) * 1000
+                if isinstance(memory_result, BaseException):
+                    raise memory_result
+                memory_percepts, subsystem_timings['memory_retrieval'] = memory_result
+                new_percepts.extend(memory_percepts)
                 self._record_ok('memory_retrieval')
             except Exception as e:
                 logger.error(f"Memory retrieval step failed: {e}", exc_info=True)
@@ -236,7 +303,7 @@ class CycleExecutor:
         # 3. ATTENTION: Select for conscious awareness (with IWMT precision weighting)
         if self._should_run('attention'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 # Get emotional state for precision weighting
                 emotional_state = self.subsystems.affect.get_state()
                 # Pass prediction context for IWMT precision-weighted attention
@@ -245,7 +312,7 @@ class CycleExecutor:
                     emotional_state=emotional_state,
                     prediction_errors=self._current_prediction_errors
                 )
-                subsystem_timings['attention'] = (time.time() - step_start) * 1000
+                subsystem_timings['attention'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('attention')
             except Exception as e:
                 logger.error(f"Attention step failed: {e}", exc_info=True)
@@ -259,7 +326,7 @@ class CycleExecutor:
         # 4. AFFECT: Update emotional state and get processing parameters
         if self._should_run('affect'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
 
                 # Apply time passage effects if temporal grounding is available
                 if hasattr(self.subsystems, 'temporal_grounding'):
@@ -285,22 +352,23 @@ class CycleExecutor:
                         self.subsystems.affect.arousal = updated_state["emotions"]["arousal"]
                         self.subsystems.affect.dominance = updated_state["emotions"]["dominance"]
 
-                affect_update = self.subsystems.affect.compute_update(self.state.workspace.broadcast())
+                affect_update = self.subsystems.affect.compute_update(self._snapshot())
 
                 # Log emotional modulation parameters for tracking
                 if hasattr(self.subsystems.affect, 'get_processing_params'):
                     processing_params = self.subsystems.affect.get_processing_params()
                     logger.debug(
-                        f"Emotional modulation active: "
-                        f"V={processing_params.valence_level:.2f} "
-                        f"A={processing_params.arousal_level:.2f} "
-                        f"D={processing_params.dominance_level:.2f} → "
-                        f"iters={processing_params.attention_iterations} "
-                        f"thresh={processing_params.ignition_threshold:.2f} "
-                        f"decision={processing_params.decision_threshold:.2f}"
+                        "Emotional modulation active: V=%.2f A=%.2f D=%.2f → "
+                        "iters=%s thresh=%.2f decision=%.2f",
+                        processing_params.valence_level,
+                        processing_params.arousal_level,
+                        processing_params.dominance_level,
+                        processing_params.attention_iterations,
+                        processing_params.ignition_threshold,
+                        processing_params.decision_threshold,
                     )
 
-                subsystem_timings['affect'] = (time.time() - step_start) * 1000
+                subsystem_timings['affect'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('affect')
             except Exception as e:
                 logger.error(f"Affect step failed: {e}", exc_info=True)
@@ -314,9 +382,9 @@ class CycleExecutor:
         # 4.5 GOAL DYNAMICS: Adjust goal priorities based on staleness, deadlines, emotion
         if self._should_run('goal_dynamics'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 self._adjust_goal_priorities()
-                subsystem_timings['goal_dynamics'] = (time.time() - step_start) * 1000
+                subsystem_timings['goal_dynamics'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('goal_dynamics')
             except Exception as e:
                 logger.error(f"Goal dynamics step failed: {e}", exc_info=True)
@@ -328,14 +396,14 @@ class CycleExecutor:
         # 5. ACTION: Decide what to do and execute
         if self._should_run('action'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 await self._execute_actions()
 
                 # Record action time if we have temporal grounding
                 if self._has_temporal_grounding():
                     self.subsystems.temporal_grounding.record_action()
 
-                subsystem_timings['action'] = (time.time() - step_start) * 1000
+                subsystem_timings['action'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('action')
             except Exception as e:
                 logger.error(f"Action step failed: {e}", exc_info=True)
@@ -343,13 +411,15 @@ class CycleExecutor:
                 self._record_err('action', e)
         else:
             subsystem_timings['action'] = 0.0
+        # Actions may complete goals or record metadata
+        self._invalidate_snapshot()
 
         # 6. META-COGNITION: Introspect
         if self._should_run('meta_cognition'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 meta_percepts = await self._run_meta_cognition()
-                subsystem_timings['meta_cognition'] = (time.time() - step_start) * 1000
+                subsystem_timings['meta_cognition'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('meta_cognition')
             except Exception as e:
                 logger.error(f"Meta-cognition step failed: {e}", exc_info=True)
@@ -363,9 +433,9 @@ class CycleExecutor:
         # 6.5 COMMUNICATION DRIVES: Compute internal urges to communicate
         if self._should_run('communication_drives'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 await self._compute_communication_drives()
-                subsystem_timings['communication_drives'] = (time.time() - step_start) * 1000
+                subsystem_timings['communication_drives'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('communication_drives')
             except Exception as e:
                 logger.error(f"Communication drives step failed: {e}", exc_info=True)
@@ -377,9 +447,9 @@ class CycleExecutor:
         # 6.6 INTERRUPTION CHECK: Evaluate urgent mid-turn interruption
         if self._should_run('interruption_check'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 await self._check_interruption()
-                subsystem_timings['interruption_check'] = (time.time() - step_start) * 1000
+                subsystem_timings['interruption_check'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('interruption_check')
             except Exception as e:
                 logger.error(f"Interruption check step failed: {e}", exc_info=True)
@@ -391,9 +461,9 @@ class CycleExecutor:
         # 6.7 COMMUNICATION DECISION: Evaluate SPEAK/SILENCE/DEFER from drives + inhibitions
         if self._should_run('communication_decision'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 await self._evaluate_communication_decision()
-                subsystem_timings['communication_decision'] = (time.time() - step_start) * 1000
+                subsystem_timings['communication_decision'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('communication_decision')
             except Exception as e:
                 logger.error(f"Communication decision step failed: {e}", exc_info=True)
@@ -405,9 +475,9 @@ class CycleExecutor:
         # 7. AUTONOMOUS INITIATION: Check for autonomous speech triggers
         if self._should_run('autonomous_initiation'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 await self._check_autonomous_triggers()
-                subsystem_timings['autonomous_initiation'] = (time.time() - step_start) * 1000
+                subsystem_timings['autonomous_initiation'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('autonomous_initiation')
             except Exception as e:
                 logger.error(f"Autonomous initiation step failed: {e}", exc_info=True)
@@ -418,20 +488,21 @@ class CycleExecutor:
 
         # 8. WORKSPACE UPDATE: Integrate everything (CRITICAL — always attempted)
         try:
-            step_start = time.time()
+            step_start = time.perf_counter_ns()
             self._update_workspace(attended, affect_update, meta_percepts)
-            subsystem_timings['workspace_update'] = (time.time() - step_start) * 1000
+            subsystem_timings['workspace_update'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
             self._record_ok('workspace_update')
         except Exception as e:
             logger.error(f"Workspace update step failed: {e}", exc_info=True)
             subsystem_timings['workspace_update'] = 0.0
             self._record_err('workspace_update', e)
+        self._invalidate_snapshot()
 
         # 9. MEMORY CONSOLIDATION: Commit workspace to long-term memory
         if self._should_run('memory_consolidation'):
             try:
-                step_start = time.time()
-                await self.subsystems.memory.consolidate(self.state.workspace.broadcast())
+                step_start = time.perf_counter_ns()
+                await self.subsystems.memory.consolidate(self._snapshot())
 
                 # 9.1 Cross-memory association detection (after consolidation)
                 consolidated_id = getattr(self.subsystems.memory, 'last_consolidated_id', None)
@@ -443,9 +514,9 @@ class CycleExecutor:
                         )
                         self.subsystems.memory.last_consolidated_id = None  # consume
                     except Exception as assoc_err:
-                        logger.debug(f"Association detection failed (non-critical): {assoc_err}")
+                        logger.debug("Association detection failed (non-critical): %s", assoc_err)
 
-                subsystem_timings['memory_consolidation'] = (time.time() - step_start) * 1000
+                subsystem_timings['memory_consolidation'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('memory_consolidation')
             except Exception as e:
                 logger.error(f"Memory consolidation step failed: {e}", exc_info=True)
@@ -457,9 +528,9 @@ class CycleExecutor:
         # 9.5. BOTTLENECK DETECTION: Monitor cognitive load
         if self._should_run('bottleneck_detection'):
             try:
-                step_start = time.time()
+                step_start = time.perf_counter_ns()
                 await self._update_bottleneck_detection(subsystem_timings)
-                subsystem_timings['bottleneck_detection'] = (time.time() - step_start) * 1000
+                subsystem_timings['bottleneck_detection'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                 self._record_ok('bottleneck_detection')
             except Exception as e:
                 logger.error(f"Bottleneck detection step failed: {e}", exc_info=True)
@@ -473,7 +544,7 @@ class CycleExecutor:
         if self.state.workspace.cycle_count % 100 == 0:
             if self._should_run('identity_update'):
                 try:
-                    step_start = time.time()
+                    step_start = time.perf_counter_ns()
                     if hasattr(self.subsystems, 'identity_manager'):
                         self.subsystems.identity_manager.update(
                             memory_system=self.subsystems.memory,
@@ -481,7 +552,7 @@ class CycleExecutor:
                             emotion_system=self.subsystems.affect
                         )
                         logger.debug("Identity recomputed from system state")
-                    subsystem_timings['identity_update'] = (time.time() - step_start) * 1000
+                    subsystem_timings['identity_update'] = (time.perf_counter_ns() - step_start) / _NS_PER_MS
                     self._record_ok('identity_update')
                 except Exception as e:
                     logger.error(f"Identity update failed: {e}", exc_info=True)
@@ -490,6 +561,8 @@ class CycleExecutor:
             else:
                 subsystem_timings['identity_update'] = 0.0
 
+        self._invalidate_snapshot()
+
         # Update timing metrics so total_cycles is tracked even when
         # execute_cycle() is called directly (not through CognitiveLoop)
         if self.timing is not None:
@@ -510,11 +583,12 @@ class CycleExecutor:
             List of memory percepts
         """
         self._cycles_since_emotion_retrieval += 1
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
 
-        # Check for explicit retrieval goals
+        # Check for explicit retrieval goals (Goal.type is always a validated
+        # GoalType member, so identity comparison is safe)
         has_retrieval_goal = any(
-            g.type == GoalType.RETRIEVE_MEMORY for g in snapshot.goals
+            g.type is GoalType.RETRIEVE_MEMORY for g in snapshot.goals
         )
 
         # Check for emotion-triggered retrieval
@@ -529,8 +603,9 @@ class CycleExecutor:
                 emotion_triggered = True
                 self._cycles_since_emotion_retrieval = 0
                 logger.debug(
-                    f"💾 Emotion-triggered memory retrieval: "
-                    f"arousal={arousal:.2f}, valence={valence:.2f}, intensity={intensity:.2f}"
+                    "💾 Emotion-triggered memory retrieval: "
+                    "arousal=%.2f, valence=%.2f, intensity=%.2f",
+                    arousal, valence, intensity
                 )
 
         if has_retrieval_goal or emotion_triggered:
@@ -564,16 +639,18 @@ class CycleExecutor:
             emotional_state=emotional_state,
         )
 
+        if adjustments:
+            self._invalidate_snapshot()
         for adj in adjustments:
             self.state.workspace.update_goal_priority(adj.goal_id, adj.new_priority)
             logger.debug(
-                f"🎯 Goal priority adjusted: {adj.goal_id[:8]}... "
-                f"{adj.old_priority:.3f} → {adj.new_priority:.3f} ({adj.reason})"
+                "🎯 Goal priority adjusted: %.8s... %.3f → %.3f (%s)",
+                adj.goal_id, adj.old_priority, adj.new_priority, adj.reason
             )
 
     async def _execute_actions(self) -> None:
         """Decide on actions and execute them."""
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
         actions = self.subsystems.action.decide(snapshot)
         
         # Record prediction before action execution (Phase 4.3)
@@ -581,28 +658,37 @@ class CycleExecutor:
         if self.subsystems.meta_cognition and actions:
             prediction_id = self._record_action_prediction(snapshot, actions)
         
+        # Outcomes of one decision share a single timestamp
+        decided_at = datetime.now().isoformat() if actions else None
+        
         # Execute immediate actions
+        outcomes = []
         for action in actions:
             # Check if this is a tool call and handle specially
-            if action.type == ActionType.TOOL_CALL:
+            if action.type is ActionType.TOOL_CALL:
                 tool_percept = await self.action_executor.execute_tool(action)
                 if tool_percept:
                     self.state.add_pending_tool_percept(tool_percept)
             else:
-                await self.action_executor.execute(action)
+                await self.action_executor.execute(action, snapshot)
             
             # Extract action outcome for self-model update
-            actual_outcome = self.action_executor.extract_outcome(action)
-            
-            # Update self-model based on action execution
-            self.subsystems.meta_cognition.update_self_model(snapshot, actual_outcome)
+            actual_outcome = self.action_executor.extract_outcome(action, decided_at)
+            outcomes.append(actual_outcome)
             
-            # Validate prediction after action execution (Phase 4.3)
+            # Validate prediction after action execution (Phase 4.3). The
+            # prediction covers the cycle's first action, so it is validated
+            # once; later actions would only re-read the settled record.
             if prediction_id and actual_outcome:
                 self._validate_action_prediction(prediction_id, action, actual_outcome)
+                prediction_id = None
             
             # Update IWMT world model with action outcome
             self._update_iwmt_from_action(action, actual_outcome)
+        
+        # Update self-model once for every action executed against this snapshot
+        if outcomes:
+            self.subsystems.meta_cognition.update_self_model_batch(snapshot, outcomes)
     
     def _record_action_prediction(self, snapshot, actions) -> Optional[str]:
         """Record prediction about action outcome."""
@@ -619,7 +705,7 @@ class CycleExecutor:
                 },
                 confidence=predicted_outcome.get("confidence", 0.5),
                 context={
-                    "cycle": self.state.workspace.cycle_count if hasattr(self.state.workspace, 'cycle_count') else 0,
+                    "cycle": snapshot.cycle_count,
                     "goal_count": len(snapshot.goals),
                     "emotion_valence": snapshot.emotions.get("valence", 0.0)
                 }
@@ -647,20 +733,22 @@ class CycleExecutor:
         Returns:
             List of meta-percepts
         """
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
         meta_percepts = self.subsystems.meta_cognition.observe(snapshot)
         
         # Auto-validate pending predictions (Phase 4.3)
         auto_validated = self.subsystems.meta_cognition.auto_validate_predictions(snapshot)
         if auto_validated:
-            logger.debug(f"🔍 Auto-validated {len(auto_validated)} predictions")
+            logger.debug("🔍 Auto-validated %d predictions", len(auto_validated))
         
         # Record significant observations to journal
+        observations = []
         for percept in meta_percepts:
-            if hasattr(percept, 'raw') and isinstance(percept.raw, dict):
-                percept_type = percept.raw.get("type")
-                if percept_type in ["self_model_update", "behavioral_inconsistency", "existential_question"]:
-                    self.subsystems.introspective_journal.record_observation(percept.raw)
+            raw = getattr(percept, 'raw', None)
+            if isinstance(raw, dict) and raw.get("type") in _JOURNAL_PERCEPT_TYPES:
+                observations.append(raw)
+        if observations:
+            self.subsystems.introspective_journal.record_observations(observations)
 
         # Identity consistency check (every 50 cycles)
         if self.state.workspace.cycle_count % 50 == 0:
@@ -670,19 +758,42 @@ class CycleExecutor:
                     meta_percepts.append(consistency_percept)
                     logger.info("🪞 Identity consistency check generated a percept")
             except Exception as e:
-                logger.debug(f"Identity consistency check failed (non-critical): {e}")
+                logger.debug("Identity consistency check failed (non-critical): %s", e)
 
         return meta_percepts
     
     async def _check_autonomous_triggers(self) -> None:
         """Check for autonomous speech triggers and add goals if needed."""
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
+
+        # Skip the check while a recent "no trigger" result still applies
+        if self._autonomous_check_ttl > 0:
+            key = self._autonomous_fingerprint(snapshot)
+            if key == self._autonomous_quiet_key and time.monotonic() < self._autonomous_quiet_until:
+                return
+
         autonomous_goal = self.subsystems.autonomous.check_for_autonomous_triggers(snapshot)
         
-        if autonomous_goal:
+        if not autonomous_goal:
+            if self._autonomous_check_ttl > 0:
+                self._autonomous_quiet_key = key
+                self._autonomous_quiet_until = time.monotonic() + self._autonomous_check_ttl
+        else:
             # Add high-priority autonomous goal
             self.state.workspace.add_goal(autonomous_goal)
-            logger.info(f"🗣️ Autonomous speech goal added: {autonomous_goal.description}")
+            self._invalidate_snapshot()
+            logger.info(_AUTONOMOUS_GOAL_LOG, autonomous_goal.description)
+
+    @staticmethod
+    def _autonomous_fingerprint(snapshot: WorkspaceSnapshot) -> tuple:
+        """Cheap key over the workspace state the autonomous triggers read."""
+        emotions = snapshot.emotions
+        return (
+            tuple(snapshot.percepts),
+            tuple((g.id, g.progress) for g in snapshot.goals),
+            round(emotions.get("valence", 0.0), 2),
+            round(emotions.get("arousal", 0.0), 2),
+        )
 
     async def _check_interruption(self) -> None:
         """
@@ -695,7 +806,7 @@ class CycleExecutor:
         if not hasattr(self.subsystems, 'interruption'):
             return
 
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
         emotional_state = self.subsystems.affect.get_state()
 
         # Determine if human is currently speaking via rhythm model
@@ -705,7 +816,7 @@ class CycleExecutor:
             if rhythm is not None:
                 from ..communication.rhythm import ConversationPhase
                 rhythm.update_phase()
-                is_human_speaking = rhythm.current_phase == ConversationPhase.HUMAN_SPEAKING
+                is_human_speaking = rhythm.current_phase is ConversationPhase.HUMAN_SPEAKING
 
         urges = []
         if hasattr(self.subsystems, 'communication_drives'):
@@ -734,6 +845,7 @@ class CycleExecutor:
                 }
             )
             self.state.workspace.add_goal(goal)
+            self._invalidate_snapshot()
             self.subsystems.interruption.record_interruption(request)
             logger.info(
                 f"⚡ Interruption triggered: {request.reason.value} "
@@ -753,7 +865,7 @@ class CycleExecutor:
             return
 
         # Skip if there's already a pending user-response or autonomous goal
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
         has_response_goal = any(
             g.type in (GoalType.RESPOND_TO_USER, GoalType.SPEAK_AUTONOMOUS)
             for g in snapshot.goals
@@ -774,7 +886,7 @@ class CycleExecutor:
         )
 
         from ..communication import CommunicationDecision
-        if result.decision == CommunicationDecision.SPEAK:
+        if result.decision is CommunicationDecision.SPEAK:
             # Build metadata from the winning urge
             metadata = {"trigger": "communication_drive", "autonomous": True}
             description = "Proactive communication"
@@ -794,7 +906,8 @@ class CycleExecutor:
                 metadata=metadata
             )
             self.state.workspace.add_goal(goal)
-            logger.info(f"💬 Communication decision SPEAK → goal added: {description[:60]}")
+            self._invalidate_snapshot()
+            logger.info(_SPEAK_DECISION_LOG, description)
 
     async def _compute_communication_drives(self) -> None:
         """
@@ -807,7 +920,7 @@ class CycleExecutor:
             return
         
         # Get required state once (avoid multiple calls)
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
         emotional_state = self.subsystems.affect.get_state()
         goals = list(self.state.workspace.current_goals)
         memories = getattr(self.state.workspace, 'attended_memories', [])
@@ -820,13 +933,16 @@ class CycleExecutor:
             memories=memories
         )
         
-        # Log only if new urges generated (reduce log spam)
-        if new_urges:
+        # Log only if new urges generated (reduce log spam); the summary is
+        # built purely for the log line, so skip it when DEBUG is off
+        if new_urges and logger.isEnabledFor(logging.DEBUG):
             summary = self.subsystems.communication_drives.get_drive_summary()
+            strongest = summary['strongest_urge']
             logger.debug(
-                f"💬 Drives: total={summary['total_drive']:.2f}, "
-                f"active={summary['active_urges']}, "
-                f"strongest={summary['strongest_urge'].drive_type.value if summary['strongest_urge'] else 'none'}"
+                "💬 Drives: total=%.2f, active=%s, strongest=%s",
+                summary['total_drive'],
+                summary['active_urges'],
+                strongest.drive_type.value if strongest else 'none'
             )
     
     def _update_workspace(self, attended: list, affect_update: dict, meta_percepts: list) -> None:
@@ -838,20 +954,10 @@ class CycleExecutor:
             affect_update: Affect update dict
             meta_percepts: List of meta-cognition percepts
         """
-        updates = []
-        
-        # Add attended percepts
-        for percept in attended:
-            updates.append({'type': 'percept', 'data': percept})
-        
-        # Add affect update
-        updates.append({'type': 'emotion', 'data': affect_update})
-        
-        # Add meta-percepts
-        for meta_percept in meta_percepts:
-            updates.append({'type': 'percept', 'data': meta_percept})
-        
-        self.state.workspace.update(updates)
+        self.state.workspace.update(
+            percepts=chain(attended, meta_percepts),
+            emotion=affect_update,
+        )
 
     async def _update_bottleneck_detection(self, subsystem_timings: Dict[str, float]) -> None:
         """
@@ -864,7 +970,7 @@ class CycleExecutor:
             return
 
         # Get current metrics
-        snapshot = self.state.workspace.broadcast()
+        snapshot = self._snapshot()
         workspace_percept_count = len(snapshot.percepts)
 
         # Get goal competition metrics if available
@@ -909,7 +1015,7 @@ class CycleExecutor:
             # Log introspective text if available
             introspection_text = self.subsystems.bottleneck_detector.get_introspection_text()
             if introspection_text:
-                logger.info(f"🧠 Bottleneck introspection: {introspection_text[:100]}...")
+                logger.info(_BOTTLENECK_LOG, introspection_text)
 
     def _update_iwmt_from_action(self, action, actual_outcome: Dict[str, Any]) -> None:
         """
@@ -940,7 +1046,7 @@ class CycleExecutor:
             
             # Update world model with action outcome
             iwmt_core.update_from_action_outcome(action_dict, actual_outcome)
-            logger.debug(f"IWMT world model updated for action: {action_dict['type']}")
+            logger.debug("IWMT world model updated for action: %s", action_dict['type'])
             
         except Exception as e:
             # Log but don't fail the cognitive cycle
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Optional
 from pathlib import Path
 from statistics import mean
 
@@ -258,14 +258,34 @@ class LifecycleManager:
             return None
         
         try:
-            metadata = {
-                "auto_save": False,
-                "manual": True,
-            }
-            if label:
-                metadata["user_label"] = label
+            path = self.subsystems.checkpoint_manager.save_checkpoint(
+                self.state.workspace, self._manual_save_metadata(label)
+            )
+            logger.info(f"💾 State saved: {path.name}")
+            return path
+            
+        except Exception as e:
+            logger.error(f"Failed to save state: {e}")
+            return None
+    
+    async def save_state_async(self, label: str = None) -> Path:
+        """
+        Save current workspace state without blocking the event loop on disk I/O.
+        
+        Args:
+            label: Optional user label for the checkpoint
             
-            path = self.subsystems.checkpoint_manager.save_checkpoint(self.state.workspace, metadata)
+        Returns:
+            Path to the saved checkpoint file, or None if checkpointing disabled
+        """
+        if not self.subsystems.checkpoint_manager:
+            logger.warning("Cannot save state: checkpointing disabled")
+            return None
+        
+        try:
+            path = await self.subsystems.checkpoint_manager.save_checkpoint_async(
+                self.state.workspace, self._manual_save_metadata(label)
+            )
             logger.info(f"💾 State saved: {path.name}")
             return path
             
@@ -273,6 +293,17 @@ class LifecycleManager:
             logger.error(f"Failed to save state: {e}")
             return None
     
+    @staticmethod
+    def _manual_save_metadata(label: Optional[str]) -> Dict[str, Any]:
+        """Build checkpoint metadata for a user-requested save."""
+        metadata = {
+            "auto_save": False,
+            "manual": True,
+        }
+        if label:
+            metadata["user_label"] = label
+        return metadata
+    
     def restore_state(self, checkpoint_path: Path) -> bool:
         """
         Restore workspace from checkpoint.
@@ -300,6 +300,7 @@ class SubsystemCoordinator:
                 checkpoint_dir=checkpoint_dir,
                 max_checkpoints=checkpoint_config.get("max_checkpoints", 20),
                 compression=checkpoint_config.get("compression", True),
+                max_write_mb_per_sec=checkpoint_config.get("max_write_mb_per_sec"),
             )
             logger.info(f"💾 Checkpoint manager enabled: {checkpoint_dir}")
         else:
@@ -18,12 +18,30 @@ Key Principles:
 from __future__ import annotations
 
 import logging
+import re
+import time
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Optional Numba JIT for the scalar modulation kernel
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Pass-through stand-in for ``numba.njit`` when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 
 # Constants for modulation ranges
 class ModulationConstants:
@@ -48,9 +66,111 @@ class ModulationConstants:
     
     # Metrics
     MAX_CORRELATION_HISTORY = 100
+    
+    # Parameter cache (emotional state drifts slowly relative to call rate)
+    PARAMS_CACHE_SIZE = 4096
+    PARAMS_CACHE_PRECISION = 2  # Decimal places inputs are rounded to
+
+
+# Numba resolves module globals at compile time but cannot read class
+# attributes, so the kernel below uses these flat copies.
+_ITERATIONS_MIN = ModulationConstants.ATTENTION_ITERATIONS_MIN
+_ITERATIONS_MAX = ModulationConstants.ATTENTION_ITERATIONS_MAX
+_IGNITION_MIN = ModulationConstants.IGNITION_THRESHOLD_MIN
+_IGNITION_MAX = ModulationConstants.IGNITION_THRESHOLD_MAX
+_MEMORY_MIN = ModulationConstants.MEMORY_RETRIEVAL_MIN
+_MEMORY_MAX = ModulationConstants.MEMORY_RETRIEVAL_MAX
+_TIMEOUT_MIN = ModulationConstants.PROCESSING_TIMEOUT_MIN
+_TIMEOUT_MAX = ModulationConstants.PROCESSING_TIMEOUT_MAX
+_DECISION_MIN = ModulationConstants.DECISION_THRESHOLD_MIN
+_DECISION_MAX = ModulationConstants.DECISION_THRESHOLD_MAX
+
+
+@njit(cache=True)
+def _compute_params(arousal: float, dominance: float) -> Tuple[int, float, int, float, float]:
+    """
+    Scalar modulation kernel shared by all EmotionalModulation instances.
+    
+    High arousal = faster, less thorough (fight/flight); low arousal = slower,
+    more deliberate. High dominance = lower confidence threshold (assertive);
+    low dominance = higher threshold (cautious).
+    
+    Both inputs must already lie in [0, 1] (modulate_processing clamps
+    arousal and validates dominance). On that domain the truncated integer
+    parameters land in range by construction and need no clamp; the float
+    ones keep theirs to absorb rounding at the endpoints.
+    
+    Args:
+        arousal: Normalized arousal level (0.0-1.0)
+        dominance: Dominance level (0.0-1.0)
+    
+    Returns:
+        Tuple of (attention_iterations, ignition_threshold, memory_retrieval_limit,
+        processing_timeout, decision_threshold)
+    """
+    # Attention iterations: inverse relationship with arousal
+    attention_iterations = int(_ITERATIONS_MAX - arousal * (_ITERATIONS_MAX - _ITERATIONS_MIN))
+    
+    # Ignition threshold: inverse relationship with arousal
+    ignition_threshold = _IGNITION_MAX - arousal * (_IGNITION_MAX - _IGNITION_MIN)
+    ignition_threshold = max(_IGNITION_MIN, min(_IGNITION_MAX, ignition_threshold))
+    
+    # Memory retrieval limit: inverse relationship with arousal
+    memory_retrieval_limit = int(_MEMORY_MAX - arousal * (_MEMORY_MAX - _MEMORY_MIN))
+    
+    # Processing timeout: inverse relationship with arousal
+    processing_timeout = _TIMEOUT_MAX - arousal * (_TIMEOUT_MAX - _TIMEOUT_MIN)
+    processing_timeout = max(_TIMEOUT_MIN, min(_TIMEOUT_MAX, processing_timeout))
+    
+    # Decision threshold: inverse relationship with dominance
+    decision_threshold = _DECISION_MAX - dominance * (_DECISION_MAX - _DECISION_MIN)
+    decision_threshold = max(_DECISION_MIN, min(_DECISION_MAX, decision_threshold))
+    
+    return (attention_iterations, ignition_threshold, memory_retrieval_limit,
+            processing_timeout, decision_threshold)
 
 
-@dataclass
+# Action categories for valence-based approach/avoidance bias
+APPROACH_ACTION_TYPES = ('speak', 'tool_call', 'commit_memory', 'engage', 'explore', 'create', 'connect')
+AVOIDANCE_ACTION_TYPES = ('wait', 'introspect', 'withdraw', 'defend', 'avoid', 'reject')
+
+# Action class codes used by the vectorized bias path
+ACTION_CLASS_NEUTRAL = 0
+ACTION_CLASS_APPROACH = 1
+ACTION_CLASS_AVOIDANCE = 2
+
+# Direction in which valence moves the priority of each action class
+_VALENCE_DIRECTION = np.array([0.0, 1.0, -1.0])
+
+# One alternation per category so classification is a single C-level scan
+_APPROACH_PATTERN = re.compile('|'.join(map(re.escape, APPROACH_ACTION_TYPES)))
+_AVOIDANCE_PATTERN = re.compile('|'.join(map(re.escape, AVOIDANCE_ACTION_TYPES)))
+
+
+@lru_cache(maxsize=256)
+def _classify_action_type(action_type: str) -> int:
+    """Memoized action-type classification; the set of type names is small."""
+    action_type = action_type.lower()
+    if _APPROACH_PATTERN.search(action_type):
+        return ACTION_CLASS_APPROACH
+    if _AVOIDANCE_PATTERN.search(action_type):
+        return ACTION_CLASS_AVOIDANCE
+    return ACTION_CLASS_NEUTRAL
+
+
+@lru_cache(maxsize=ModulationConstants.PARAMS_CACHE_SIZE)
+def _compute_params_cached(arousal: float, dominance: float) -> Tuple[int, float, int, float, float]:
+    """Memoized _compute_params; callers quantize inputs so trajectories hit the cache."""
+    return _compute_params(arousal, dominance)
+
+
+if HAS_NUMBA:
+    # Compile (or load from the on-disk cache) at import time so the first
+    # cognitive cycle doesn't pay JIT latency.
+    _compute_params(0.0, 0.0)
+
+
+@dataclass(slots=True)
 class ProcessingParams:
     """
     Processing parameters modulated by emotional state.
@@ -65,6 +185,8 @@ class ProcessingParams:
         processing_timeout: Time budget for processing (arousal-modulated)
         decision_threshold: Confidence needed to act (dominance-modulated)
         action_bias_strength: Strength of valence-based action biasing (valence-modulated)
+        timestamp_ns: Creation time in epoch nanoseconds; ``timestamp`` gives
+            it as a datetime
     """
     attention_iterations: int = 7
     ignition_threshold: float = 0.5
@@ -77,7 +199,12 @@ class ProcessingParams:
     arousal_level: float = 0.0
     valence_level: float = 0.0
     dominance_level: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Creation time as a local datetime, built on demand."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for logging/metrics."""
@@ -95,30 +222,113 @@ class ProcessingParams:
         }
 
 
-@dataclass
+# Columns of the correlation ring buffer, one row per modulation
+_CORRELATION_COLUMNS = (
+    'arousal', 'attention_iterations', 'ignition_threshold',
+    'valence', 'action_bias_strength',
+    'dominance', 'decision_threshold',
+)
+_AROUSAL_COLUMNS = [0, 1, 2]
+_VALENCE_COLUMNS = [3, 4]
+_DOMINANCE_COLUMNS = [5, 6]
+
+
+def _correlation_ring() -> np.ndarray:
+    """Preallocated ring buffer holding the most recent correlation rows."""
+    return np.zeros(
+        (ModulationConstants.MAX_CORRELATION_HISTORY, len(_CORRELATION_COLUMNS)),
+        dtype=np.float64
+    )
+
+
+@dataclass(slots=True)
 class ModulationMetrics:
     """
     Metrics for tracking emotional modulation effects.
     
     These metrics verify that emotions are actually modulating processing,
     providing evidence that emotions are functionally real.
+    
+    Emotion/parameter correlations for the most recent
+    MAX_CORRELATION_HISTORY modulations live in one contiguous ring buffer
+    (columns listed in _CORRELATION_COLUMNS); the per-dimension
+    *_correlations properties return chronological column slices of it.
     """
     total_modulations: int = 0
     
     # Arousal effects
     high_arousal_fast_processing: int = 0
     low_arousal_slow_processing: int = 0
-    arousal_attention_correlations: List[tuple] = field(default_factory=list)
     
     # Valence effects
     positive_valence_approach_bias: int = 0
     negative_valence_avoidance_bias: int = 0
-    valence_action_correlations: List[tuple] = field(default_factory=list)
     
     # Dominance effects
     high_dominance_assertive: int = 0
     low_dominance_cautious: int = 0
-    dominance_threshold_correlations: List[tuple] = field(default_factory=list)
+    
+    # Correlation ring buffer: next row to write and number of valid rows
+    _correlations: np.ndarray = field(default_factory=_correlation_ring, init=False, repr=False)
+    _cursor: int = field(default=0, init=False, repr=False)
+    _count: int = field(default=0, init=False, repr=False)
+    
+    def record_correlation(
+        self,
+        arousal: float,
+        params: ProcessingParams,
+        valence: float,
+        dominance: float
+    ) -> None:
+        """Write one modulation's emotion/parameter row, overwriting the oldest when full."""
+        self._correlations[self._cursor] = (
+            arousal, params.attention_iterations, params.ignition_threshold,
+            valence, params.action_bias_strength,
+            dominance, params.decision_threshold,
+        )
+        capacity = len(self._correlations)
+        self._cursor = (self._cursor + 1) % capacity
+        if self._count < capacity:
+            self._count += 1
+    
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare the ring buffer arrays with ==,
+        # which numpy cannot reduce to a bool; compare the counters and the
+        # chronological correlation history instead
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.total_modulations == other.total_modulations
+            and self.high_arousal_fast_processing == other.high_arousal_fast_processing
+            and self.low_arousal_slow_processing == other.low_arousal_slow_processing
+            and self.positive_valence_approach_bias == other.positive_valence_approach_bias
+            and self.negative_valence_avoidance_bias == other.negative_valence_avoidance_bias
+            and self.high_dominance_assertive == other.high_dominance_assertive
+            and self.low_dominance_cautious == other.low_dominance_cautious
+            and np.array_equal(self.correlation_history, other.correlation_history)
+        )
+    
+    @property
+    def correlation_history(self) -> np.ndarray:
+        """Recorded correlation rows, oldest first (shape: count x 7)."""
+        if self._count < len(self._correlations):
+            return self._correlations[:self._count]
+        return np.roll(self._correlations, -self._cursor, axis=0)
+    
+    @property
+    def arousal_attention_correlations(self) -> np.ndarray:
+        """Rows of (arousal, attention_iterations, ignition_threshold)."""
+        return self.correlation_history[:, _AROUSAL_COLUMNS]
+    
+    @property
+    def valence_action_correlations(self) -> np.ndarray:
+        """Rows of (valence, action_bias_strength)."""
+        return self.correlation_history[:, _VALENCE_COLUMNS]
+    
+    @property
+    def dominance_threshold_correlations(self) -> np.ndarray:
+        """Rows of (dominance, decision_threshold)."""
+        return self.correlation_history[:, _DOMINANCE_COLUMNS]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for reporting."""
@@ -127,17 +337,17 @@ class ModulationMetrics:
             'arousal_effects': {
                 'high_arousal_fast': self.high_arousal_fast_processing,
                 'low_arousal_slow': self.low_arousal_slow_processing,
-                'correlations_count': len(self.arousal_attention_correlations)
+                'correlations_count': self._count
             },
             'valence_effects': {
                 'positive_approach': self.positive_valence_approach_bias,
                 'negative_avoidance': self.negative_valence_avoidance_bias,
-                'correlations_count': len(self.valence_action_correlations)
+                'correlations_count': self._count
             },
             'dominance_effects': {
                 'high_assertive': self.high_dominance_assertive,
                 'low_cautious': self.low_dominance_cautious,
-                'correlations_count': len(self.dominance_threshold_correlations)
+                'correlations_count': self._count
             }
         }
 
@@ -183,18 +393,40 @@ class EmotionalModulation:
     
     Attributes:
         enabled: Whether modulation is active (for ablation testing)
+        cache_precision: Decimal places arousal/dominance are rounded to before
+            the cached parameter lookup (None computes exact, uncached values)
+        metrics_sample_every: Record a correlation row for one modulation in
+            this many; effect counters are always exact
         metrics: Tracking metrics for verifying functional effects
         baseline_params: Default processing parameters
     """
     
-    def __init__(self, enabled: bool = True):
+    def __init__(
+        self,
+        enabled: bool = True,
+        cache_precision: Optional[int] = ModulationConstants.PARAMS_CACHE_PRECISION,
+        metrics_sample_every: int = 1
+    ):
         """
         Initialize emotional modulation system.
         
         Args:
             enabled: Whether modulation is active (False for ablation testing)
+            cache_precision: Decimal places for quantized parameter caching;
+                None disables the cache (e.g. for exact ablation comparisons)
+            metrics_sample_every: Correlation sampling interval for
+                high-frequency callers; N > 1 downsamples the correlation
+                history by N (1 records every modulation)
+        
+        Raises:
+            ValueError: If metrics_sample_every is less than 1
         """
+        if metrics_sample_every < 1:
+            raise ValueError(f"metrics_sample_every must be >= 1, got {metrics_sample_every}")
+        
         self.enabled = enabled
+        self.cache_precision = cache_precision
+        self.metrics_sample_every = metrics_sample_every
         self.metrics = ModulationMetrics()
         
         # Baseline processing parameters (neutral emotional state)
@@ -232,13 +464,7 @@ class EmotionalModulation:
         Raises:
             ValueError: If parameters are outside valid ranges
         """
-        # Validate inputs
-        if not -1.0 <= arousal <= 1.0:
-            raise ValueError(f"Arousal must be in [-1, 1], got {arousal}")
-        if not -1.0 <= valence <= 1.0:
-            raise ValueError(f"Valence must be in [-1, 1], got {valence}")
-        if not 0.0 <= dominance <= 1.0:
-            raise ValueError(f"Dominance must be in [0, 1], got {dominance}")
+        self._validate_pad(arousal, valence, dominance)
         
         if not self.enabled:
             # Return baseline parameters (for ablation testing)
@@ -247,111 +473,163 @@ class EmotionalModulation:
         # Ensure arousal is in [0, 1] range (some systems use [-1, 1])
         arousal_normalized = max(0.0, min(1.0, arousal))
         
-        # Apply arousal modulation to processing speed/thoroughness
-        params = self._modulate_arousal(arousal_normalized)
-        
-        # Apply dominance modulation to decision threshold
-        params = self._modulate_dominance(dominance, params)
+        # Arousal shapes processing speed/thoroughness, dominance shapes
+        # the decision threshold
+        (attention_iterations, ignition_threshold, memory_retrieval_limit,
+         processing_timeout, decision_threshold) = self._lookup_params(arousal_normalized, dominance)
         
-        # Store emotional levels for metrics
-        params.arousal_level = arousal_normalized
-        params.valence_level = valence
-        params.dominance_level = dominance
-        params.timestamp = datetime.now()
+        params = ProcessingParams(
+            attention_iterations=attention_iterations,
+            ignition_threshold=ignition_threshold,
+            memory_retrieval_limit=memory_retrieval_limit,
+            processing_timeout=processing_timeout,
+            decision_threshold=decision_threshold,
+            action_bias_strength=0.0,
+            # Store emotional levels for metrics
+            arousal_level=arousal_normalized,
+            valence_level=valence,
+            dominance_level=dominance
+        )
         
         # Update metrics
         self._update_metrics(arousal_normalized, valence, dominance, params)
         
-        logger.debug(
-            f"Emotional modulation: A={arousal_normalized:.2f} V={valence:.2f} D={dominance:.2f} "
-            f"→ iters={params.attention_iterations}, thresh={params.ignition_threshold:.2f}, "
-            f"decision={params.decision_threshold:.2f}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Emotional modulation: A=%.2f V=%.2f D=%.2f → iters=%d, thresh=%.2f, decision=%.2f",
+                arousal_normalized, valence, dominance,
+                attention_iterations, ignition_threshold, decision_threshold
+            )
         
         return params
     
-    def _modulate_arousal(self, arousal: float) -> ProcessingParams:
+    def modulate_processing_tuple(
+        self,
+        arousal: float,
+        valence: float,
+        dominance: float
+    ) -> Tuple[int, float, int, float, float, float]:
         """
-        Modulate processing parameters based on arousal.
+        Numeric-only form of modulate_processing for hot internal callers.
         
-        High arousal = faster, less thorough (fight/flight)
-        Low arousal = slower, more deliberate
+        Returns the same values modulate_processing would, without building a
+        ProcessingParams or recording metrics (use the object form where the
+        call should count as a modulation or be logged).
         
         Args:
-            arousal: Arousal level (0.0-1.0)
+            arousal: Emotional arousal level (-1.0 to 1.0, typically 0.0 to 1.0)
+            valence: Emotional valence (-1.0 to 1.0)
+            dominance: Sense of control/dominance (0.0 to 1.0)
         
         Returns:
-            ProcessingParams with arousal modulation
+            Tuple of (attention_iterations, ignition_threshold,
+            memory_retrieval_limit, processing_timeout, decision_threshold,
+            action_bias_strength)
+            
+        Raises:
+            ValueError: If parameters are outside valid ranges
         """
-        # Attention iterations: inverse relationship with arousal
-        # High arousal → fewer iterations (snap decisions)
-        # Low arousal → more iterations (careful analysis)
-        iterations_range = ModulationConstants.ATTENTION_ITERATIONS_MAX - ModulationConstants.ATTENTION_ITERATIONS_MIN
-        attention_iterations = int(ModulationConstants.ATTENTION_ITERATIONS_MAX - (arousal * iterations_range))
-        attention_iterations = max(ModulationConstants.ATTENTION_ITERATIONS_MIN, 
-                                  min(ModulationConstants.ATTENTION_ITERATIONS_MAX, attention_iterations))
-        
-        # Ignition threshold: inverse relationship with arousal
-        # High arousal → lower threshold (react to more stimuli)
-        # Low arousal → higher threshold (more selective)
-        threshold_range = ModulationConstants.IGNITION_THRESHOLD_MAX - ModulationConstants.IGNITION_THRESHOLD_MIN
-        ignition_threshold = ModulationConstants.IGNITION_THRESHOLD_MAX - (arousal * threshold_range)
-        ignition_threshold = max(ModulationConstants.IGNITION_THRESHOLD_MIN,
-                                min(ModulationConstants.IGNITION_THRESHOLD_MAX, ignition_threshold))
-        
-        # Memory retrieval limit: inverse relationship with arousal
-        # High arousal → fewer memories (less deliberation)
-        # Low arousal → more memories (thorough consideration)
-        memory_range = ModulationConstants.MEMORY_RETRIEVAL_MAX - ModulationConstants.MEMORY_RETRIEVAL_MIN
-        memory_retrieval_limit = int(ModulationConstants.MEMORY_RETRIEVAL_MAX - (arousal * memory_range))
-        memory_retrieval_limit = max(ModulationConstants.MEMORY_RETRIEVAL_MIN,
-                                    min(ModulationConstants.MEMORY_RETRIEVAL_MAX, memory_retrieval_limit))
-        
-        # Processing timeout: inverse relationship with arousal
-        # High arousal → shorter timeout (quick response)
-        # Low arousal → longer timeout (take time to think)
-        timeout_range = ModulationConstants.PROCESSING_TIMEOUT_MAX - ModulationConstants.PROCESSING_TIMEOUT_MIN
-        processing_timeout = ModulationConstants.PROCESSING_TIMEOUT_MAX - (arousal * timeout_range)
-        processing_timeout = max(ModulationConstants.PROCESSING_TIMEOUT_MIN,
-                                min(ModulationConstants.PROCESSING_TIMEOUT_MAX, processing_timeout))
-        
-        return ProcessingParams(
-            attention_iterations=attention_iterations,
-            ignition_threshold=ignition_threshold,
-            memory_retrieval_limit=memory_retrieval_limit,
-            processing_timeout=processing_timeout,
-            decision_threshold=self.baseline_params.decision_threshold,
-            action_bias_strength=0.0
-        )
+        self._validate_pad(arousal, valence, dominance)
+        
+        if not self.enabled:
+            baseline = self.baseline_params
+            return (baseline.attention_iterations, baseline.ignition_threshold,
+                    baseline.memory_retrieval_limit, baseline.processing_timeout,
+                    baseline.decision_threshold, baseline.action_bias_strength)
+        
+        return self._lookup_params(max(0.0, min(1.0, arousal)), dominance) + (0.0,)
+    
+    @staticmethod
+    def _validate_pad(arousal: float, valence: float, dominance: float) -> None:
+        """Raise ValueError if any PAD value is outside its valid range."""
+        if not -1.0 <= arousal <= 1.0:
+            raise ValueError(f"Arousal must be in [-1, 1], got {arousal}")
+        if not -1.0 <= valence <= 1.0:
+            raise ValueError(f"Valence must be in [-1, 1], got {valence}")
+        if not 0.0 <= dominance <= 1.0:
+            raise ValueError(f"Dominance must be in [0, 1], got {dominance}")
+    
+    def _lookup_params(self, arousal: float, dominance: float) -> Tuple[int, float, int, float, float]:
+        """Compute kernel parameters, through the quantized cache when enabled."""
+        precision = self.cache_precision
+        if precision is None:
+            return _compute_params(arousal, dominance)
+        return _compute_params_cached(round(arousal, precision), round(dominance, precision))
     
-    def _modulate_dominance(
+    def modulate_processing_batch(
         self,
-        dominance: float,
-        params: ProcessingParams
-    ) -> ProcessingParams:
+        arousal: np.ndarray,
+        valence: np.ndarray,
+        dominance: np.ndarray
+    ) -> Dict[str, np.ndarray]:
         """
-        Modulate decision threshold based on dominance.
+        Vectorized modulate_processing over arrays of emotional states.
         
-        High dominance = lower confidence threshold (more assertive)
-        Low dominance = higher confidence threshold (more cautious)
+        Intended for evaluating many hypothetical PAD states at once (e.g.
+        planning rollouts). Values match modulate_processing with
+        cache_precision=None element for element, but are returned as one
+        array per parameter instead of a ProcessingParams per state. Metrics
+        are not updated, since the states are hypothetical.
         
         Args:
-            dominance: Dominance level (0.0-1.0)
-            params: ProcessingParams to modify
+            arousal: Arousal levels (-1.0 to 1.0)
+            valence: Valences (-1.0 to 1.0), validated for parity with the
+                scalar API
+            dominance: Dominance levels (0.0 to 1.0)
         
         Returns:
-            Modified ProcessingParams
+            Dict mapping attention_iterations, ignition_threshold,
+            memory_retrieval_limit, processing_timeout and decision_threshold
+            to arrays of the broadcast input shape
+            
+        Raises:
+            ValueError: If any value is outside its valid range
         """
-        # Decision threshold: inverse relationship with dominance
-        # High dominance → lower threshold (act with less certainty)
-        # Low dominance → higher threshold (need more certainty)
-        threshold_range = ModulationConstants.DECISION_THRESHOLD_MAX - ModulationConstants.DECISION_THRESHOLD_MIN
-        decision_threshold = ModulationConstants.DECISION_THRESHOLD_MAX - (dominance * threshold_range)
-        decision_threshold = max(ModulationConstants.DECISION_THRESHOLD_MIN,
-                                min(ModulationConstants.DECISION_THRESHOLD_MAX, decision_threshold))
-        
-        params.decision_threshold = decision_threshold
-        return params
+        arousal = np.asarray(arousal, dtype=np.float64)
+        valence = np.asarray(valence, dtype=np.float64)
+        dominance = np.asarray(dominance, dtype=np.float64)
+        
+        if np.any((arousal < -1.0) | (arousal > 1.0)):
+            raise ValueError("Arousal must be in [-1, 1]")
+        if np.any((valence < -1.0) | (valence > 1.0)):
+            raise ValueError("Valence must be in [-1, 1]")
+        if np.any((dominance < 0.0) | (dominance > 1.0)):
+            raise ValueError("Dominance must be in [0, 1]")
+        
+        shape = np.broadcast_shapes(arousal.shape, valence.shape, dominance.shape)
+        
+        if not self.enabled:
+            baseline = self.baseline_params
+            return {
+                'attention_iterations': np.full(shape, baseline.attention_iterations),
+                'ignition_threshold': np.full(shape, baseline.ignition_threshold),
+                'memory_retrieval_limit': np.full(shape, baseline.memory_retrieval_limit),
+                'processing_timeout': np.full(shape, baseline.processing_timeout),
+                'decision_threshold': np.full(shape, baseline.decision_threshold),
+            }
+        
+        # Same expressions as _compute_params; astype truncates like int()
+        a = np.broadcast_to(np.clip(arousal, 0.0, 1.0), shape)
+        d = np.broadcast_to(dominance, shape)
+        return {
+            'attention_iterations': np.clip(
+                (_ITERATIONS_MAX - a * (_ITERATIONS_MAX - _ITERATIONS_MIN)).astype(np.int64),
+                _ITERATIONS_MIN, _ITERATIONS_MAX
+            ),
+            'ignition_threshold': np.clip(
+                _IGNITION_MAX - a * (_IGNITION_MAX - _IGNITION_MIN), _IGNITION_MIN, _IGNITION_MAX
+            ),
+            'memory_retrieval_limit': np.clip(
+                (_MEMORY_MAX - a * (_MEMORY_MAX - _MEMORY_MIN)).astype(np.int64),
+                _MEMORY_MIN, _MEMORY_MAX
+            ),
+            'processing_timeout': np.clip(
+                _TIMEOUT_MAX - a * (_TIMEOUT_MAX - _TIMEOUT_MIN), _TIMEOUT_MIN, _TIMEOUT_MAX
+            ),
+            'decision_threshold': np.clip(
+                _DECISION_MAX - d * (_DECISION_MAX - _DECISION_MIN), _DECISION_MIN, _DECISION_MAX
+            ),
+        }
     
     def bias_action_selection(
         self,
@@ -377,37 +655,99 @@ class EmotionalModulation:
             # No significant valence, return unchanged
             return actions
         
+        count = len(actions)
+        get_type, get_priority, set_priority = self._action_accessors(actions, action_type_attr)
+        class_codes = np.fromiter(
+            (self.classify_action_type(get_type(action)) for action in actions),
+            dtype=np.int8,
+            count=count
+        )
+        priorities = np.fromiter(
+            (get_priority(action) for action in actions),
+            dtype=np.float64,
+            count=count
+        )
+        
+        biased = self.bias_action_selection_array(priorities, class_codes, valence)
+        
+        # Write back only categorized actions; others keep their priority untouched
+        for index in np.flatnonzero(class_codes):
+            set_priority(actions[index], float(biased[index]))
+        
+        return actions
+    
+    def bias_action_selection_array(
+        self,
+        priorities: np.ndarray,
+        class_codes: np.ndarray,
+        valence: float
+    ) -> np.ndarray:
+        """
+        Vectorized approach/avoidance bias over arrays of action priorities.
+        
+        Approach actions are boosted by positive valence and reduced by negative
+        valence; avoidance actions the reverse. Neutral actions are unchanged.
+        
+        Args:
+            priorities: Action priorities (float array)
+            class_codes: Per-action ACTION_CLASS_* codes (int array, same length)
+            valence: Emotional valence (-1.0 to 1.0)
+        
+        Returns:
+            New array of modulated priorities (the input array is not modified)
+        """
+        priorities = np.asarray(priorities, dtype=np.float64)
+        if not self.enabled or abs(valence) < ModulationConstants.VALENCE_THRESHOLD:
+            return priorities.copy()
+        
         # Bias strength scales with valence magnitude
         bias_strength = abs(valence) * ModulationConstants.VALENCE_BIAS_STRENGTH
+        direction = _VALENCE_DIRECTION[class_codes]
+        
+        biased = np.clip(priorities + direction * (valence * bias_strength), 0.0, 1.0)
+        return np.where(direction != 0.0, biased, priorities)
+    
+    @staticmethod
+    def classify_action_type(action_type: str) -> int:
+        """
+        Classify an action type string as approach, avoidance, or neutral.
         
-        # Define action categories
-        approach_types = {'speak', 'tool_call', 'commit_memory', 'engage', 'explore', 'create', 'connect'}
-        avoidance_types = {'wait', 'introspect', 'withdraw', 'defend', 'avoid', 'reject'}
+        Matching is by substring, so e.g. "speak_autonomous" counts as approach.
+        Approach takes precedence when a type matches both categories.
         
-        for action in actions:
-            action_type_str = self._get_action_type(action, action_type_attr).lower()
-            priority = self._get_action_priority(action)
-            
-            # Determine if this is an approach or avoidance action
-            is_approach = any(atype in action_type_str for atype in approach_types)
-            is_avoidance = any(atype in action_type_str for atype in avoidance_types)
-            
-            if not (is_approach or is_avoidance):
-                continue  # Skip actions that aren't categorized
-            
-            # Calculate new priority based on valence and action type
-            if is_approach:
-                # Approach actions: boosted by positive valence, reduced by negative
-                new_priority = priority + (valence * bias_strength)
-            else:  # is_avoidance
-                # Avoidance actions: reduced by positive valence, boosted by negative
-                new_priority = priority - (valence * bias_strength)
-            
-            # Clamp to valid range and update
-            new_priority = max(0.0, min(1.0, new_priority))
-            self._set_action_priority(action, new_priority)
+        Args:
+            action_type: Action type name
         
-        return actions
+        Returns:
+            One of ACTION_CLASS_APPROACH, ACTION_CLASS_AVOIDANCE, ACTION_CLASS_NEUTRAL
+        """
+        return _classify_action_type(action_type)
+    
+    def _action_accessors(self, actions: List[Any], attr_name: str) -> Tuple[Any, Any, Any]:
+        """
+        Pick (get_type, get_priority, set_priority) for a list of actions.
+        
+        Action lists are normally all dicts or all objects, so the kind is
+        decided once for the whole list; mixed lists use the per-action
+        isinstance helpers.
+        """
+        if all(isinstance(action, dict) for action in actions):
+            return (
+                lambda action: str(action.get(attr_name, '')),
+                lambda action: action.get('priority', 0.5),
+                lambda action, priority: action.__setitem__('priority', priority),
+            )
+        if not any(isinstance(action, dict) for action in actions):
+            return (
+                lambda action: str(getattr(action, attr_name, '')),
+                lambda action: getattr(action, 'priority', 0.5),
+                lambda action, priority: setattr(action, 'priority', priority),
+            )
+        return (
+            lambda action: self._get_action_type(action, attr_name),
+            self._get_action_priority,
+            self._set_action_priority,
+        )
     
     def _get_action_type(self, action: Any, attr_name: str) -> str:
         """Extract action type from action object or dict."""
@@ -460,25 +800,9 @@ class EmotionalModulation:
         elif dominance < 0.3:
             self.metrics.low_dominance_cautious += 1
         
-        # Append correlations (bounded to prevent unbounded growth)
-        self._append_bounded_correlation(
-            self.metrics.arousal_attention_correlations,
-            (arousal, params.attention_iterations, params.ignition_threshold)
-        )
-        self._append_bounded_correlation(
-            self.metrics.valence_action_correlations,
-            (valence, params.action_bias_strength)
-        )
-        self._append_bounded_correlation(
-            self.metrics.dominance_threshold_correlations,
-            (dominance, params.decision_threshold)
-        )
-    
-    def _append_bounded_correlation(self, correlation_list: List[tuple], item: tuple) -> None:
-        """Append item to correlation list, removing oldest if at max size."""
-        correlation_list.append(item)
-        if len(correlation_list) > ModulationConstants.MAX_CORRELATION_HISTORY:
-            correlation_list.pop(0)
+        # Record correlations (ring buffer overwrites the oldest row when full)
+        if self.metrics.total_modulations % self.metrics_sample_every == 0:
+            self.metrics.record_correlation(arousal, params, valence, dominance)
     
     def get_metrics(self) -> Dict[str, Any]:
         """
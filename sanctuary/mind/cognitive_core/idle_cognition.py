@@ -24,7 +24,9 @@ from __future__ import annotations
 
 import logging
 import random
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+import time
+from itertools import islice
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
 
 if TYPE_CHECKING:
@@ -35,6 +37,45 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Seeds for spontaneous reflection
+REFLECTION_PROMPTS = (
+    "What am I currently experiencing?",
+    "How do I feel right now?",
+    "What should I focus on?",
+    "What have I learned recently?",
+    "What patterns do I notice in my behavior?",
+)
+
+# Constant parts of each idle activity percept. Raw templates are copied
+# per percept with the cycle timestamp merged in; metadata templates are
+# passed as-is because Percept validation copies its metadata dict.
+_MEMORY_REVIEW_RAW = {
+    "type": "memory_review_trigger",
+    "prompt": "Review and consolidate recent experiences",
+}
+_MEMORY_REVIEW_META = {"source": "idle_cognition", "activity_type": "memory_review"}
+
+_GOAL_EVALUATION_RAW = {
+    "type": "goal_evaluation_trigger",
+    "prompt": "Evaluate progress on current goals",
+}
+_GOAL_EVALUATION_META = {"source": "idle_cognition", "activity_type": "goal_evaluation"}
+
+_REFLECTION_RAW = {"type": "spontaneous_reflection"}
+_REFLECTION_META = {"source": "idle_cognition", "activity_type": "spontaneous_reflection"}
+
+_TEMPORAL_CHECK_RAW = {
+    "type": "temporal_awareness_check",
+    "prompt": "Check temporal context and time passage",
+}
+_TEMPORAL_CHECK_META = {"source": "idle_cognition", "activity_type": "temporal_awareness"}
+
+_EMOTIONAL_CHECK_RAW = {
+    "type": "emotional_state_check",
+    "prompt": "Monitor and evaluate current emotional state",
+}
+_EMOTIONAL_CHECK_META = {"source": "idle_cognition", "activity_type": "emotional_state"}
+
 
 class IdleCognition:
     """
@@ -57,9 +98,9 @@ class IdleCognition:
     
     Attributes:
         config: Configuration dict with activity probabilities
-        last_memory_review: Timestamp of last memory review
-        last_goal_evaluation: Timestamp of last goal evaluation
-        last_temporal_check: Timestamp of last temporal awareness check
+        last_memory_review: Monotonic time (seconds) of last memory review
+        last_goal_evaluation: Monotonic time (seconds) of last goal evaluation
+        last_temporal_check: Monotonic time (seconds) of last temporal awareness check
         cycle_count: Number of idle cycles executed
         stats: Statistics about idle activities
     """
@@ -91,9 +132,9 @@ class IdleCognition:
         self.goal_evaluation_interval = self.config.get("goal_evaluation_interval", 30.0)  # 30 sec
         
         # State tracking
-        self.last_memory_review: Optional[datetime] = None
-        self.last_goal_evaluation: Optional[datetime] = None
-        self.last_temporal_check: Optional[datetime] = None
+        self.last_memory_review: Optional[float] = None
+        self.last_goal_evaluation: Optional[float] = None
+        self.last_temporal_check: Optional[float] = None
         self.cycle_count = 0
         
         # Statistics
@@ -109,152 +150,145 @@ class IdleCognition:
         logger.info(f"✅ IdleCognition initialized (memory_prob: {self.memory_review_probability}, "
                    f"goal_prob: {self.goal_evaluation_probability})")
     
-    def _create_percept(self, now: datetime, activity_type: str, prompt: str, 
-                       complexity: int, extra_raw: Optional[Dict] = None, 
-                       extra_meta: Optional[Dict] = None) -> Percept:
+    def _create_percept(self, raw_data: Dict[str, Any], metadata: Dict[str, Any],
+                       complexity: int) -> Percept:
         """
         Create an idle activity percept.
         
         Args:
-            now: Current timestamp
-            activity_type: Type of activity
-            prompt: Activity prompt/description
+            raw_data: Activity payload (type, prompt, triggered_at, extras)
+            metadata: Activity metadata, usually a module-level template
             complexity: Cognitive complexity (1-3)
-            extra_raw: Additional raw data
-            extra_meta: Additional metadata
             
         Returns:
             Percept object for the idle activity
         """
-        raw_data = {
-            "type": activity_type,
-            "prompt": prompt,
-            "triggered_at": now.isoformat()
-        }
-        if extra_raw:
-            raw_data.update(extra_raw)
-        
-        metadata = {
-            "source": "idle_cognition",
-            "activity_type": activity_type.replace("_trigger", "").replace("_check", "")
-        }
-        if extra_meta:
-            metadata.update(extra_meta)
-        
         return Percept(modality="introspection", raw=raw_data, 
                       complexity=complexity, metadata=metadata)
     
-    async def generate_idle_activity(self, workspace: 'GlobalWorkspace') -> List['Percept']:
+    def generate_idle_activity(self, workspace: 'GlobalWorkspace') -> List['Percept']:
         """
         Generate internal percepts during idle time.
         
         Returns:
             List of internal Percept objects representing idle activities
         """
+        # Hot lookups bound once per cycle
+        stats = self.stats
+        create = self._create_percept
+        roll = random.random  # one uniform draw per activity
+        
         self.cycle_count += 1
-        self.stats["total_cycles"] += 1
+        stats["total_cycles"] += 1
         
         activities = []
-        now = datetime.now()
-        
-        # 1. Memory review trigger
-        if self._should_review_memories(now):
-            activities.append(self._create_percept(
-                now, "memory_review_trigger", 
-                "Review and consolidate recent experiences", 
-                2
-            ))
-            self.last_memory_review = now
-            self.stats["memory_reviews"] += 1
-        
-        # 2. Goal evaluation trigger
-        if self._should_evaluate_goals(now):
-            current_goals = workspace.current_goals if hasattr(workspace, 'current_goals') else []
-            activities.append(self._create_percept(
-                now, "goal_evaluation_trigger",
-                "Evaluate progress on current goals",
-                2,
-                extra_raw={"goal_count": len(current_goals)},
-                extra_meta={"goal_ids": [g.id for g in current_goals[:5]]}
-            ))
-            self.last_goal_evaluation = now
-            self.stats["goal_evaluations"] += 1
+        append = activities.append
+        # Interval gates compare monotonic seconds; wall-clock time is only
+        # needed for the ISO stamp in the percept payloads
+        now = time.monotonic()
+        now_iso = datetime.now().isoformat()
         
-        # 3. Spontaneous reflection
-        if random.random() < self.reflection_probability:
-            reflection_prompts = [
-                "What am I currently experiencing?",
-                "How do I feel right now?",
-                "What should I focus on?",
-                "What have I learned recently?",
-                "What patterns do I notice in my behavior?"
-            ]
-            activities.append(self._create_percept(
-                now, "spontaneous_reflection",
-                random.choice(reflection_prompts),
-                3
-            ))
-            self.stats["reflections"] += 1
-        
-        # 4. Temporal awareness check
-        if random.random() < self.temporal_check_probability:
-            activities.append(self._create_percept(
-                now, "temporal_awareness_check",
-                "Check temporal context and time passage",
-                1,
-                extra_raw={"current_time": now.isoformat()}
-            ))
-            self.last_temporal_check = now
-            self.stats["temporal_checks"] += 1
-        
-        # 5. Emotional state monitoring
-        if random.random() < self.emotional_check_probability:
-            activities.append(self._create_percept(
-                now, "emotional_state_check",
-                "Monitor and evaluate current emotional state",
-                2
-            ))
-            self.stats["emotional_checks"] += 1
+        for should_run, raw_template, meta_template, complexity, stat_key, \
+                last_run_attr, extras in self._ACTIVITIES:
+            if not should_run(self, now, roll()):
+                continue
+            
+            raw_data = {**raw_template, "triggered_at": now_iso}
+            metadata = meta_template
+            if extras is not None:
+                extra_raw, extra_meta = extras(self, workspace, now_iso)
+                raw_data.update(extra_raw)
+                if extra_meta:
+                    metadata = {**meta_template, **extra_meta}
+            
+            append(create(raw_data, metadata, complexity))
+            if last_run_attr is not None:
+                setattr(self, last_run_attr, now)
+            stats[stat_key] += 1
         
         return activities
     
-    def _should_review_memories(self, now: datetime) -> bool:
+    def _should_review_memories(self, now: float, roll: float) -> bool:
         """
         Check if we should trigger a memory review.
         
         Args:
-            now: Current timestamp
+            now: Current time.monotonic() reading
+            roll: Uniform random draw in [0, 1) for the probabilistic trigger
             
         Returns:
             True if memory review should be triggered
         """
         # Check minimum interval
-        if self.last_memory_review is not None:
-            elapsed = (now - self.last_memory_review).total_seconds()
-            if elapsed < self.memory_review_interval:
-                return False
+        last = self.last_memory_review
+        if last is not None and now - last < self.memory_review_interval:
+            return False
         
         # Probabilistic trigger
-        return random.random() < self.memory_review_probability
+        return roll < self.memory_review_probability
     
-    def _should_evaluate_goals(self, now: datetime) -> bool:
+    def _should_evaluate_goals(self, now: float, roll: float) -> bool:
         """
         Check if we should trigger a goal evaluation.
         
         Args:
-            now: Current timestamp
+            now: Current time.monotonic() reading
+            roll: Uniform random draw in [0, 1) for the probabilistic trigger
             
         Returns:
             True if goal evaluation should be triggered
         """
         # Check minimum interval
-        if self.last_goal_evaluation is not None:
-            elapsed = (now - self.last_goal_evaluation).total_seconds()
-            if elapsed < self.goal_evaluation_interval:
-                return False
+        last = self.last_goal_evaluation
+        if last is not None and now - last < self.goal_evaluation_interval:
+            return False
         
         # Probabilistic trigger
-        return random.random() < self.goal_evaluation_probability
+        return roll < self.goal_evaluation_probability
+    
+    def _should_reflect(self, now: float, roll: float) -> bool:
+        """Check if we should seed a spontaneous reflection."""
+        return roll < self.reflection_probability
+    
+    def _should_check_time(self, now: float, roll: float) -> bool:
+        """Check if we should run a temporal awareness check."""
+        return roll < self.temporal_check_probability
+    
+    def _should_check_emotions(self, now: float, roll: float) -> bool:
+        """Check if we should monitor the emotional state."""
+        return roll < self.emotional_check_probability
+    
+    def _goal_evaluation_extras(self, workspace: 'GlobalWorkspace',
+                                now_iso: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Goal count and the first few goal ids for a goal evaluation percept."""
+        current_goals = workspace.current_goals if hasattr(workspace, 'current_goals') else []
+        return ({"goal_count": len(current_goals)},
+                {"goal_ids": [g.id for g in islice(current_goals, 5)]})
+    
+    def _reflection_extras(self, workspace: 'GlobalWorkspace',
+                           now_iso: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Pick the seed prompt for a spontaneous reflection percept."""
+        return {"prompt": random.choice(REFLECTION_PROMPTS)}, None
+    
+    def _temporal_check_extras(self, workspace: 'GlobalWorkspace',
+                               now_iso: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Stamp a temporal awareness percept with the current time."""
+        return {"current_time": now_iso}, None
+    
+    # Idle activities in roll order: (trigger check, raw template, metadata
+    # template, complexity, stats key, last-run attribute, payload extras)
+    _ACTIVITIES = (
+        (_should_review_memories, _MEMORY_REVIEW_RAW, _MEMORY_REVIEW_META, 2,
+         "memory_reviews", "last_memory_review", None),
+        (_should_evaluate_goals, _GOAL_EVALUATION_RAW, _GOAL_EVALUATION_META, 2,
+         "goal_evaluations", "last_goal_evaluation", _goal_evaluation_extras),
+        (_should_reflect, _REFLECTION_RAW, _REFLECTION_META, 3,
+         "reflections", None, _reflection_extras),
+        (_should_check_time, _TEMPORAL_CHECK_RAW, _TEMPORAL_CHECK_META, 1,
+         "temporal_checks", "last_temporal_check", _temporal_check_extras),
+        (_should_check_emotions, _EMOTIONAL_CHECK_RAW, _EMOTIONAL_CHECK_META, 2,
+         "emotional_checks", None, None),
+    )
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -263,17 +297,20 @@ class IdleCognition:
         Returns:
             Dict with activity counts and rates
         """
-        stats = dict(self.stats)
+        stats = self.stats
+        if self.cycle_count <= 0:
+            return dict(stats)
         
         # Calculate rates
-        if self.cycle_count > 0:
-            stats["memory_review_rate"] = self.stats["memory_reviews"] / self.cycle_count
-            stats["goal_evaluation_rate"] = self.stats["goal_evaluations"] / self.cycle_count
-            stats["reflection_rate"] = self.stats["reflections"] / self.cycle_count
-            stats["temporal_check_rate"] = self.stats["temporal_checks"] / self.cycle_count
-            stats["emotional_check_rate"] = self.stats["emotional_checks"] / self.cycle_count
-        
-        return stats
+        per_cycle = 1.0 / self.cycle_count
+        return {
+            **stats,
+            "memory_review_rate": stats["memory_reviews"] * per_cycle,
+            "goal_evaluation_rate": stats["goal_evaluations"] * per_cycle,
+            "reflection_rate": stats["reflections"] * per_cycle,
+            "temporal_check_rate": stats["temporal_checks"] * per_cycle,
+            "emotional_check_rate": stats["emotional_checks"] * per_cycle,
+        }
 
 
 __all__ = ['IdleCognition']
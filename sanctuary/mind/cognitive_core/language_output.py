@@ -18,8 +18,9 @@ The language output generator is responsible for:
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
-from typing import AsyncIterator, Callable, Dict, Any, Optional
+from typing import AsyncIterator, Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -30,6 +31,78 @@ from .structured_formats import workspace_snapshot_to_dict
 
 logger = logging.getLogger(__name__)
 
+# Identity used until (or when) no charter file can be loaded
+_DEFAULT_CHARTER = "I am Sanctuary, a cognitive AI system."
+
+# Closing instruction appended to every generation prompt
+_SYSTEM_INSTRUCTION = """# INSTRUCTION
+You are Sanctuary. Based on your identity, current emotional state, active goals, and attended percepts above, generate a natural, authentic response to the user input.
+
+Your response should:
+- Align with your charter and protocols
+- Reflect your current emotional state naturally
+- Address relevant goals
+- Incorporate attended information
+- Be conversational and genuine
+
+Response:"""
+
+# Leading characters of the charter and protocols kept in the prompt
+_CHARTER_PROMPT_CHARS = 500
+_PROTOCOLS_PROMPT_CHARS = 300
+
+# Full generation prompt; filled in one pass by _build_prompt. The goals,
+# percepts and memory slots are either empty or a complete block from the
+# templates below, so sections with nothing in them are left out entirely.
+_PROMPT_TEMPLATE = """{identity}
+# CURRENT EMOTIONAL STATE
+Valence: {valence:.2f} (feeling {emotion_label})
+Arousal: {arousal:.2f}
+Dominance: {dominance:.2f}
+
+Style guidance: {style}
+
+{goals}{percepts}{memory}# USER INPUT
+{user_input}
+
+{instruction}"""
+
+_GOALS_BLOCK = "# ACTIVE GOALS\n{}\n\n"
+_PERCEPTS_BLOCK = "# ATTENDED PERCEPTS\n{}\n\n"
+_MEMORY_BLOCK = "# RECALLED MEMORIES\n{}\n\n"
+
+# Style hints per VAD dimension, indexed by bucket (0 = no hint, 1 = high, 2 = low)
+_VALENCE_HINTS = (None, "Use warm, positive language", "Acknowledge difficulty or concern")
+_AROUSAL_HINTS = (
+    None,
+    "Be energetic and engaged; shorter, punchier sentences",
+    "Be calm and measured; thoughtful pacing",
+)
+_DOMINANCE_HINTS = (
+    None,
+    "Be confident and assertive",
+    "Express uncertainty or humility where appropriate",
+)
+
+# Precomposed guidance for every (valence, arousal, dominance) bucket triple
+_STYLE_GUIDANCE = {
+    (v, a, d): "; ".join(
+        hint for hint in (_VALENCE_HINTS[v], _AROUSAL_HINTS[a], _DOMINANCE_HINTS[d]) if hint
+    ) or "Neutral, balanced tone"
+    for v in range(3) for a in range(3) for d in range(3)
+}
+
+
+def _style_guidance(valence: float, arousal: float, dominance: float) -> str:
+    """Look up the precomposed style guidance for a VAD triple."""
+    # Valence: positive/negative affect; arousal: energy/activation;
+    # dominance: control/agency. Bucket 1 = high, 2 = low, 0 = neither.
+    valence_bucket = 1 if valence > 0.4 else 2 if valence < -0.4 else 0
+    arousal_bucket = 1 if arousal >= 0.7 else 2 if arousal < 0.3 else 0
+    dominance_bucket = 1 if dominance >= 0.7 else 2 if dominance < 0.3 else 0
+    
+    return _STYLE_GUIDANCE[valence_bucket, arousal_bucket, dominance_bucket]
+
 
 class LanguageOutputGenerator:
     """
@@ -60,13 +133,17 @@ class LanguageOutputGenerator:
     structures into language. The actual cognitive processing happens upstream
     in the workspace and subsystems—this just expresses it linguistically.
     
+    Without an identity loader, charter_text and protocols_text hold the
+    default charter and "" until the identity files are read on the first
+    LLM generation; await _ensure_identity_loaded() to read them earlier.
+    
     Attributes:
         llm: LLM client for text generation
         fallback_generator: Template-based generator for LLM failures
         circuit_breaker: Monitors LLM failures and switches to fallback
         config: Configuration dictionary
-        charter_text: Loaded charter content
-        protocols_text: Loaded protocols content
+        charter_text: Charter content (only the prompt prefix when read from file)
+        protocols_text: Protocols content (only the prompt prefix when read from file)
         temperature: LLM generation temperature
         max_tokens: Maximum tokens to generate
         use_fallback_on_error: Whether to use fallback on LLM failure
@@ -103,16 +180,22 @@ class LanguageOutputGenerator:
         self.timeout = self.config.get("timeout", 10.0)
         self.emotional_style_modulation = self.config.get("emotional_style_modulation", True)
         
-        # Load identity (use identity if provided, otherwise load from files)
-        if self.identity and self.identity.charter:
-            self.charter_text = self.identity.charter.full_text
-        else:
-            self.charter_text = self._load_charter()
-            
-        if self.identity and self.identity.protocols:
-            self.protocols_text = self._format_protocols(self.identity.protocols)
-        else:
-            self.protocols_text = self._load_protocols()
+        # Load identity (use identity if provided, otherwise load from files).
+        # File fallbacks are read on first generation, off the event loop,
+        # so constructing the generator inside a running loop never blocks it.
+        self._charter_pending = not (self.identity and self.identity.charter)
+        self._protocols_pending = not (self.identity and self.identity.protocols)
+        self.charter_text = (
+            _DEFAULT_CHARTER if self._charter_pending else self.identity.charter.full_text
+        )
+        self.protocols_text = (
+            "" if self._protocols_pending else self._format_protocols(self.identity.protocols)
+        )
+        self._build_identity_section()
+        
+        # Last prompt built for generation, keyed on the snapshot object,
+        # user input and identity section it was built from
+        self._prompt_cache: Optional[Tuple[WorkspaceSnapshot, str, str, str]] = None
         
         # Generation parameters
         self.temperature = self.config.get("temperature", 0.7)
@@ -149,11 +232,12 @@ class LanguageOutputGenerator:
         
         # Try LLM generation if available and circuit breaker allows
         if self.llm and self.circuit_breaker.can_attempt():
+            await self._ensure_identity_loaded()
             try:
                 response = await self._generate_with_llm(snapshot, context)
                 self.circuit_breaker.record_success()
                 
-                logger.info(f"🗣️ Generated response: {len(response)} chars")
+                logger.info("🗣️ Generated response: %d chars", len(response))
                 return response
                 
             except Exception as e:
@@ -168,7 +252,7 @@ class LanguageOutputGenerator:
         workspace_state = workspace_snapshot_to_dict(snapshot)
         response = self.fallback_generator.generate(workspace_state, context)
         
-        logger.info(f"🗣️ Generated fallback response: {len(response)} chars")
+        logger.info("🗣️ Generated fallback response: %d chars", len(response))
         return response
     
     async def generate_stream(
@@ -194,8 +278,9 @@ class LanguageOutputGenerator:
         context = context or {}
 
         if self.llm and self.circuit_breaker.can_attempt():
+            await self._ensure_identity_loaded()
             try:
-                prompt = self._build_prompt(snapshot, context)
+                prompt = self._prompt_for(snapshot, context)
                 chunks: list[str] = []
 
                 async for chunk in self.llm.generate_stream(
@@ -211,7 +296,7 @@ class LanguageOutputGenerator:
                 full_response = "".join(chunks)
                 formatted = self._format_response(full_response)
                 filtered = self._apply_content_filter(formatted)
-                logger.info(f"🗣️ Streamed response: {len(filtered)} chars")
+                logger.info("🗣️ Streamed response: %d chars", len(filtered))
                 return filtered
 
             except Exception as e:
@@ -242,7 +327,7 @@ class LanguageOutputGenerator:
             LLMError: If generation fails
         """
         # Build prompt from workspace state
-        prompt = self._build_prompt(snapshot, context)
+        prompt = self._prompt_for(snapshot, context)
         
         # Call LLM with timeout
         try:
@@ -294,37 +379,70 @@ class LanguageOutputGenerator:
         
         return response
     
+    async def _ensure_identity_loaded(self) -> None:
+        """Read any pending identity files in a worker thread (once)."""
+        if not (self._charter_pending or self._protocols_pending):
+            return
+        charter, protocols = await asyncio.to_thread(self._read_pending_identity)
+        if self._charter_pending:
+            self.charter_text = charter
+            self._charter_pending = False
+        if self._protocols_pending:
+            self.protocols_text = protocols
+            self._protocols_pending = False
+        self._build_identity_section()
+    
+    def _read_pending_identity(self) -> Tuple[Optional[str], Optional[str]]:
+        """Blocking read of the identity files still pending (None for the others)."""
+        charter = self._load_charter() if self._charter_pending else None
+        protocols = self._load_protocols() if self._protocols_pending else None
+        return charter, protocols
+    
+    def _build_identity_section(self) -> None:
+        """Format the prompt identity section (truncated for token efficiency)."""
+        self._identity_section = f"""# IDENTITY
+{self.charter_text[:_CHARTER_PROMPT_CHARS]}
+
+# PROTOCOLS
+{self.protocols_text[:_PROTOCOLS_PROMPT_CHARS]}
+"""
+    
     def _load_charter(self) -> str:
         """
-        Load charter from identity files.
+        Load the charter prefix used in the prompt from identity files.
+        
+        Only the leading characters that reach the prompt are read, so the
+        cost does not grow with the size of the charter file.
         
         Returns:
-            Charter text content, or default if file not found
+            Charter text prefix, or default if file not found
         """
         identity_dir = self.config.get("identity_dir", "data/identity")
         charter_path = Path(identity_dir) / "charter.md"
         
         if charter_path.exists():
             try:
-                return charter_path.read_text()
+                with charter_path.open() as f:
+                    return f.read(_CHARTER_PROMPT_CHARS)
             except Exception as e:
                 logger.warning(f"Failed to load charter: {e}")
                 
-        return "I am Sanctuary, a cognitive AI system."
+        return _DEFAULT_CHARTER
     
     def _load_protocols(self) -> str:
         """
-        Load protocols from identity files.
+        Load the protocols prefix used in the prompt from identity files.
         
         Returns:
-            Protocols text content, or empty string if file not found
+            Protocols text prefix, or empty string if file not found
         """
         identity_dir = self.config.get("identity_dir", "data/identity")
         protocols_path = Path(identity_dir) / "protocols.md"
         
         if protocols_path.exists():
             try:
-                return protocols_path.read_text()
+                with protocols_path.open() as f:
+                    return f.read(_PROTOCOLS_PROMPT_CHARS)
             except Exception as e:
                 logger.warning(f"Failed to load protocols: {e}")
                 
@@ -349,6 +467,24 @@ class LanguageOutputGenerator:
         
         return "\n".join(lines)
     
+    def _prompt_for(self, snapshot: WorkspaceSnapshot, context: Dict) -> str:
+        """
+        Return the generation prompt, reusing the last one when possible.
+        
+        Back-to-back generations on the same (frozen) snapshot, such as a
+        streaming attempt falling back to generate(), skip _build_prompt.
+        The cache holds the snapshot itself, so an identity match can never
+        be a recycled object id.
+        """
+        user_input = context.get("user_input", "")
+        cached = self._prompt_cache
+        if (cached is not None and cached[0] is snapshot
+                and cached[1] == user_input and cached[2] is self._identity_section):
+            return cached[3]
+        prompt = self._build_prompt(snapshot, context)
+        self._prompt_cache = (snapshot, user_input, self._identity_section, prompt)
+        return prompt
+    
     def _build_prompt(self, snapshot: WorkspaceSnapshot, context: Dict) -> str:
         """
         Construct LLM prompt with cognitive context.
@@ -369,96 +505,58 @@ class LanguageOutputGenerator:
             Complete prompt string for LLM
         """
         
-        # Identity section (truncated for token efficiency)
-        identity_section = f"""# IDENTITY
-{self.charter_text[:500]}
-
-# PROTOCOLS
-{self.protocols_text[:300]}
-"""
-        
-        # Emotional state section
+        # Emotional state, read once for both the values and the style
         emotions = snapshot.emotions
-        emotion_label = snapshot.metadata.get("emotion_label", "neutral")
-        emotion_style = self._get_emotion_style_guidance(emotions)
-        
-        emotion_section = f"""# CURRENT EMOTIONAL STATE
-Valence: {emotions.get('valence', 0):.2f} (feeling {emotion_label})
-Arousal: {emotions.get('arousal', 0):.2f}
-Dominance: {emotions.get('dominance', 0):.2f}
-
-Style guidance: {emotion_style}
-"""
-        
-        # Goals section (top 5 by priority)
-        goals_text = "\n".join([
-            f"- [{g.priority:.1f}] {g.description} (progress: {g.progress:.0%})"
-            for g in sorted(snapshot.goals, key=lambda g: g.priority, reverse=True)[:5]
-        ])
-        
-        goals_section = f"""# ACTIVE GOALS
-{goals_text if goals_text else "No active goals"}
-"""
-        
-        # Percepts section (top 5 by attention score)
-        attended_percepts = sorted(
-            snapshot.percepts.values(),
-            key=lambda p: p.metadata.get("attention_score", 0),
-            reverse=True
-        )[:5]
-        
-        percepts_text = "\n".join([
-            f"- [{p.modality}] {self._format_percept(p)}"
-            for p in attended_percepts
-        ])
-        
-        percepts_section = f"""# ATTENDED PERCEPTS
-{percepts_text if percepts_text else "No salient percepts"}
-"""
-        
-        # Memory section (if any memory percepts)
-        memory_percepts = [p for p in attended_percepts if p.modality == "memory"]
+        valence = emotions.get('valence', 0)
+        arousal = emotions.get('arousal', 0)
+        dominance = emotions.get('dominance', 0)
+        
+        # Goals section (top 5 by priority), omitted when there are none
+        goals_section = ""
+        if snapshot.goals:
+            goals_section = _GOALS_BLOCK.format("\n".join([
+                f"- [{g.priority:.1f}] {g.description} (progress: {g.progress:.0%})"
+                for g in heapq.nlargest(5, snapshot.goals, key=lambda g: g.priority)
+            ]))
+        
+        # Percepts section (top 5 by attention score), omitted when empty
+        percepts_section = ""
         memory_section = ""
-        if memory_percepts:
-            memory_text = "\n".join([
-                f"- {p.raw.get('content', '')[:200]}"
-                for p in memory_percepts
-            ])
-            memory_section = f"""# RECALLED MEMORIES
-{memory_text}
-"""
-        
-        # User input (from context)
-        user_input = context.get("user_input", "")
-        user_section = f"""# USER INPUT
-{user_input}
-"""
-        
-        # System instruction
-        system_instruction = """# INSTRUCTION
-You are Sanctuary. Based on your identity, current emotional state, active goals, and attended percepts above, generate a natural, authentic response to the user input.
-
-Your response should:
-- Align with your charter and protocols
-- Reflect your current emotional state naturally
-- Address relevant goals
-- Incorporate attended information
-- Be conversational and genuine
-
-Response:"""
+        if snapshot.percepts:
+            attended_percepts = heapq.nlargest(
+                5,
+                snapshot.percepts.values(),
+                key=lambda p: p.metadata.get("attention_score", 0)
+            )
+            
+            # One pass fills both the percept lines and, for memory
+            # percepts, the recalled-memory lines
+            percept_lines = []
+            memory_lines = []
+            for p in attended_percepts:
+                modality = p.modality
+                percept_lines.append(f"- [{modality}] {self._format_percept(p)}")
+                if modality == "memory":
+                    memory_lines.append(f"- {p.raw.get('content', '')[:200]}")
+            
+            percepts_section = _PERCEPTS_BLOCK.format("\n".join(percept_lines))
+            if memory_lines:
+                memory_section = _MEMORY_BLOCK.format("\n".join(memory_lines))
         
         # Combine all sections
-        full_prompt = "\n".join([
-            identity_section,
-            emotion_section,
-            goals_section,
-            percepts_section,
-            memory_section,
-            user_section,
-            system_instruction
-        ])
-        
-        return full_prompt
+        return _PROMPT_TEMPLATE.format(
+            identity=self._identity_section,
+            valence=valence,
+            arousal=arousal,
+            dominance=dominance,
+            emotion_label=snapshot.metadata.get("emotion_label", "neutral"),
+            style=_style_guidance(valence, arousal, dominance),
+            goals=goals_section,
+            percepts=percepts_section,
+            memory=memory_section,
+            user_input=context.get("user_input", ""),
+            instruction=_SYSTEM_INSTRUCTION,
+        )
     
     def _format_workspace_state(self, snapshot: WorkspaceSnapshot) -> str:
         """
@@ -473,14 +571,14 @@ Response:"""
         Returns:
             Human-readable summary string
         """
-        summary_parts = [
-            f"Goals: {len(snapshot.goals)}",
-            f"Percepts: {len(snapshot.percepts)}",
-            f"Emotions: V={snapshot.emotions.get('valence', 0):.2f} "
-            f"A={snapshot.emotions.get('arousal', 0):.2f} "
-            f"D={snapshot.emotions.get('dominance', 0):.2f}"
-        ]
-        return " | ".join(summary_parts)
+        emotions = snapshot.emotions
+        valence = emotions.get('valence', 0)
+        arousal = emotions.get('arousal', 0)
+        dominance = emotions.get('dominance', 0)
+        return (
+            f"Goals: {len(snapshot.goals)} | Percepts: {len(snapshot.percepts)} | "
+            f"Emotions: V={valence:.2f} A={arousal:.2f} D={dominance:.2f}"
+        )
     
     def _get_emotion_style_guidance(self, emotions: Dict) -> str:
         """
@@ -495,31 +593,11 @@ Response:"""
         Returns:
             Natural language style guidance string
         """
-        valence = emotions.get("valence", 0)
-        arousal = emotions.get("arousal", 0)
-        dominance = emotions.get("dominance", 0)
-        
-        style_hints = []
-        
-        # Valence (positive/negative affect)
-        if valence > 0.4:
-            style_hints.append("Use warm, positive language")
-        elif valence < -0.4:
-            style_hints.append("Acknowledge difficulty or concern")
-        
-        # Arousal (energy/activation)
-        if arousal >= 0.7:
-            style_hints.append("Be energetic and engaged; shorter, punchier sentences")
-        elif arousal < 0.3:
-            style_hints.append("Be calm and measured; thoughtful pacing")
-
-        # Dominance (control/agency)
-        if dominance >= 0.7:
-            style_hints.append("Be confident and assertive")
-        elif dominance < 0.3:
-            style_hints.append("Express uncertainty or humility where appropriate")
-        
-        return "; ".join(style_hints) if style_hints else "Neutral, balanced tone"
+        return _style_guidance(
+            emotions.get("valence", 0),
+            emotions.get("arousal", 0),
+            emotions.get("dominance", 0),
+        )
     
     def _format_percept(self, percept: Percept) -> str:
         """
@@ -563,8 +641,8 @@ Response:"""
         # Remove leading/trailing whitespace
         response = raw_response.strip()
         
-        # Remove "Response:" prefix if present
-        if response.lower().startswith("response:"):
+        # Remove "Response:" prefix if present (lowercase only the prefix)
+        if response[:9].lower() == "response:":
             response = response[9:].strip()
         
         # Remove markdown code blocks if accidentally included
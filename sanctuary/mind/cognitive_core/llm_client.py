@@ -22,12 +22,27 @@ import logging
 import json
 import time
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from collections import deque
 
 logger = logging.getLogger(__name__)
 
 
+def _hf_generate(model, tokenizer, device, prompt: str, **generate_kwargs) -> Tuple[str, int]:
+    """
+    Tokenize, generate and decode with a transformers model in one blocking call.
+
+    Meant to run under asyncio.to_thread so tokenization, the device transfer
+    and decoding stay off the event loop along with generation itself.
+
+    Returns:
+        Tuple of (decoded text, number of output tokens)
+    """
+    inputs = tokenizer(prompt, return_tensors="pt").to(device)
+    outputs = model.generate(**inputs, **generate_kwargs)
+    return tokenizer.decode(outputs[0], skip_special_tokens=True), len(outputs[0])
+
+
 class LLMClient(ABC):
     """
     Abstract base class for LLM clients.
@@ -355,14 +370,14 @@ class GemmaClient(LLMClient):
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
         
         try:
-            # Tokenize input
-            inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
-            
-            # Generate with timeout
-            outputs = await asyncio.wait_for(
+            # Tokenize, generate and decode on a worker thread, with timeout
+            response, token_count = await asyncio.wait_for(
                 asyncio.to_thread(
-                    self.model.generate,
-                    **inputs,
+                    _hf_generate,
+                    self.model,
+                    self.tokenizer,
+                    self.device,
+                    prompt,
                     max_new_tokens=max_tok,
                     temperature=temp,
                     do_sample=temp > 0,
@@ -371,15 +386,12 @@ class GemmaClient(LLMClient):
                 timeout=self.timeout
             )
             
-            # Decode output
-            response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            
             # Remove prompt from response
             if response.startswith(prompt):
                 response = response[len(prompt):].strip()
             
             latency = time.time() - start_time
-            self._update_metrics(latency, tokens=len(outputs[0]))
+            self._update_metrics(latency, tokens=token_count)
             
             return response
             
@@ -502,14 +514,14 @@ class LlamaClient(LLMClient):
         max_tok = max_tokens if max_tokens is not None else self.max_tokens
         
         try:
-            # Tokenize input
-            inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
-            
-            # Generate with timeout
-            outputs = await asyncio.wait_for(
+            # Tokenize, generate and decode on a worker thread, with timeout
+            response, token_count = await asyncio.wait_for(
                 asyncio.to_thread(
-                    self.model.generate,
-                    **inputs,
+                    _hf_generate,
+                    self.model,
+                    self.tokenizer,
+                    self.device,
+                    prompt,
                     max_new_tokens=max_tok,
                     temperature=temp,
                     do_sample=temp > 0,
@@ -520,15 +532,12 @@ class LlamaClient(LLMClient):
                 timeout=self.timeout
             )
             
-            # Decode output
-            response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-            
             # Remove prompt from response
             if response.startswith(prompt):
                 response = response[len(prompt):].strip()
             
             latency = time.time() - start_time
-            self._update_metrics(latency, tokens=len(outputs[0]))
+            self._update_metrics(latency, tokens=token_count)
             
             return response
             
@@ -327,21 +327,32 @@ class SelfMonitor:
     # Regulation methods
     def update_self_model(self, snapshot: WorkspaceSnapshot, actual_outcome: Dict) -> None:
         """Update internal self-model based on observed behavior."""
-        self._update_call_count += 1
-
-        # Always log the behavior
-        self.behavioral_log.append({
-            "snapshot": {
-                "emotions": snapshot.emotions if isinstance(snapshot.emotions, dict)
-                    else {"valence": 0.0, "arousal": 0.0, "dominance": 0.0},
-                "goal_count": len(snapshot.goals),
-            },
-            "outcome": actual_outcome,
-        })
+        self.update_self_model_batch(snapshot, [actual_outcome])
+
+    def update_self_model_batch(self, snapshot: WorkspaceSnapshot, outcomes: List[Dict]) -> None:
+        """Update the self-model from several outcomes observed against one snapshot."""
+        if not outcomes:
+            return
+
+        # The snapshot summary is shared by every entry logged in this batch
+        snapshot_summary = {
+            "emotions": snapshot.emotions if isinstance(snapshot.emotions, dict)
+                else {"valence": 0.0, "arousal": 0.0, "dominance": 0.0},
+            "goal_count": len(snapshot.goals),
+        }
+
+        for actual_outcome in outcomes:
+            self._update_call_count += 1
+
+            # Always log the behavior
+            self.behavioral_log.append({
+                "snapshot": snapshot_summary,
+                "outcome": actual_outcome,
+            })
 
-        # Respect update frequency gating for capability/limitation updates
-        if self._update_call_count % self.self_model_update_frequency == 0:
-            self.regulator.update_self_model(snapshot, actual_outcome)
+            # Respect update frequency gating for capability/limitation updates
+            if self._update_call_count % self.self_model_update_frequency == 0:
+                self.regulator.update_self_model(snapshot, actual_outcome)
 
         self._sync_stats()
     
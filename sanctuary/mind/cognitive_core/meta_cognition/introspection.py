@@ -87,6 +87,28 @@ class IntrospectiveJournal:
         
         logger.debug(f"📝 Recorded observation: {observation.get('type', 'unknown')}")
     
+    def record_observations(self, observations: List[Dict]) -> None:
+        """
+        Record several meta-cognitive observations with a single journal write.
+        
+        Args:
+            observations: Observation dictionaries, in the order observed
+        """
+        if not observations:
+            return
+        
+        timestamp = datetime.now().isoformat()
+        entries = [
+            {"type": "observation", "timestamp": timestamp, "content": observation}
+            for observation in observations
+        ]
+        
+        # One locked write and flush for the whole batch
+        self.writer.write_entries(entries)
+        self.recent_entries.extend(entries)
+        
+        logger.debug(f"📝 Recorded {len(entries)} observations")
+    
     def record_realization(self, realization: str, confidence: float) -> None:
         """
         Record an insight or realization about self.
@@ -16,6 +16,7 @@ The perception subsystem is responsible for:
 from __future__ import annotations
 
 import logging
+import threading
 import time
 import hashlib
 from typing import Optional, Dict, Any, List, Union
@@ -126,6 +127,8 @@ class PerceptionSubsystem:
         # Cache for embeddings (OrderedDict for LRU)
         self.embedding_cache: OrderedDict[str, List[float]] = OrderedDict()
         self.cache_size = self.config.get("cache_size", 1000)
+        # Guards the cache and stats so encode_text() can run off the loop thread
+        self._encode_lock = threading.Lock()
         
         # Stats tracking
         self.stats = {
@@ -222,6 +225,22 @@ class PerceptionSubsystem:
                 metadata={"error": str(e)}
             )
     
+    def encode_text(self, text: str) -> List[float]:
+        """
+        Encode text to embedding vector, safely from any thread.
+        
+        Shares the embedding cache with the cognitive loop, so callers
+        running in a worker thread (e.g. via ``asyncio.to_thread``) must use
+        this rather than ``_encode_text``.
+        
+        Args:
+            text: Text string to encode
+            
+        Returns:
+            Normalized embedding vector (list of floats)
+        """
+        return self._encode_text(text)
+    
     def _encode_text(self, text: str) -> List[float]:
         """
         Encode text to embedding vector.
@@ -234,6 +253,11 @@ class PerceptionSubsystem:
         Returns:
             Normalized embedding vector (list of floats)
         """
+        with self._encode_lock:
+            return self._encode_text_locked(text)
+    
+    def _encode_text_locked(self, text: str) -> List[float]:
+        """Body of ``_encode_text``; caller must hold ``_encode_lock``."""
         # Generate cache key
         cache_key = hashlib.md5(text.encode()).hexdigest()
         
@@ -1168,7 +1192,8 @@ class PerceptionSubsystem:
     
     def clear_cache(self) -> None:
         """Clear embedding cache. Useful for memory management."""
-        self.embedding_cache.clear()
+        with self._encode_lock:
+            self.embedding_cache.clear()
         logger.info("Embedding cache cleared")
     
     def get_stats(self) -> Dict[str, Any]:
@@ -17,7 +17,7 @@ from __future__ import annotations
 import uuid
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional
 from enum import Enum
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -269,7 +269,13 @@ class GlobalWorkspace:
             temporal_context=dict(self.temporal_context) if self.temporal_context else None,
         )
 
-    def update(self, subsystem_outputs: List[Any]) -> None:
+    def update(
+        self,
+        subsystem_outputs: Iterable[Any] = (),
+        *,
+        percepts: Iterable[Percept] = (),
+        emotion: Optional[Dict[str, float]] = None,
+    ) -> None:
         """
         Integrates new information from subsystems into workspace.
         
@@ -283,6 +289,9 @@ class GlobalWorkspace:
         Args:
             subsystem_outputs: List of outputs from cognitive subsystems
                 Each output should be a dict with 'type' and relevant data
+            percepts: Percepts to admit directly, without wrapping each
+                one in a tagged dict (used by the per-cycle update)
+            emotion: Emotional state update to merge directly
                 
         Example:
             >>> outputs = [
@@ -290,6 +299,7 @@ class GlobalWorkspace:
             ...     {'type': 'emotion', 'data': {'valence': 0.5}},
             ... ]
             >>> workspace.update(outputs)
+            >>> workspace.update(percepts=attended, emotion={'valence': 0.5})
         """
         for output in subsystem_outputs:
             if isinstance(output, dict):
@@ -304,6 +314,12 @@ class GlobalWorkspace:
                     self.emotional_state.update(data)
                 elif output_type == 'memory' and isinstance(data, Memory):
                     self.attended_memories.append(data)
+
+        for percept in percepts:
+            if isinstance(percept, Percept):
+                self.active_percepts[percept.id] = percept
+        if isinstance(emotion, dict):
+            self.emotional_state.update(emotion)
         
         # Update tracking
         self.cycle_count += 1
@@ -129,6 +129,34 @@ class TestSelfModelTracking:
         monitor.update_self_model(snapshot, outcome)
         assert "SPEAK" in monitor.self_model["capabilities"]
     
+    def test_update_self_model_batch(self):
+        """Test that a batch update logs every outcome and honours frequency gating"""
+        workspace = GlobalWorkspace()
+        monitor = SelfMonitor(workspace=workspace, config={"self_model_update_frequency": 2})
+        
+        snapshot = WorkspaceSnapshot(
+            goals=[],
+            percepts={},
+            emotions={"valence": 0.5, "arousal": 0.5, "dominance": 0.5},
+            memories=[],
+            timestamp=datetime.now(),
+            cycle_count=0,
+            metadata={}
+        )
+        
+        monitor.update_self_model_batch(snapshot, [
+            {"action_type": "WAIT", "success": True},
+            {"action_type": "SPEAK", "success": True},
+        ])
+        
+        assert len(monitor.behavioral_log) == 2
+        # Only the second outcome lands on the update boundary
+        assert "WAIT" not in monitor.self_model["capabilities"]
+        assert "SPEAK" in monitor.self_model["capabilities"]
+        
+        monitor.update_self_model_batch(snapshot, [])
+        assert len(monitor.behavioral_log) == 2
+    
     def test_predict_behavior_with_empty_model(self):
         """Test behavior prediction with empty self-model"""
         monitor = SelfMonitor()
@@ -473,6 +501,24 @@ class TestIntrospectiveJournal:
             assert journal.recent_entries[0]["type"] == "observation"
             assert journal.recent_entries[0]["content"] == observation
     
+    def test_record_observations_batch(self):
+        """Test recording several observations in one write"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = IntrospectiveJournal(Path(tmpdir))
+            
+            observations = [
+                {"type": "self_model_update", "description": "first"},
+                {"type": "existential_question", "description": "second"},
+            ]
+            
+            journal.record_observations(observations)
+            journal.record_observations([])
+            
+            assert [e["content"] for e in journal.recent_entries] == observations
+            assert all(e["type"] == "observation" for e in journal.recent_entries)
+            lines = journal.writer.get_current_journal_path().read_text().splitlines()
+            assert len(lines) == 2
+    
     def test_record_realization(self):
         """Test recording a realization"""
         with tempfile.TemporaryDirectory() as tmpdir:
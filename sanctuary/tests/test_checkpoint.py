@@ -229,6 +229,66 @@ class TestCheckpointManager:
             assert checkpoints[1].metadata["label"] == "Second"
             assert checkpoints[2].metadata["label"] == "First"
     
+    def test_list_checkpoints_reuses_unchanged_info(self):
+        """Unchanged checkpoint files are served from the info cache."""
+        with TemporaryDirectory() as tmpdir:
+            checkpoint_dir = Path(tmpdir) / "checkpoints"
+            manager = CheckpointManager(checkpoint_dir=checkpoint_dir)
+            
+            workspace = GlobalWorkspace()
+            manager.save_checkpoint(workspace, metadata={"label": "First"})
+            
+            first = manager.list_checkpoints()
+            second = manager.list_checkpoints()
+            assert second[0] is first[0]
+            
+            # A fresh manager over the same directory sees the same checkpoint
+            other = CheckpointManager(checkpoint_dir=checkpoint_dir)
+            assert other.list_checkpoints()[0].checkpoint_id == first[0].checkpoint_id
+            
+            # Deleted files drop out of the cache
+            manager.delete_checkpoint(first[0].checkpoint_id)
+            assert manager.list_checkpoints() == []
+            assert manager._info_cache == {}
+    
+    def test_checkpoint_info_timestamp_str(self):
+        """Test the cached display timestamp on CheckpointInfo."""
+        info = CheckpointInfo(
+            checkpoint_id="abc",
+            timestamp=datetime(2025, 1, 2, 3, 4, 5),
+            version="1.0",
+            path=Path("checkpoint.json"),
+            size_bytes=0,
+            compressed=False,
+            metadata={},
+            checksum="",
+        )
+        assert info.timestamp_str == "2025-01-02 03:04:05"
+        assert "timestamp_str" in info.__dict__  # Cached after first access
+    
+    def test_find_checkpoints_by_prefix(self):
+        """Test prefix lookup of checkpoint IDs."""
+        with TemporaryDirectory() as tmpdir:
+            checkpoint_dir = Path(tmpdir) / "checkpoints"
+            manager = CheckpointManager(checkpoint_dir=checkpoint_dir)
+            
+            workspace = GlobalWorkspace()
+            manager.save_checkpoint(workspace, metadata={"label": "First"})
+            manager.save_checkpoint(workspace, metadata={"label": "Second"})
+            
+            checkpoints = manager.list_checkpoints()
+            target = checkpoints[0]
+            
+            matches = manager.find_checkpoints_by_prefix(target.checkpoint_id[:8])
+            assert [cp.checkpoint_id for cp in matches] == [target.checkpoint_id]
+            
+            assert len(manager.find_checkpoints_by_prefix("")) == 2
+            assert manager.find_checkpoints_by_prefix("not-a-uuid") == []
+            
+            # Index follows new checkpoints
+            manager.save_checkpoint(workspace, metadata={"label": "Third"})
+            assert len(manager.find_checkpoints_by_prefix("")) == 3
+    
     def test_delete_checkpoint(self):
         """Test deleting a specific checkpoint."""
         with TemporaryDirectory() as tmpdir:
@@ -369,6 +429,131 @@ class TestCheckpointManager:
             # All should be marked as auto-save
             assert all(cp.metadata.get("auto_save", False) for cp in checkpoints)
     
+    @pytest.mark.asyncio
+    async def test_save_checkpoint_async(self):
+        """Test saving a checkpoint with disk I/O off the event loop."""
+        with TemporaryDirectory() as tmpdir:
+            checkpoint_dir = Path(tmpdir) / "checkpoints"
+            manager = CheckpointManager(checkpoint_dir=checkpoint_dir)
+            
+            workspace = GlobalWorkspace()
+            workspace.add_goal(Goal(type=GoalType.LEARN, description="Async save"))
+            
+            path = await manager.save_checkpoint_async(workspace, metadata={"user_label": "async"})
+            
+            assert path.exists()
+            assert not list(checkpoint_dir.glob("*.tmp"))
+            restored = manager.load_checkpoint(path)
+            assert restored.current_goals[0].description == "Async save"
+            assert manager.list_checkpoints()[0].metadata["user_label"] == "async"
+    
+    def test_list_checkpoints_during_write(self):
+        """Test that listing does not wait for a checkpoint write in progress."""
+        import threading
+        from unittest.mock import patch
+        
+        with TemporaryDirectory() as tmpdir:
+            manager = CheckpointManager(checkpoint_dir=Path(tmpdir) / "checkpoints")
+            workspace = GlobalWorkspace()
+            first = manager.save_checkpoint(workspace)
+            
+            # Hold the writer inside its locked section (rotation)
+            in_write = threading.Event()
+            release = threading.Event()
+            rotate = manager._rotate_checkpoints
+            
+            def blocking_rotate():
+                in_write.set()
+                release.wait(5)
+                rotate()
+            
+            with patch.object(manager, "_rotate_checkpoints", side_effect=blocking_rotate):
+                writer = threading.Thread(target=manager.save_checkpoint, args=(workspace,))
+                writer.start()
+                try:
+                    assert in_write.wait(5)
+                    
+                    listed = []
+                    lister = threading.Thread(
+                        target=lambda: listed.append(manager.list_checkpoints())
+                    )
+                    lister.start()
+                    lister.join(2)
+                    assert not lister.is_alive(), "list_checkpoints blocked on the writer"
+                    assert first in [cp.path for cp in listed[0]]
+                    assert manager.find_checkpoints_by_prefix(listed[0][0].checkpoint_id[:8])
+                finally:
+                    release.set()
+                    writer.join(5)
+            
+            assert len(manager.list_checkpoints()) == 2
+    
+    def test_snapshot_detached_from_workspace(self):
+        """Test the checkpoint snapshot does not share state with the live workspace."""
+        with TemporaryDirectory() as tmpdir:
+            manager = CheckpointManager(checkpoint_dir=Path(tmpdir) / "checkpoints")
+            workspace = GlobalWorkspace()
+            metadata = {"user_label": "snapshot"}
+            
+            _, checkpoint = manager._snapshot_checkpoint(workspace, metadata)
+            workspace.emotional_state["valence"] = 0.9
+            metadata["user_label"] = "changed"
+            
+            assert checkpoint["workspace_state"]["emotional_state"]["valence"] != 0.9
+            assert checkpoint["metadata"]["user_label"] == "snapshot"
+    
+    def test_paced_write(self):
+        """Test that write pacing splits large writes into timed chunks."""
+        import io
+        from unittest.mock import patch
+        from mind.cognitive_core import checkpoint as checkpoint_module
+        
+        with TemporaryDirectory() as tmpdir:
+            manager = CheckpointManager(
+                checkpoint_dir=Path(tmpdir) / "checkpoints",
+                max_write_mb_per_sec=4.0,
+            )
+            data = b"x" * (checkpoint_module.WRITE_CHUNK_BYTES * 3)
+            out = io.BytesIO()
+            
+            with patch.object(checkpoint_module.time, "sleep") as mock_sleep:
+                manager._write_paced(out, data)
+            
+            assert out.getvalue() == data
+            assert mock_sleep.call_count == 2
+            mock_sleep.assert_called_with(0.25)
+    
+    def test_paced_write_outside_io_lock(self):
+        """Test that a paced temp-file write does not hold the writer lock."""
+        import threading
+        from unittest.mock import patch
+        
+        with TemporaryDirectory() as tmpdir:
+            manager = CheckpointManager(
+                checkpoint_dir=Path(tmpdir) / "checkpoints",
+                max_write_mb_per_sec=1.0,
+            )
+            lock_free = []
+            
+            def try_lock():
+                acquired = manager._io_lock.acquire(timeout=1)
+                if acquired:
+                    manager._io_lock.release()
+                lock_free.append(acquired)
+            
+            def probe_lock(f, data):
+                # Another thread must be able to take the lock mid-write
+                probe = threading.Thread(target=try_lock)
+                probe.start()
+                probe.join()
+                f.write(data)
+            
+            with patch.object(manager, "_write_paced", side_effect=probe_lock):
+                path = manager.save_checkpoint(GlobalWorkspace())
+            
+            assert lock_free == [True]
+            assert path.exists()
+    
     def test_checksum_validation(self):
         """Test that checksums are calculated and validated."""
         with TemporaryDirectory() as tmpdir:
@@ -6,7 +6,11 @@ Covers:
   - _format_error error categorisation
   - Shutdown timeout in LifecycleManager
   - SanctuaryAPI.start() no longer uses fire-and-forget
+  - SanctuaryAPI.get_metrics() short-lived cache
   - Signal-driven shutdown event
+  - REPL command dispatch table
+  - Semantic response cache
+  - uvloop event loop selection
 """
 
 import asyncio
@@ -34,6 +38,8 @@ class TestParseArgs:
         assert args.auto_save_interval == 300.0
         assert args.cycle_rate == 10.0
         assert args.shutdown_timeout == 30.0
+        assert args.semantic_cache is False
+        assert args.semantic_cache_threshold == 0.85
 
     def test_verbose_short(self):
         from mind.cli import parse_args
@@ -191,6 +197,47 @@ class TestSanctuaryAPIStartAwait:
         assert api._running is True
 
 
+class TestSanctuaryAPIMetricsCache:
+    """Verify get_metrics() reuses results briefly and refreshes after a turn."""
+
+    def _api(self):
+        from mind.client import SanctuaryAPI
+
+        api = SanctuaryAPI.__new__(SanctuaryAPI)
+        api._running = True
+        api._metrics_cache = None
+        api.core = MagicMock()
+        api.core.get_metrics.return_value = {"total_cycles": 1}
+        api.conversation = MagicMock()
+        api.conversation.get_metrics.return_value = {"total_turns": 0}
+        api.conversation.process_turn = AsyncMock()
+        return api
+
+    def test_repeated_calls_reuse_metrics(self):
+        api = self._api()
+        first = api.get_metrics()
+        second = api.get_metrics()
+        assert first is second
+        api.core.get_metrics.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_chat_invalidates_metrics(self):
+        api = self._api()
+        api.get_metrics()
+        await api.chat("hello")
+        api.get_metrics()
+        assert api.core.get_metrics.call_count == 2
+
+    def test_expired_metrics_rebuilt(self):
+        from mind import client
+
+        api = self._api()
+        with patch.object(client.time, "monotonic", side_effect=[100.0, 100.0 + client.METRICS_CACHE_TTL]):
+            api.get_metrics()
+            api.get_metrics()
+        assert api.core.get_metrics.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # 5. Signal-driven shutdown event
 # ---------------------------------------------------------------------------
@@ -242,3 +289,168 @@ class TestCognitiveCoreSsartedFlag:
 
         await core.start()
         assert core._started is True
+
+
+# ---------------------------------------------------------------------------
+# 7. REPL command dispatch table
+# ---------------------------------------------------------------------------
+
+class TestCommandDispatch:
+    """Verify REPL commands resolve through the dispatch tables."""
+
+    def test_exact_commands_registered(self):
+        from mind.cli import _COMMANDS, _handle_help, _handle_restore_latest
+        assert _COMMANDS["help"] is _handle_help
+        assert _COMMANDS["?"] is _handle_help
+        assert _COMMANDS["restore latest"] is _handle_restore_latest
+
+    def test_quit_commands(self):
+        from mind.cli import _COMMANDS, _QUIT_COMMANDS
+        assert _QUIT_COMMANDS == {"quit", "exit"}
+        assert not _QUIT_COMMANDS & _COMMANDS.keys()
+
+    def test_prefix_commands_registered(self):
+        from mind.cli import _PREFIX_COMMANDS
+        assert [prefix for prefix, _ in _PREFIX_COMMANDS] == ["save", "load", "memory"]
+
+    @pytest.mark.asyncio
+    async def test_reset_handler(self, capsys):
+        from mind.cli import _COMMANDS
+        sanctuary = MagicMock()
+        await _COMMANDS["reset"](sanctuary)
+        sanctuary.reset_conversation.assert_called_once()
+        assert "Conversation reset" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_history_handler_single_write(self, capsys):
+        from mind.cli import _COMMANDS
+        sanctuary = MagicMock()
+        sanctuary.get_conversation_history.return_value = [
+            SimpleNamespace(user_input="hi", system_response="hello", response_time=0.5),
+        ]
+        with patch("builtins.print", wraps=print) as mock_print:
+            await _COMMANDS["history"](sanctuary)
+        assert mock_print.call_count == 1
+        out = capsys.readouterr().out
+        assert "1. You: hi" in out
+        assert "(Response time: 0.50s)" in out
+        assert out.endswith("\n\n")
+
+    @pytest.mark.asyncio
+    async def test_metrics_handler_single_write(self, capsys):
+        from mind.cli import _COMMANDS
+        sanctuary = MagicMock()
+        sanctuary.get_metrics.return_value = {
+            "conversation": {"total_turns": 3},
+            "cognitive_core": {"total_cycles": 42},
+        }
+        with patch("builtins.print", wraps=print) as mock_print:
+            await _COMMANDS["metrics"](sanctuary)
+        assert mock_print.call_count == 1
+        out = capsys.readouterr().out
+        assert "Total turns: 3" in out
+        assert "Total cycles: 42" in out
+
+    @pytest.mark.asyncio
+    async def test_restore_latest_runs_restore_off_loop(self):
+        import threading
+        from mind.cli import _COMMANDS
+
+        loop_thread = threading.get_ident()
+        restore_threads = []
+
+        def _restore(path):
+            restore_threads.append(threading.get_ident())
+            return True
+
+        sanctuary = MagicMock()
+        sanctuary.stop = AsyncMock()
+        sanctuary.start = AsyncMock()
+        sanctuary.core.restore_state = _restore
+
+        await _COMMANDS["restore latest"](sanctuary)
+
+        sanctuary.stop.assert_awaited_once()
+        sanctuary.start.assert_awaited_once()
+        assert restore_threads and restore_threads[0] != loop_thread
+
+
+# ---------------------------------------------------------------------------
+# 8. Semantic response cache
+# ---------------------------------------------------------------------------
+
+class TestSemanticCache:
+    """Verify near-duplicate messages reuse cached turns."""
+
+    VECTORS = {
+        "hello": [1.0, 0.0, 0.0],
+        "hello!": [0.95, 0.05, 0.0],
+        "weather": [0.0, 1.0, 0.0],
+        "music": [0.0, 0.0, 1.0],
+    }
+
+    def _cache(self, **kwargs):
+        from mind.cli import _SemanticCache
+        return _SemanticCache(lambda text: self.VECTORS[text], **kwargs)
+
+    def test_hit_on_similar_message(self):
+        cache = self._cache()
+        turn, embedding = cache.lookup("hello")
+        assert turn is None
+        cache.add(embedding, "turn-1")
+        assert cache.lookup("hello!")[0] == "turn-1"
+        assert cache.lookup("weather")[0] is None
+
+    def test_evicts_oldest(self):
+        cache = self._cache(max_entries=2)
+        for text in ("hello", "weather", "music"):
+            _, embedding = cache.lookup(text)
+            cache.add(embedding, text)
+        assert cache.lookup("hello")[0] is None
+        assert cache.lookup("music")[0] == "music"
+
+    def test_clear(self):
+        cache = self._cache()
+        _, embedding = cache.lookup("hello")
+        cache.add(embedding, "turn-1")
+        cache.clear()
+        assert cache.lookup("hello")[0] is None
+
+    def test_cached_turn_rendered_without_stale_stats(self):
+        from mind.cli import _format_turn
+        turn = SimpleNamespace(
+            system_response="Hi there",
+            emotional_state={"valence": 0.5, "arousal": 0.2},
+            response_time=1.25,
+        )
+        fresh = _format_turn(turn)
+        assert "[0.5V 0.2A]" in fresh and "1.25s" in fresh
+        cached = _format_turn(turn, cached=True)
+        assert "[cached]" in cached and "Hi there" in cached
+        assert "0.5V" not in cached and "1.25s" not in cached
+
+
+# ---------------------------------------------------------------------------
+# 9. Event loop selection
+# ---------------------------------------------------------------------------
+
+class TestRunLoop:
+    """run() falls back to the default asyncio loop without uvloop."""
+
+    def test_runs_on_default_loop_without_uvloop(self):
+        import mind.cli as cli
+
+        async def loop_type():
+            return type(asyncio.get_running_loop()).__module__
+
+        with patch.object(cli, "HAS_UVLOOP", False):
+            assert cli.run(loop_type()).startswith("asyncio")
+
+    def test_uses_uvloop_when_available(self):
+        import mind.cli as cli
+
+        fake_uvloop = SimpleNamespace(new_event_loop=MagicMock(side_effect=asyncio.new_event_loop))
+        with patch.object(cli, "HAS_UVLOOP", True), \
+                patch.object(cli, "uvloop", fake_uvloop, create=True):
+            assert cli.run(asyncio.sleep(0, result=7)) == 7
+        fake_uvloop.new_event_loop.assert_called_once()
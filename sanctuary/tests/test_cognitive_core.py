@@ -744,6 +744,21 @@ class TestModuleStructure:
         assert 'AffectSubsystem' in cc.__all__
         assert 'SelfMonitor' in cc.__all__
     
+    def test_cognitive_core_lazy_exports_resolve(self):
+        """Test every name in __all__ resolves through the lazy loader"""
+        import mind.cognitive_core as cc
+        for name in cc.__all__:
+            assert getattr(cc, name) is not None
+        with pytest.raises(AttributeError):
+            cc.NotARealExport
+    
+    def test_lazy_packages_list_exports_in_dir(self):
+        """Test lazily exported names still show up in dir() before first use"""
+        import mind
+        import mind.cognitive_core as cc
+        for module in (mind, cc):
+            assert set(module.__all__) <= set(dir(module))
+    
     def test_interfaces_module_docstring(self):
         """Test interfaces module has proper docstring"""
         import mind.interfaces as li
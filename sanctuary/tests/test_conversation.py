@@ -19,7 +19,7 @@ import asyncio
 import shutil
 import tempfile
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -444,6 +444,71 @@ class TestHistoryTracking:
         assert recent[0].user_input == "Message 7"
         assert recent[2].user_input == "Message 9"
 
+    def test_summarize_aged_turns(self, temp_dirs):
+        """Test that turns older than the summary age collapse into one summary turn."""
+        core = CognitiveCore(config=make_core_config(temp_dirs))
+        manager = ConversationManager(core)
+
+        old = datetime.now() - timedelta(hours=12)
+        for i, text in enumerate(["Tell me about gardens", "What about rivers"]):
+            manager.conversation_history.append(ConversationTurn(
+                user_input=text,
+                system_response=f"Response {i}",
+                timestamp=old + timedelta(minutes=i),
+                response_time=0.5,
+                emotional_state={}
+            ))
+        manager.conversation_history.append(ConversationTurn(
+            user_input="Recent message",
+            system_response="Recent response",
+            timestamp=datetime.now(),
+            response_time=0.5,
+            emotional_state={}
+        ))
+
+        manager._summarize_older_than(timedelta(hours=6), keep_recent=1)
+
+        history = manager.get_conversation_history()
+        assert len(history) == 2
+        summary = history[0]
+        assert summary.metadata["summary"] is True
+        assert summary.metadata["turns_summarized"] == 2
+        assert "gardens" in summary.system_response
+        assert "rivers" in summary.system_response
+        assert history[1].user_input == "Recent message"
+
+        # A lone existing summary is left untouched
+        manager._summarize_older_than(timedelta(hours=6), keep_recent=1)
+        assert manager.get_conversation_history()[0] is summary
+
+    def test_summary_keeps_recent_turns_after_idle_gap(self, temp_dirs):
+        """Test that the newest turns stay verbatim even when all have aged out."""
+        core = CognitiveCore(config=make_core_config(temp_dirs))
+        manager = ConversationManager(core)
+        assert manager.history_summary_age is None  # Off by default
+
+        # Every earlier turn predates a long idle gap
+        old = datetime.now() - timedelta(hours=12)
+        for i in range(5):
+            manager.conversation_history.append(ConversationTurn(
+                user_input=f"Message {i}",
+                system_response=f"Response {i}",
+                timestamp=old + timedelta(minutes=i),
+                response_time=0.5,
+                emotional_state={}
+            ))
+
+        manager._summarize_older_than(timedelta(hours=6), keep_recent=3)
+
+        history = manager.get_conversation_history()
+        assert len(history) == 4
+        assert history[0].metadata["turns_summarized"] == 2
+        assert [t.user_input for t in history[1:]] == ["Message 2", "Message 3", "Message 4"]
+
+        # Fewer turns than keep_recent: nothing is summarized
+        manager._summarize_older_than(timedelta(hours=6), keep_recent=10)
+        assert len(manager.get_conversation_history()) == 4
+
 
 class TestMetrics:
     """Test conversation metrics tracking."""
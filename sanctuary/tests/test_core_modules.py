@@ -343,6 +343,52 @@ class TestActionExecutor:
         outcome = ActionExecutor.extract_outcome(action)
         assert isinstance(outcome, dict)
 
+    def test_extract_outcome_uses_given_timestamp(self):
+        from mind.cognitive_core.core.action_executor import ActionExecutor
+        action = Mock()
+        action.metadata = {}
+        outcome = ActionExecutor.extract_outcome(action, "2026-01-01T00:00:00")
+        assert outcome["timestamp"] == "2026-01-01T00:00:00"
+
+    def test_extract_outcome_reads_status(self):
+        from mind.cognitive_core.action import Action, ActionType
+        from mind.cognitive_core.core.action_executor import ActionExecutor
+        action = Action(type=ActionType.WAIT, reason="idle")
+        outcome = ActionExecutor.extract_outcome(action)
+        assert outcome["success"] is True
+        assert outcome["reason"] == "idle"
+        assert outcome["metadata"] == {}
+
+        failed = Mock(status="error", reason="", metadata=None)
+        outcome = ActionExecutor.extract_outcome(failed)
+        assert outcome["success"] is False
+        assert "metadata" not in outcome
+
+    @pytest.mark.asyncio
+    async def test_execute_dispatches_speak_with_snapshot(self):
+        from mind.cognitive_core.action import Action, ActionType
+        executor, state, subsystems = self._make_executor()
+        snapshot = Mock(emotions={"valence": 0.2})
+
+        await executor.execute(Action(type=ActionType.SPEAK), snapshot)
+
+        subsystems.language_output.generate.assert_awaited_once()
+        assert subsystems.language_output.generate.call_args[0][0] is snapshot
+        state.workspace.broadcast.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_log_only_and_tool_call(self):
+        from mind.cognitive_core.action import Action, ActionType
+        executor, state, subsystems = self._make_executor()
+        subsystems.action.execute_action = AsyncMock(return_value="ok")
+
+        await executor.execute(Action(type=ActionType.WAIT))
+        await executor.execute(Action(type=ActionType.COMMIT_MEMORY, reason="keep"))
+        await executor.execute(Action(type=ActionType.TOOL_CALL))
+
+        subsystems.action.execute_action.assert_awaited_once()
+        subsystems.language_output.generate.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # CycleExecutor
@@ -410,6 +456,114 @@ class TestCycleExecutor:
         # Attention should still be called even with no percepts
         subsystems.attention.select_for_broadcast.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_memory_retrieval_overlaps_perception(self):
+        executor, state, subsystems = self._make_cycle_executor()
+        events = []
+
+        async def slow_perception(_perception):
+            events.append("perception-start")
+            await asyncio.sleep(0.01)
+            events.append("perception-end")
+            return ["percept"]
+
+        async def slow_retrieval():
+            events.append("memory-start")
+            await asyncio.sleep(0.01)
+            return ["memory-percept"]
+
+        subsystems.percept_similarity.filter_duplicates = Mock(side_effect=lambda p, **_: p)
+        state.gather_percepts = slow_perception
+        executor._retrieve_memories = slow_retrieval
+
+        await executor.execute_cycle()
+
+        # Retrieval starts before perception finishes
+        assert events.index("memory-start") < events.index("perception-end")
+        attended_input = subsystems.attention.select_for_broadcast.call_args[0][0]
+        assert attended_input == ["percept", "memory-percept"]
+
+    @pytest.mark.asyncio
+    async def test_memory_retrieval_failure_keeps_percepts(self):
+        executor, state, subsystems = self._make_cycle_executor()
+        subsystems.percept_similarity.filter_duplicates = Mock(side_effect=lambda p, **_: p)
+        state.gather_percepts = AsyncMock(return_value=["percept"])
+        executor._retrieve_memories = AsyncMock(side_effect=RuntimeError("backend down"))
+
+        timings = await executor.execute_cycle()
+
+        assert timings["memory_retrieval"] == 0.0
+        attended_input = subsystems.attention.select_for_broadcast.call_args[0][0]
+        assert attended_input == ["percept"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_between_workspace_mutations(self):
+        executor, state, subsystems = self._make_cycle_executor()
+        state.gather_percepts = AsyncMock(return_value=[])
+        broadcast = Mock(wraps=state.workspace.broadcast)
+        state.workspace.broadcast = broadcast
+
+        await executor.execute_cycle()
+
+        # One snapshot before actions, one after, one after the workspace update
+        assert broadcast.call_count == 3
+        assert executor._cycle_snapshot is None
+
+    def test_added_goal_invalidates_snapshot(self):
+        executor, state, subsystems = self._make_cycle_executor()
+        from mind.cognitive_core.workspace import Goal, GoalType
+
+        before = executor._snapshot()
+        assert executor._snapshot() is before
+
+        goal = Goal(type=GoalType.SPEAK_AUTONOMOUS, description="share", priority=0.9)
+        subsystems.autonomous.check_for_autonomous_triggers = Mock(return_value=goal)
+        asyncio.run(executor._check_autonomous_triggers())
+
+        assert [g.id for g in executor._snapshot().goals] == [goal.id]
+
+    @pytest.mark.asyncio
+    async def test_action_prediction_validated_once_per_cycle(self):
+        from mind.cognitive_core.action import Action, ActionType
+
+        executor, state, subsystems = self._make_cycle_executor()
+        meta = subsystems.meta_cognition
+        meta.predict_behavior = Mock(return_value={"likely_actions": ["wait"]})
+        meta.record_prediction = Mock(return_value="prediction-1")
+        meta.validate_prediction = Mock(return_value=Mock(correct=False, error_magnitude=1.0))
+        meta.refinement_threshold = 0.5
+        subsystems.action.decide = Mock(return_value=[
+            Action(type=ActionType.WAIT), Action(type=ActionType.WAIT),
+        ])
+        executor.action_executor.extract_outcome = Mock(return_value={"status": "success"})
+
+        await executor._execute_actions()
+
+        meta.validate_prediction.assert_called_once()
+        meta.refine_self_model_from_errors.assert_called_once()
+
+    def test_quiet_autonomous_check_cached_until_workspace_changes(self):
+        executor, state, subsystems = self._make_cycle_executor()
+        executor._autonomous_check_ttl = 60.0
+        check = subsystems.autonomous.check_for_autonomous_triggers
+
+        asyncio.run(executor._check_autonomous_triggers())
+        executor._invalidate_snapshot()
+        asyncio.run(executor._check_autonomous_triggers())
+        assert check.call_count == 1
+
+        state.workspace.update(emotion={"valence": 0.8, "arousal": 0.9})
+        executor._invalidate_snapshot()
+        asyncio.run(executor._check_autonomous_triggers())
+        assert check.call_count == 2
+
+    def test_autonomous_check_uncached_by_default(self):
+        executor, state, subsystems = self._make_cycle_executor()
+
+        asyncio.run(executor._check_autonomous_triggers())
+        asyncio.run(executor._check_autonomous_triggers())
+        assert subsystems.autonomous.check_for_autonomous_triggers.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # Config validation across modules
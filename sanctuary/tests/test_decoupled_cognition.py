@@ -168,7 +168,7 @@ class TestIdleCognition:
         })
         workspace = GlobalWorkspace()
         
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         
         # Should generate multiple activities
         assert len(activities) > 0
@@ -183,7 +183,7 @@ class TestIdleCognition:
         })
         workspace = GlobalWorkspace()
         
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         
         # Should have memory review
         memory_reviews = [a for a in activities 
@@ -205,12 +205,12 @@ class TestIdleCognition:
         workspace = GlobalWorkspace()
         
         # First call should trigger
-        activities1 = await idle.generate_idle_activity(workspace)
+        activities1 = idle.generate_idle_activity(workspace)
         memory_reviews1 = [a for a in activities1 
                           if a.raw.get("type") == "memory_review_trigger"]
         
         # Second immediate call should NOT trigger (interval not met)
-        activities2 = await idle.generate_idle_activity(workspace)
+        activities2 = idle.generate_idle_activity(workspace)
         memory_reviews2 = [a for a in activities2 
                           if a.raw.get("type") == "memory_review_trigger"]
         
@@ -230,7 +230,7 @@ class TestIdleCognition:
         
         # Generate activities multiple times
         for _ in range(3):
-            await idle.generate_idle_activity(workspace)
+            idle.generate_idle_activity(workspace)
         
         stats = idle.get_stats()
         
@@ -255,7 +255,7 @@ class TestIdleCognition:
         workspace.add_goal(goal1)
         workspace.add_goal(goal2)
         
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         
         goal_evals = [a for a in activities 
                      if a.raw.get("type") == "goal_evaluation_trigger"]
@@ -352,7 +352,7 @@ class TestIntegration:
         workspace = GlobalWorkspace()
         
         # Generate idle activities
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         
         # Add them to workspace
         for percept in activities:
@@ -430,7 +430,7 @@ class TestAcceptanceCriteria:
         # Generate activities over multiple cycles
         all_activities = []
         for _ in range(10):
-            activities = await idle.generate_idle_activity(workspace)
+            activities = idle.generate_idle_activity(workspace)
             all_activities.extend(activities)
         
         # Should produce some internal activity
@@ -215,7 +215,7 @@ class TestIdleCognition:
         })
         workspace = MockWorkspace()
         
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         
         # Should generate multiple activities
         assert len(activities) > 0
@@ -234,7 +234,7 @@ class TestIdleCognition:
         })
         workspace = MockWorkspace()
         
-        activities = await idle.generate_idle_activity(workspace)
+        activities = idle.generate_idle_activity(workspace)
         
         # Should have memory review
         memory_reviews = [a for a in activities 
@@ -260,12 +260,12 @@ class TestIdleCognition:
         workspace = MockWorkspace()
         
         # First call should trigger
-        activities1 = await idle.generate_idle_activity(workspace)
+        activities1 = idle.generate_idle_activity(workspace)
         memory_reviews1 = [a for a in activities1 
                           if a.raw.get("type") == "memory_review_trigger"]
         
         # Second immediate call should NOT trigger (interval not met)
-        activities2 = await idle.generate_idle_activity(workspace)
+        activities2 = idle.generate_idle_activity(workspace)
         memory_reviews2 = [a for a in activities2 
                           if a.raw.get("type") == "memory_review_trigger"]
         
@@ -289,7 +289,7 @@ class TestIdleCognition:
         
         # Generate activities multiple times
         for _ in range(3):
-            await idle.generate_idle_activity(workspace)
+            idle.generate_idle_activity(workspace)
         
         stats = idle.get_stats()
         
@@ -331,7 +331,7 @@ class TestAcceptanceCriteria:
         # Generate activities over multiple cycles
         all_activities = []
         for _ in range(10):
-            activities = await idle.generate_idle_activity(workspace)
+            activities = idle.generate_idle_activity(workspace)
             all_activities.extend(activities)
         
         # Should produce some internal activity
@@ -20,10 +20,15 @@ from datetime import datetime
 # Add parent directory to path for standalone testing
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import numpy as np
+
 from mind.cognitive_core.emotional_modulation import (
     EmotionalModulation,
     ProcessingParams,
-    ModulationMetrics
+    ModulationMetrics,
+    ACTION_CLASS_NEUTRAL,
+    ACTION_CLASS_APPROACH,
+    ACTION_CLASS_AVOIDANCE
 )
 
 
@@ -63,6 +68,15 @@ class TestProcessingParams:
         assert params_dict['valence_level'] == 0.3
         assert params_dict['dominance_level'] == 0.7
         assert 'timestamp' in params_dict
+    
+    def test_processing_params_timestamp(self):
+        """The nanosecond stamp is exposed as a datetime."""
+        before = datetime.now()
+        params = ProcessingParams()
+        
+        assert isinstance(params.timestamp_ns, int)
+        assert abs((params.timestamp - before).total_seconds()) < 5
+        assert params.to_dict()['timestamp'] == params.timestamp.isoformat()
 
 
 class TestModulationMetrics:
@@ -86,6 +100,19 @@ class TestModulationMetrics:
         metrics_dict = metrics.to_dict()
         assert metrics_dict['total_modulations'] == 10
         assert metrics_dict['arousal_effects']['high_arousal_fast'] == 5
+    
+    def test_metrics_equality(self):
+        """Test metrics compare by counters and correlation history."""
+        assert ModulationMetrics() == ModulationMetrics()
+        
+        params = ProcessingParams()
+        first, second = ModulationMetrics(), ModulationMetrics()
+        first.record_correlation(0.5, params, 0.1, 0.5)
+        assert first != second
+        second.record_correlation(0.5, params, 0.1, 0.5)
+        assert first == second
+        second.total_modulations = 1
+        assert first != second
 
 
 class TestEmotionalModulationInitialization:
@@ -326,6 +353,151 @@ class TestValenceModulation:
         assert len(modulation.metrics.valence_action_correlations) == 3
 
 
+class TestVectorizedValenceBias:
+    """Test the NumPy array path for valence bias."""
+    
+    def test_classify_action_type(self):
+        """Action types are classified by substring, approach first."""
+        assert EmotionalModulation.classify_action_type('SPEAK_AUTONOMOUS') == ACTION_CLASS_APPROACH
+        assert EmotionalModulation.classify_action_type('withdraw') == ACTION_CLASS_AVOIDANCE
+        assert EmotionalModulation.classify_action_type('noop') == ACTION_CLASS_NEUTRAL
+    
+    def test_array_bias_matches_list_bias(self):
+        """Array and list APIs should produce identical priorities."""
+        modulation = EmotionalModulation()
+        types = ['speak', 'wait', 'noop', 'create']
+        priorities = [0.5, 0.5, 0.9, 0.95]
+        
+        actions = [{'type': t, 'priority': p} for t, p in zip(types, priorities)]
+        modulation.bias_action_selection(actions, valence=0.7)
+        
+        codes = np.array([EmotionalModulation.classify_action_type(t) for t in types], dtype=np.int8)
+        biased = modulation.bias_action_selection_array(np.array(priorities), codes, valence=0.7)
+        
+        assert biased.tolist() == [a['priority'] for a in actions]
+        assert biased[2] == 0.9  # Neutral untouched
+        assert biased[3] == 1.0  # Clamped
+    
+    def test_mixed_dict_and_object_actions(self):
+        """Lists mixing dicts and objects are biased like homogeneous ones."""
+        class MockAction:
+            def __init__(self, type, priority):
+                self.type = type
+                self.priority = priority
+        
+        modulation = EmotionalModulation()
+        actions = [{'type': 'speak', 'priority': 0.5}, MockAction('withdraw', 0.5)]
+        
+        modulation.bias_action_selection(actions, valence=0.8)
+        
+        assert actions[0]['priority'] > 0.5
+        assert actions[1].priority < 0.5
+    
+    def test_array_bias_does_not_mutate_input(self):
+        """The array API returns a new array."""
+        modulation = EmotionalModulation()
+        priorities = np.array([0.5, 0.5])
+        codes = np.array([ACTION_CLASS_APPROACH, ACTION_CLASS_AVOIDANCE], dtype=np.int8)
+        
+        biased = modulation.bias_action_selection_array(priorities, codes, valence=-0.8)
+        
+        assert priorities.tolist() == [0.5, 0.5]
+        assert biased[0] < 0.5
+        assert biased[1] > 0.5
+
+
+class TestParamsCache:
+    """Test quantized caching of modulation parameters."""
+    
+    def test_cached_matches_uncached_on_grid(self):
+        """On the quantization grid, cached and exact params agree."""
+        cached = EmotionalModulation()
+        exact = EmotionalModulation(cache_precision=None)
+        
+        for arousal, dominance in [(0.0, 0.0), (0.35, 0.8), (0.9, 0.15), (1.0, 1.0)]:
+            p1 = cached.modulate_processing(arousal, 0.0, dominance)
+            p2 = exact.modulate_processing(arousal, 0.0, dominance)
+            assert p1.attention_iterations == p2.attention_iterations
+            assert p1.ignition_threshold == p2.ignition_threshold
+            assert p1.decision_threshold == p2.decision_threshold
+    
+    def test_cached_params_are_independent_objects(self):
+        """Cache hits must not share ProcessingParams instances."""
+        modulation = EmotionalModulation()
+        
+        p1 = modulation.modulate_processing(0.5, 0.2, 0.5)
+        p2 = modulation.modulate_processing(0.5, -0.2, 0.5)
+        
+        assert p1 is not p2
+        assert p1.valence_level == 0.2
+        assert p2.valence_level == -0.2
+
+
+class TestTupleModulation:
+    """Test the numeric-only modulate_processing_tuple entry point."""
+    
+    def test_tuple_matches_params(self):
+        """Tuple values equal the ProcessingParams fields, in order."""
+        modulation = EmotionalModulation()
+        params = modulation.modulate_processing(0.8, -0.4, 0.3)
+        values = modulation.modulate_processing_tuple(0.8, -0.4, 0.3)
+        
+        assert values == (
+            params.attention_iterations, params.ignition_threshold,
+            params.memory_retrieval_limit, params.processing_timeout,
+            params.decision_threshold, params.action_bias_strength,
+        )
+    
+    def test_tuple_skips_metrics(self):
+        """The tuple form does not count as a recorded modulation."""
+        modulation = EmotionalModulation()
+        modulation.modulate_processing_tuple(0.8, 0.0, 0.5)
+        assert modulation.metrics.total_modulations == 0
+    
+    def test_tuple_disabled_returns_baseline(self):
+        """Ablation mode returns the baseline values."""
+        modulation = EmotionalModulation(enabled=False)
+        assert modulation.modulate_processing_tuple(0.9, 0.5, 0.9)[0] == 7
+
+
+class TestBatchModulation:
+    """Test the vectorized modulate_processing_batch entry point."""
+    
+    def test_batch_matches_scalar(self):
+        """Each batch element equals the exact scalar result."""
+        modulation = EmotionalModulation(cache_precision=None)
+        arousal = np.linspace(-1.0, 1.0, 21)
+        valence = np.linspace(-1.0, 1.0, 21)
+        dominance = np.linspace(0.0, 1.0, 21)
+        
+        batch = modulation.modulate_processing_batch(arousal, valence, dominance)
+        
+        for i in range(len(arousal)):
+            params = modulation.modulate_processing(arousal[i], valence[i], dominance[i])
+            for name, values in batch.items():
+                assert values[i] == getattr(params, name)
+    
+    def test_batch_disabled_returns_baseline(self):
+        """Ablation mode fills every slot with baseline values."""
+        modulation = EmotionalModulation(enabled=False)
+        batch = modulation.modulate_processing_batch(np.array([0.9, 0.1]), 0.0, 0.5)
+        
+        assert batch['attention_iterations'].tolist() == [7, 7]
+        assert batch['decision_threshold'].tolist() == [0.7, 0.7]
+    
+    def test_batch_validates_ranges(self):
+        """Out-of-range values raise like the scalar API."""
+        modulation = EmotionalModulation()
+        with pytest.raises(ValueError):
+            modulation.modulate_processing_batch(np.array([0.5]), np.array([0.0]), np.array([1.5]))
+    
+    def test_batch_does_not_update_metrics(self):
+        """Hypothetical states are not counted as modulations."""
+        modulation = EmotionalModulation()
+        modulation.modulate_processing_batch(np.array([0.9, 0.1]), 0.0, 0.5)
+        assert modulation.metrics.total_modulations == 0
+
+
 class TestDominanceModulation:
     """Test dominance modulation of decision thresholds."""
     
@@ -485,6 +657,33 @@ class TestMetricsTracking:
         assert modulation.metrics.total_modulations == 0
         assert len(modulation.metrics.arousal_attention_correlations) == 0
     
+    def test_correlation_sampling(self):
+        """Sampling thins the correlation history but not the counters."""
+        modulation = EmotionalModulation(metrics_sample_every=5)
+        
+        for _ in range(20):
+            modulation.modulate_processing(0.9, 0.0, 0.5)
+        
+        assert modulation.metrics.total_modulations == 20
+        assert modulation.metrics.high_arousal_fast_processing == 20
+        assert len(modulation.metrics.arousal_attention_correlations) == 4
+    
+    def test_correlation_sampling_rejects_zero(self):
+        """The sampling interval must be positive."""
+        with pytest.raises(ValueError):
+            EmotionalModulation(metrics_sample_every=0)
+    
+    def test_correlation_history_keeps_most_recent_in_order(self):
+        """Once the ring buffer wraps, history is the newest rows, oldest first."""
+        modulation = EmotionalModulation()
+        
+        dominances = [i / 149 for i in range(150)]
+        for dominance in dominances:
+            modulation.modulate_processing(0.5, 0.0, dominance)
+        
+        recorded = modulation.metrics.dominance_threshold_correlations[:, 0]
+        assert recorded.tolist() == dominances[50:]
+    
     def test_correlation_list_bounded(self):
         """Test that correlation lists stay bounded (last 100)."""
         modulation = EmotionalModulation()
@@ -11,11 +11,10 @@ Tests verify that emotional modulation:
 import sys
 from pathlib import Path
 
-# Add paths for standalone testing
+# Add parent directory to path for standalone testing
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-sys.path.insert(0, str(Path(__file__).parent.parent / "mind" / "cognitive_core"))
 
-import emotional_modulation
+from mind.cognitive_core import emotional_modulation
 from datetime import datetime
 
 
@@ -1,18 +1,16 @@
 #!/usr/bin/env python3
 """
 Standalone test runner for emotional_modulation.py
-Tests the module directly without importing the full sanctuary package.
+Imports through the package so the module is shared with the rest of the tree.
 """
 
 import sys
 from pathlib import Path
 
-# Add the cognitive_core directory to the path
-cognitive_core_path = Path(__file__).parent.parent / "mind" / "cognitive_core"
-sys.path.insert(0, str(cognitive_core_path))
+# Put the sanctuary source root on the path so `mind` resolves when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-# Now import the module directly
-import emotional_modulation
+from mind.cognitive_core import emotional_modulation
 
 def test_basic_functionality():
     """Test basic emotional modulation functionality."""
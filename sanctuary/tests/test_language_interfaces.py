@@ -13,7 +13,8 @@ Tests cover:
 
 import pytest
 import asyncio
-from unittest.mock import AsyncMock
+import threading
+from unittest.mock import AsyncMock, patch
 
 from mind.cognitive_core.llm_client import (
     LLMClient,
@@ -91,6 +92,47 @@ class TestMockLLMClient:
         assert client.metrics["total_requests"] == 5
 
 
+class TestLocalModelClient:
+    """Test transformers-backed clients keep model work off the event loop."""
+    
+    @pytest.mark.asyncio
+    async def test_tokenize_generate_decode_run_on_worker_thread(self):
+        """Tokenization and decoding run on the same worker thread as generation."""
+        loop_thread = threading.get_ident()
+        threads = []
+        
+        class FakeInputs(dict):
+            def to(self, device):
+                threads.append(("to", threading.get_ident()))
+                return self
+        
+        class FakeTokenizer:
+            eos_token_id = 0
+            def __call__(self, prompt, return_tensors=None):
+                threads.append(("tokenize", threading.get_ident()))
+                return FakeInputs(input_ids=[1, 2])
+            def decode(self, tokens, skip_special_tokens=True):
+                threads.append(("decode", threading.get_ident()))
+                return "prompt generated text"
+        
+        class FakeModel:
+            def generate(self, **kwargs):
+                threads.append(("generate", threading.get_ident()))
+                return [[1, 2, 3, 4]]
+        
+        with patch.object(GemmaClient, "_load_model"):
+            client = GemmaClient()
+        client.model, client.tokenizer, client.device = FakeModel(), FakeTokenizer(), "cpu"
+        client._initialized = True
+        
+        response = await client.generate("prompt")
+        
+        assert response == "generated text"
+        assert [step for step, _ in threads] == ["tokenize", "to", "generate", "decode"]
+        assert all(ident != loop_thread for _, ident in threads)
+        assert client.metrics["total_tokens"] == 4
+
+
 class TestStructuredFormats:
     """Test Pydantic structured formats."""
     
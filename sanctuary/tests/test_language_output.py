@@ -86,6 +86,35 @@ class TestLanguageOutputGenerator:
         protocols = generator._load_protocols()
         assert isinstance(protocols, str)
     
+    def test_load_identity_reads_prompt_prefix(self, tmp_path):
+        """Only the part of the identity files that reaches the prompt is read."""
+        (tmp_path / "charter.md").write_text("Charter line.\n" * 100)
+        (tmp_path / "protocols.md").write_text("Protocol line.\n" * 100)
+        generator = LanguageOutputGenerator(MockLLM(), {"identity_dir": str(tmp_path)})
+        
+        assert generator._load_charter() == ("Charter line.\n" * 100)[:500]
+        assert generator._load_protocols() == ("Protocol line.\n" * 100)[:300]
+    
+    @pytest.mark.asyncio
+    async def test_identity_files_loaded_on_first_generate(self, tmp_path):
+        """Identity files are read on first generation, not at construction."""
+        (tmp_path / "charter.md").write_text("I am the test charter.")
+        (tmp_path / "protocols.md").write_text("Test protocol.")
+        generator = LanguageOutputGenerator(MockLLM(), {"identity_dir": str(tmp_path)})
+        
+        assert generator.charter_text != "I am the test charter."
+        
+        snapshot = Mock()
+        snapshot.emotions = {'valence': 0.0, 'arousal': 0.5, 'dominance': 0.5}
+        snapshot.goals = []
+        snapshot.percepts = {}
+        snapshot.metadata = {}
+        await generator.generate(snapshot, {"user_input": "Hello"})
+        
+        assert generator.charter_text == "I am the test charter."
+        assert generator.protocols_text == "Test protocol."
+        assert "I am the test charter." in generator._build_prompt(snapshot, {})
+    
     def test_emotion_style_guidance_positive(self):
         """Test emotion style guidance with positive emotions."""
         llm = MockLLM()
@@ -247,10 +276,18 @@ class TestLanguageOutputGenerator:
         llm = MockLLM()
         generator = LanguageOutputGenerator(llm)
         
+        goal = Goal(
+            type=GoalType.RESPOND_TO_USER,
+            description="Respond to user question",
+            priority=0.8
+        )
+        memory = Percept(modality="memory", raw={"content": "An earlier talk"}, complexity=2)
+        memory.metadata = {"attention_score": 0.5}
+        
         snapshot = Mock()
         snapshot.emotions = {'valence': 0.0, 'arousal': 0.5, 'dominance': 0.5}
-        snapshot.goals = []
-        snapshot.percepts = {}
+        snapshot.goals = [goal]
+        snapshot.percepts = {"m1": memory}
         snapshot.metadata = {}
         
         context = {"user_input": "Test input"}
@@ -263,9 +300,50 @@ class TestLanguageOutputGenerator:
         assert "# CURRENT EMOTIONAL STATE" in prompt
         assert "# ACTIVE GOALS" in prompt
         assert "# ATTENDED PERCEPTS" in prompt
+        assert "# RECALLED MEMORIES" in prompt
         assert "# USER INPUT" in prompt
         assert "# INSTRUCTION" in prompt
         assert "Test input" in prompt
+    
+    def test_build_prompt_omits_empty_sections(self):
+        """Test that goals, percepts and memories are left out when empty."""
+        generator = LanguageOutputGenerator(MockLLM())
+        
+        snapshot = Mock()
+        snapshot.emotions = {'valence': 0.0, 'arousal': 0.5, 'dominance': 0.5}
+        snapshot.goals = []
+        snapshot.percepts = {}
+        snapshot.metadata = {}
+        
+        prompt = generator._build_prompt(snapshot, {"user_input": "Test input"})
+        
+        assert "# CURRENT EMOTIONAL STATE" in prompt
+        assert "# ACTIVE GOALS" not in prompt
+        assert "# ATTENDED PERCEPTS" not in prompt
+        assert "# RECALLED MEMORIES" not in prompt
+        assert "Style guidance: Neutral, balanced tone\n\n# USER INPUT\nTest input" in prompt
+    
+    def test_prompt_reused_for_same_snapshot(self):
+        """Test that repeated generation on one snapshot builds the prompt once."""
+        generator = LanguageOutputGenerator(MockLLM())
+        
+        snapshot = Mock()
+        snapshot.emotions = {'valence': 0.0, 'arousal': 0.5, 'dominance': 0.5}
+        snapshot.goals = []
+        snapshot.percepts = {}
+        snapshot.metadata = {}
+        
+        with patch.object(generator, "_build_prompt", wraps=generator._build_prompt) as build:
+            first = generator._prompt_for(snapshot, {"user_input": "Hello"})
+            second = generator._prompt_for(snapshot, {"user_input": "Hello"})
+            assert first == second
+            assert build.call_count == 1
+            
+            # A different user input or snapshot rebuilds the prompt
+            assert "Goodbye" in generator._prompt_for(snapshot, {"user_input": "Goodbye"})
+            other = Mock(emotions=snapshot.emotions, goals=[], percepts={}, metadata={})
+            generator._prompt_for(other, {"user_input": "Goodbye"})
+            assert build.call_count == 3
 
 
 class TestCognitiveCoreIntegration:
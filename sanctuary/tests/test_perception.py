@@ -182,6 +182,21 @@ class TestCacheFunctionality:
         perception.clear_cache()
         
         assert len(perception.embedding_cache) == 0
+    
+    def test_encode_text_concurrent_threads(self):
+        """Test that encode_text() keeps cache and stats consistent across threads."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        perception = PerceptionSubsystem(config={"cache_size": 3})
+        texts = [f"text {i % 5}" for i in range(40)]
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            embeddings = list(pool.map(perception.encode_text, texts))
+        
+        assert all(len(e) == perception.embedding_dim for e in embeddings)
+        assert len(perception.embedding_cache) <= 3
+        stats = perception.get_stats()
+        assert stats["cache_hits"] + stats["cache_misses"] == len(texts)
 
 
 class TestSimilarity:
@@ -391,6 +391,18 @@ class TestGlobalWorkspace:
         assert len(workspace.attended_memories) == 1
         assert workspace.attended_memories[0].content == "Retrieved memory"
     
+    def test_update_with_direct_percepts_and_emotion(self):
+        """Test update() with the percepts/emotion keyword arguments."""
+        workspace = GlobalWorkspace()
+        first = Percept(modality="text", raw="one")
+        second = Percept(modality="introspection", raw="two")
+        
+        workspace.update(percepts=[first, "not-a-percept", second], emotion={"valence": 0.4})
+        
+        assert list(workspace.active_percepts) == [first.id, second.id]
+        assert workspace.emotional_state["valence"] == 0.4
+        assert workspace.cycle_count == 1
+    
     def test_update_increments_cycle_count(self):
         """Test that update() increments cycle_count."""
         workspace = GlobalWorkspace()